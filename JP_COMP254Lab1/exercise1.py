@@ -1,4 +1,4 @@
-from typing import TypeVar
+from typing import Iterable, TypeVar
 
 from comp254 import DoublyLinkedList
 
@@ -6,7 +6,10 @@ T = TypeVar("T")
 
 
 class ExtendableDoublyLinkedList(DoublyLinkedList[T]):
-    def extend(self, other: DoublyLinkedList[T]) -> None:
+    def extend(self, other: Iterable[T]) -> None:
+        if not isinstance(other, DoublyLinkedList):
+            return super().extend(other)
+
         # Example:
         #     H A B C T ---> H A B C D E F T
         #     H D E F T
@@ -35,6 +38,7 @@ class ExtendableDoublyLinkedList(DoublyLinkedList[T]):
         # their header and trailer so its structure remains valid.
         other.header.next = other.trailer
         other.trailer.prev = other.header
+        other.finger = None
 
         self.size += other.size
 
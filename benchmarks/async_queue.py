@@ -0,0 +1,65 @@
+"""Compare per-item get() against batched get_many() on the comp254 asyncio queues."""
+
+import argparse
+import asyncio
+import contextlib
+import time
+
+from comp254 import LinkedQueue
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n",
+        "--items",
+        default=200_000,
+        help="The number of items to pass through the queue (default: %(default)s)",
+        type=int,
+    )
+    parser.add_argument(
+        "-m",
+        "--maxsize",
+        default=1_000,
+        help="The queue's maximum size (default: %(default)s)",
+        type=int,
+    )
+
+    args = parser.parse_args()
+    n: int = args.items
+    maxsize: int = args.maxsize
+
+    print(f"Thousand items per second, n = {n:,}, maxsize = {maxsize:,}")
+    for label, batch in [("asyncio.Queue get()", 0), ("get()", 1)] + [
+        (f"get_many({b})", b) for b in (16, 256)
+    ]:
+        rate = asyncio.run(run(n, maxsize, batch))
+        print(f"  {label:20}  {rate / 1e3:8.1f}")
+
+
+async def run(n: int, maxsize: int, batch: int) -> float:
+    # A batch of 0 uses the stdlib queue as a baseline
+    queue = asyncio.Queue[int](maxsize) if batch == 0 else LinkedQueue[int](maxsize)
+
+    async def produce() -> None:
+        for i in range(n):
+            await queue.put(i)
+
+    async def consume() -> None:
+        remaining = n
+        if isinstance(queue, LinkedQueue) and batch > 1:
+            while remaining:
+                remaining -= len(await queue.get_many(batch))
+        else:
+            while remaining:
+                await queue.get()
+                remaining -= 1
+
+    start = time.perf_counter()
+    await asyncio.gather(produce(), consume())
+    return n / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(EOFError, KeyboardInterrupt):
+        main()
@@ -0,0 +1,100 @@
+"""Measure multi-thread throughput of ConcurrentDeque against a globally locked list.
+
+Run this under a free-threaded CPython build (e.g. python3.13t) to see the
+effect of separate head and tail locks without the GIL serializing threads.
+"""
+
+import argparse
+import contextlib
+import sys
+import sysconfig
+import threading
+import time
+from typing import Generic, TypeVar
+
+from comp254 import ConcurrentDeque, DoublyLinkedList
+
+T = TypeVar("T")
+
+
+class GlobalLockDeque(Generic[T]):
+    # The baseline: every call on a DoublyLinkedList goes through one lock
+    def __init__(self) -> None:
+        self.list = DoublyLinkedList[T]()
+        self.lock = threading.Lock()
+
+    def add_last(self, element: T) -> None:
+        with self.lock:
+            self.list.add_last(element)
+
+    def remove_first(self) -> T | None:
+        with self.lock:
+            return self.list.remove_first()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n",
+        "--operations",
+        default=200_000,
+        help="The number of elements each producer adds (default: %(default)s)",
+        type=int,
+    )
+    parser.add_argument(
+        "-t",
+        "--threads",
+        default=[1, 2, 4],
+        help="Producer/consumer pair counts to test (default: 1 2 4)",
+        nargs="+",
+        type=int,
+    )
+
+    args = parser.parse_args()
+    n: int = args.operations
+    pairs: list[int] = args.threads
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    print(f"Python {sys.version.split()[0]}, free-threaded={free_threaded}, GIL={gil}")
+    print(f"Million operations per second, {n:,} elements per producer")
+    print(f"  {'pairs':>5}  {'global lock':>11}  {'ConcurrentDeque':>15}")
+    for p in pairs:
+        baseline = run(GlobalLockDeque[int](), n, p)
+        concurrent = run(ConcurrentDeque[int](), n, p)
+        print(f"  {p:5}  {baseline / 1e6:11.3f}  {concurrent / 1e6:15.3f}")
+
+
+def run(
+    deque: GlobalLockDeque[int] | ConcurrentDeque[int], n: int, pairs: int
+) -> float:
+    # Producers fill from the tail while consumers drain from the head.
+    # Consumers spin on remove_first() so both deques do the same work.
+    def produce() -> None:
+        add_last = deque.add_last
+        for i in range(n):
+            add_last(i)
+
+    def consume() -> None:
+        remove_first = deque.remove_first
+        remaining = n
+        while remaining:
+            if remove_first() is not None:
+                remaining -= 1
+
+    threads = [threading.Thread(target=produce) for _ in range(pairs)]
+    threads += [threading.Thread(target=consume) for _ in range(pairs)]
+
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    return 2 * n * pairs / elapsed
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(EOFError, KeyboardInterrupt):
+        main()
@@ -0,0 +1,75 @@
+"""Compare iteration speed of the comp254 linked lists with and without validation."""
+
+import argparse
+import contextlib
+import timeit
+from typing import Any, Callable, Iterable
+
+from comp254 import DoublyLinkedList, SinglyLinkedList
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n",
+        "--size",
+        default=100_000,
+        help="The number of elements in each list (default: %(default)s)",
+        type=int,
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        default=5,
+        help="The number of timed traversals, best is reported (default: %(default)s)",
+        type=int,
+    )
+
+    args = parser.parse_args()
+    n: int = args.size
+    repeat: int = args.repeat
+
+    slist = SinglyLinkedList[int]()
+    dlist = DoublyLinkedList[int]()
+    for i in range(n):
+        slist.add_last(i)
+        dlist.add_last(i)
+
+    cases: dict[str, Callable[[], Iterable[Any]]] = {
+        "SinglyLinkedList.__iter__": lambda: iter(slist),
+        "DoublyLinkedList.__iter__": lambda: iter(dlist),
+        "DoublyLinkedList.__reversed__": lambda: reversed(dlist),
+    }
+
+    pad = max(map(len, cases))
+    print(f"Best of {repeat} traversals over n = {n:,} (ns per element)")
+    print(f"  {'':{pad}}  {'fast':>8}  {'validate':>8}")
+    for name, make_iter in cases.items():
+        fast = time_traversal(make_iter, repeat=repeat, validate=False)
+        slow = time_traversal(make_iter, repeat=repeat, validate=True)
+        print(f"  {name:{pad}}  {fast / n * 1e9:8.1f}  {slow / n * 1e9:8.1f}")
+
+
+def time_traversal(
+    make_iter: Callable[[], Iterable[Any]],
+    *,
+    repeat: int,
+    validate: bool,
+) -> float:
+    SinglyLinkedList.validate = validate
+    DoublyLinkedList.validate = validate
+    try:
+        return min(timeit.repeat(lambda: consume(make_iter()), number=1, repeat=repeat))
+    finally:
+        SinglyLinkedList.validate = False
+        DoublyLinkedList.validate = False
+
+
+def consume(it: Iterable[Any]) -> None:
+    for _ in it:
+        pass
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(EOFError, KeyboardInterrupt):
+        main()
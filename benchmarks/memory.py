@@ -0,0 +1,63 @@
+"""Measure the memory footprint of each comp254 linked list in bytes per element."""
+
+import argparse
+import contextlib
+import gc
+import tracemalloc
+from typing import Callable, Protocol
+
+from comp254 import CircularlyLinkedList, DoublyLinkedList, SinglyLinkedList
+
+
+class LinkedList(Protocol):
+    def add_last(self, element: int, /) -> object: ...
+
+
+FACTORIES: dict[str, Callable[[], LinkedList]] = {
+    "SinglyLinkedList": SinglyLinkedList[int],
+    "DoublyLinkedList": DoublyLinkedList[int],
+    "CircularlyLinkedList": CircularlyLinkedList[int],
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n",
+        "--size",
+        default=100_000,
+        help="The number of elements to add to each list (default: %(default)s)",
+        type=int,
+    )
+
+    args = parser.parse_args()
+    n: int = args.size
+
+    pad = max(map(len, FACTORIES))
+    print(f"Bytes per element over n = {n:,}")
+    for name, factory in FACTORIES.items():
+        print(f"  {name:{pad}}  {measure_bytes_per_element(factory, n):8.2f}")
+
+
+def measure_bytes_per_element(factory: Callable[[], LinkedList], n: int) -> float:
+    # Elements are preallocated so only the list's own overhead is measured
+    elements = list(range(n))
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        L = factory()
+        for element in elements:
+            L.add_last(element)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del L
+    return (after - before) / n
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(EOFError, KeyboardInterrupt):
+        main()
@@ -0,0 +1,111 @@
+"""Time a FIFO workload of add_last/remove_first calls on each doubly linked list.
+
+The arena list doesn't allocate a node per element, which only pays off
+when the number of live nodes changes. Steady churn frees a node for
+every one it allocates, so the garbage collector never runs for either
+list there. Filling the queue to its depth does trigger collections for
+DoublyLinkedList, and every later full collection has to traverse each
+of its nodes. The fill rows measure that, along with traced bytes per
+element.
+"""
+
+import argparse
+import contextlib
+import gc
+import time
+import timeit
+import tracemalloc
+from typing import Any, Callable
+
+from comp254 import ArenaDoublyLinkedList, DoublyLinkedList
+
+FACTORIES: dict[str, Callable[[], Any]] = {
+    "DoublyLinkedList": DoublyLinkedList[int],
+    "ArenaDoublyLinkedList": ArenaDoublyLinkedList[int],
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n",
+        "--operations",
+        default=1_000_000,
+        help="The number of add_last/remove_first pairs (default: %(default)s)",
+        type=int,
+    )
+    parser.add_argument(
+        "-d",
+        "--depth",
+        default=1_000,
+        help="The number of elements kept in the queue (default: %(default)s)",
+        type=int,
+    )
+
+    args = parser.parse_args()
+    n: int = args.operations
+    depth: int = args.depth
+
+    pad = max(map(len, FACTORIES))
+    print(f"Churning {n:,} operations at a depth of {depth:,} (ns per pair)")
+    for name, factory in FACTORIES.items():
+        elapsed = min(
+            timeit.repeat(lambda factory=factory: churn(factory, n, depth), number=1)
+        )
+        print(f"  {name:{pad}}  {elapsed / n * 1e9:8.1f}")
+
+    print(f"Filling to a depth of {depth:,}")
+    print(
+        f"  {'':{pad}}  {'ns/add':>8}  {'GC runs':>7}  {'full GC ms':>10}  {'bytes/elem':>10}"
+    )
+    for name, factory in FACTORIES.items():
+        seconds, collections, full_gc, nbytes = fill(factory, depth)
+        print(
+            f"  {name:{pad}}  {seconds / depth * 1e9:8.1f}  {collections:7}"
+            f"  {full_gc * 1e3:10.2f}  {nbytes / depth:10.1f}"
+        )
+
+
+def churn(factory: Callable[[], Any], n: int, depth: int) -> None:
+    queue = factory()
+    for i in range(depth):
+        queue.add_last(i)
+
+    add_last, remove_first = queue.add_last, queue.remove_first
+    for i in range(n):
+        add_last(i)
+        remove_first()
+
+
+def fill(factory: Callable[[], Any], depth: int) -> tuple[float, int, float, int]:
+    # Returns the time to fill, the collections of any generation that
+    # filling triggered, the time of one full collection while the queue
+    # is alive, and the bytes traced while filling
+    gc.collect()
+    before = sum(stats["collections"] for stats in gc.get_stats())
+    start = time.perf_counter()
+    queue = factory()
+    for i in range(depth):
+        queue.add_last(i)
+    seconds = time.perf_counter() - start
+    collections = sum(stats["collections"] for stats in gc.get_stats()) - before
+
+    start = time.perf_counter()
+    gc.collect()
+    full_gc = time.perf_counter() - start
+    del queue
+
+    tracemalloc.start()
+    try:
+        queue = factory()
+        for i in range(depth):
+            queue.add_last(i)
+        nbytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, collections, full_gc, nbytes
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(EOFError, KeyboardInterrupt):
+        main()
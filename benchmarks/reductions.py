@@ -0,0 +1,114 @@
+"""Compare Python-level reductions over a DoublyLinkedList with the comp254.numeric helpers.
+
+Each helper copies the list into an array before reducing, so walking the
+list dominates a single reduction. The "all, once" row gathers once with
+to_numpy() and then runs every reduction on that array, and "all, gathered"
+times the same reductions on an array that already exists.
+"""
+
+import argparse
+import contextlib
+import itertools
+import random
+import statistics
+import time
+from typing import Any, Callable
+
+from comp254 import (
+    DoublyLinkedList,
+    array_max,
+    array_mean,
+    array_min,
+    array_sum,
+    prefix_sums,
+)
+
+
+def python_reductions(dlist: DoublyLinkedList[int]) -> dict[str, Callable[[], Any]]:
+    return {
+        "sum": lambda: sum(dlist),
+        "min": lambda: min(dlist),
+        "max": lambda: max(dlist),
+        "mean": lambda: statistics.fmean(dlist),
+        "prefix sums": lambda: list(itertools.accumulate(dlist)),
+    }
+
+
+def numpy_reductions(dlist: DoublyLinkedList[int]) -> dict[str, Callable[[], Any]]:
+    return {
+        "sum": lambda: array_sum(dlist, "int64"),
+        "min": lambda: array_min(dlist, "int64"),
+        "max": lambda: array_max(dlist, "int64"),
+        "mean": lambda: array_mean(dlist, "int64"),
+        "prefix sums": lambda: prefix_sums(dlist, "int64"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n",
+        "--size",
+        default=1_000_000,
+        help="The number of elements in the list (default: %(default)s)",
+        type=int,
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        default=5,
+        help="Timings per reduction, keeping the fastest (default: %(default)s)",
+        type=int,
+    )
+
+    args = parser.parse_args()
+    n: int = args.size
+    repeat: int = args.repeat
+
+    rng = random.Random(254)
+    dlist = DoublyLinkedList.from_iterable(rng.randrange(10**6) for _ in range(n))
+
+    python = python_reductions(dlist)
+    numpy = numpy_reductions(dlist)
+    print(f"ms per reduction over a DoublyLinkedList of {n:,} ints")
+    print(f"  {'reduction':<12}  {'Python':>8}  {'NumPy':>8}  {'speedup':>7}")
+    for name in python:
+        slow = best_of(python[name], repeat)
+        fast = best_of(numpy[name], repeat)
+        print(f"  {name:<12}  {slow * 1e3:8.2f}  {fast * 1e3:8.2f}  {slow / fast:7.2f}")
+
+    def all_python() -> None:
+        for reduce in python.values():
+            reduce()
+
+    def all_numpy() -> None:
+        reduce_array(dlist.to_numpy("int64"))
+
+    array = dlist.to_numpy("int64")
+
+    def all_gathered() -> None:
+        reduce_array(array)
+
+    slow = best_of(all_python, repeat)
+    for name, func in (("all, once", all_numpy), ("all, gathered", all_gathered)):
+        fast = best_of(func, repeat)
+        print(f"  {name:<13} {slow * 1e3:8.2f}  {fast * 1e3:8.2f}  {slow / fast:7.2f}")
+
+
+def reduce_array(array: Any) -> None:
+    for reduce in (array.sum, array.min, array.max, array.mean, array.cumsum):
+        reduce()
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(EOFError, KeyboardInterrupt):
+        main()
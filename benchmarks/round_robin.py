@@ -0,0 +1,91 @@
+"""Simulate weighted round-robin dispatch over many tenants with and without batching."""
+
+import argparse
+import contextlib
+import random
+import time
+
+from comp254 import CircularlyLinkedList, WeightedRoundRobin
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-t",
+        "--tenants",
+        default=100_000,
+        help="The number of tenants to schedule (default: %(default)s)",
+        type=int,
+    )
+    parser.add_argument(
+        "-n",
+        "--turns",
+        default=1_000_000,
+        help="The number of turns to hand out (default: %(default)s)",
+        type=int,
+    )
+    parser.add_argument(
+        "-b",
+        "--batch",
+        default=1_024,
+        help="The number of turns requested per next_batch() (default: %(default)s)",
+        type=int,
+    )
+
+    args = parser.parse_args()
+    tenants: int = args.tenants
+    turns: int = args.turns
+    batch: int = args.batch
+
+    rng = random.Random(254)
+    weights = [rng.randint(1, 8) for _ in range(tenants)]
+
+    print(f"{tenants:,} tenants, {turns:,} turns")
+    elapsed = naive_dispatch(weights, turns)
+    print(f"  {'one turn per rotate()':24}  {elapsed:.3f}s")
+    elapsed = batched_dispatch(weights, turns, batch)
+    print(f"  {f'next_batch({batch:,})':24}  {elapsed:.3f}s")
+
+    ring = CircularlyLinkedList.from_iterable(range(tenants))
+    k = tenants // 2 + 1
+    start = time.perf_counter()
+    for _ in range(k):
+        ring.rotate()
+    loop = time.perf_counter() - start
+    start = time.perf_counter()
+    ring.rotate(k)
+    single = time.perf_counter() - start
+    print(f"  rotate() x {k:,}: {loop:.4f}s, rotate({k:,}): {single:.4f}s")
+
+
+def naive_dispatch(weights: list[int], turns: int) -> float:
+    # The dispatcher loop this replaces: one call per turn and per rotation
+    ring = CircularlyLinkedList.from_iterable(range(len(weights)))
+    start = time.perf_counter()
+    credit = 0
+    for _ in range(turns):
+        tenant: int = ring.first()  # type: ignore
+        if credit == 0:
+            credit = weights[tenant]
+        credit -= 1
+        if credit == 0:
+            ring.rotate()
+    return time.perf_counter() - start
+
+
+def batched_dispatch(weights: list[int], turns: int, batch: int) -> float:
+    scheduler = WeightedRoundRobin[int]()
+    for tenant, weight in enumerate(weights):
+        scheduler.add(tenant, weight)
+
+    start = time.perf_counter()
+    remaining = turns
+    while remaining > 0:
+        grants = scheduler.next_batch(min(batch, remaining))
+        remaining -= sum(n for _, n in grants)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(EOFError, KeyboardInterrupt):
+        main()
@@ -0,0 +1,109 @@
+"""Compare adds into each kind of scoreboard, and their memory per entry, on full boards of growing capacity."""
+
+import argparse
+import contextlib
+import random
+import time
+import tracemalloc
+from typing import Callable, Protocol
+
+from comp254 import ColumnarScoreboard, GameEntry, HeapScoreboard, Scoreboard
+
+# ColumnarScoreboard.add shifts about half the board per entry, so it's
+# given fewer adds at large capacities to keep each run to about this many
+# shifts
+SHIFT_BUDGET = 50_000_000
+
+
+class Board(Protocol):
+    def add(self, new: GameEntry, /) -> None: ...
+
+
+FACTORIES: dict[str, Callable[[int], Board]] = {
+    "Scoreboard": Scoreboard,
+    "HeapScoreboard": HeapScoreboard,
+    "ColumnarScoreboard": ColumnarScoreboard,
+}
+
+# The capacity that each board's bytes per entry is measured at
+MEMORY_CAPACITY = 100_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-m",
+        "--max-capacity",
+        default=10_000_000,
+        help="The largest capacity to sweep to, by powers of 10 (default: %(default)s)",
+        type=int,
+    )
+    parser.add_argument(
+        "-n",
+        "--adds",
+        default=100_000,
+        help="The number of timed adds per board (default: %(default)s)",
+        type=int,
+    )
+
+    args = parser.parse_args()
+    max_capacity: int = args.max_capacity
+    adds: int = args.adds
+
+    rng = random.Random(254)
+    pad = max(map(len, FACTORIES))
+    print(f"ns per add into a full board, {adds:,} random scores")
+    print(f"  {'capacity':>10}" + "".join(f"  {name:>{pad}}" for name in FACTORIES))
+
+    capacity = 10
+    while capacity <= max_capacity:
+        row = []
+        for factory in FACTORIES.values():
+            n = adds
+            if factory is ColumnarScoreboard:
+                n = min(adds, max(100, 2 * SHIFT_BUDGET // capacity))
+            row.append(bench_add(factory, capacity, n, rng))
+        print(f"  {capacity:>10,}" + "".join(f"  {t * 1e9:>{pad}.1f}" for t in row))
+        capacity *= 10
+
+    print(f"Bytes per entry of a full board, capacity {MEMORY_CAPACITY:,}")
+    for name, factory in FACTORIES.items():
+        nbytes = measure_bytes_per_entry(factory, MEMORY_CAPACITY)
+        print(f"  {name:{pad}}  {nbytes:8.2f}")
+
+
+def bench_add(
+    factory: Callable[[int], Board], capacity: int, n: int, rng: random.Random
+) -> float:
+    # Fill in descending order so that no board shifts while filling,
+    # then time adds that nearly always evict the lowest entry
+    board = factory(capacity)
+    for score in range(2 * capacity, capacity, -1):
+        board.add(GameEntry("P", score))
+
+    entries = [GameEntry("P", rng.randrange(capacity, 3 * capacity)) for _ in range(n)]
+    start = time.perf_counter()
+    for entry in entries:
+        board.add(entry)
+    return (time.perf_counter() - start) / n
+
+
+def measure_bytes_per_entry(factory: Callable[[int], Board], capacity: int) -> float:
+    # Every entry shares one name, so only the board's own layout is measured
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        board = factory(capacity)
+        for score in range(2 * capacity, capacity, -1):
+            board.add(GameEntry("P", score))
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del board
+    return (after - before) / capacity
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(EOFError, KeyboardInterrupt):
+        main()
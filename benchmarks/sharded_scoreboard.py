@@ -0,0 +1,107 @@
+"""Measure ShardedScoreboard ingestion throughput as the number of worker processes grows.
+
+Each run feeds the same random entries through add_many() and then merges,
+so the time includes sending every batch and the final k-way merge. Worker
+startup is excluded. Speedups are relative to the first worker count, and
+a single Scoreboard.add_many() is shown for reference.
+
+The parent process batches and serializes every entry before any worker
+sees it, and that serial work caps the speedup however many workers there
+are. Speedups also need at least as many free cores as workers.
+
+With --merge-interval, a second table repeats the runs with merges on a
+timer. Those let the parent drop entries that can no longer make the
+board before sending them, so they mostly measure that filtering rather
+than the workers.
+"""
+
+import argparse
+import contextlib
+import os
+import random
+import time
+
+from comp254 import GameEntry, Scoreboard, ShardedScoreboard
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n",
+        "--entries",
+        default=2_000_000,
+        help="The number of entries to add (default: %(default)s)",
+        type=int,
+    )
+    parser.add_argument(
+        "-c",
+        "--capacity",
+        default=1000,
+        help="The capacity of the scoreboard (default: %(default)s)",
+        type=int,
+    )
+    parser.add_argument(
+        "-i",
+        "--merge-interval",
+        default=0.0,
+        help="Also test merges every this many seconds, or 0 to skip (default: %(default)s)",
+        type=float,
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        default=[1, 2, 4, 8],
+        help="Worker counts to test (default: 1 2 4 8)",
+        nargs="+",
+        type=int,
+    )
+
+    args = parser.parse_args()
+    n: int = args.entries
+    capacity: int = args.capacity
+    worker_counts: list[int] = args.workers
+    interval: float = args.merge_interval
+
+    rng = random.Random(254)
+    entries = [GameEntry(f"P{i}", rng.randrange(10**9)) for i in range(n)]
+
+    print(f"{os.cpu_count()} CPUs, {n:,} entries, capacity {capacity:,}")
+    start = time.perf_counter()
+    Scoreboard.from_stream(capacity, entries)
+    in_process = n / (time.perf_counter() - start)
+    print(f"  {'in-process':>10}  {in_process / 1e6:11.3f} M entries/s")
+
+    print("Every entry sent to the workers")
+    sweep(entries, capacity, worker_counts, None)
+    if interval > 0:
+        print(f"Merging every {interval}s, so the parent can drop low entries")
+        sweep(entries, capacity, worker_counts, interval)
+
+
+def sweep(
+    entries: list[GameEntry],
+    capacity: int,
+    worker_counts: list[int],
+    interval: float | None,
+) -> None:
+    print(f"  {'workers':>10}  {'M entries/s':>11}  {'speedup':>7}")
+    baseline = None
+    for workers in worker_counts:
+        throughput = run(entries, capacity, workers, interval)
+        baseline = baseline or throughput
+        print(f"  {workers:10}  {throughput / 1e6:11.3f}  {throughput / baseline:7.2f}")
+
+
+def run(
+    entries: list[GameEntry], capacity: int, workers: int, interval: float | None
+) -> float:
+    with ShardedScoreboard(capacity, workers, merge_interval=interval) as scoreboard:
+        start = time.perf_counter()
+        scoreboard.add_many(entries)
+        scoreboard.merge()
+        return len(entries) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(EOFError, KeyboardInterrupt):
+        main()
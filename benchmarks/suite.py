@@ -0,0 +1,373 @@
+"""Benchmark every comp254 structure against list and deque, writing JSON or CSV.
+
+Each structure is measured on append, pop from either end, iteration,
+construction in one call and memory footprint, over geometric sizes.
+Rows are written in a fixed order, so two runs can be compared with
+--compare, or with any diff tool.
+"""
+
+import argparse
+import contextlib
+import csv
+import gc
+import io
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+from comp254 import (
+    CircularlyLinkedList,
+    DoublyLinkedList,
+    GameEntry,
+    Scoreboard,
+    SinglyLinkedList,
+)
+
+# Operations that take O(n) time per element are skipped above this size,
+# since their O(n**2) total would dominate the run
+QUADRATIC_LIMIT = 10_000
+
+# Small sizes are run on enough containers per timing to cover at least this
+# many elements, so that timer resolution doesn't dominate the result
+MIN_ELEMENTS_PER_TIMING = 100_000
+
+FIELDS = ["structure", "operation", "size", "value", "unit"]
+
+
+class Result(NamedTuple):
+    structure: str
+    operation: str
+    size: int
+    value: float
+    unit: str
+
+
+class Structure:
+    # factory(n) returns an empty container that can hold n elements.
+    # Each operation takes (container, elements) and is None if unsupported.
+    def __init__(
+        self,
+        factory: Callable[[int], Any],
+        *,
+        elements: Callable[[int], list[Any]] = lambda n: list(range(n)),
+        construct: Callable[[list[Any]], Any] | None = None,
+        append: Callable[[Any, list[Any]], None],
+        pop_first: Callable[[Any, list[Any]], None] | None = None,
+        pop_last: Callable[[Any, list[Any]], None] | None = None,
+        fill: Callable[[Any, list[Any]], None] | None = None,
+        iterate: bool = True,
+        quadratic: frozenset[str] = frozenset(),
+    ) -> None:
+        self.factory = factory
+        self.elements = elements
+        self.construct = construct
+        self.append = append
+        self.pop_first = pop_first
+        self.pop_last = pop_last
+        self.fill = append if fill is None else fill
+        self.iterate = iterate
+        self.quadratic = quadratic
+
+    def filled(self, elements: list[Any]) -> Any:
+        # Untimed setup for the other operations and the memory footprint
+        container = self.factory(len(elements))
+        self.fill(container, elements)
+        return container
+
+
+def add_each(method: str) -> Callable[[Any, list[Any]], None]:
+    def run(container: Any, elements: list[Any]) -> None:
+        add = getattr(container, method)
+        for element in elements:
+            add(element)
+
+    return run
+
+
+def call_each(method: str, *args: Any) -> Callable[[Any, list[Any]], None]:
+    def run(container: Any, elements: list[Any]) -> None:
+        remove = getattr(container, method)
+        for _ in elements:
+            remove(*args)
+
+    return run
+
+
+def scoreboard_entries(n: int) -> list[GameEntry]:
+    # Shuffled scores, so each add lands at a random rank
+    scores = list(range(n))
+    random.Random(254).shuffle(scores)
+    return [GameEntry(f"P{i}", score) for i, score in enumerate(scores)]
+
+
+def scoreboard_fill(board: Scoreboard, elements: list[GameEntry]) -> None:
+    # Adding in descending order puts every entry at the lowest rank
+    for entry in sorted(elements, key=lambda e: e.score, reverse=True):
+        board.add(entry)
+
+
+def scoreboard_pop_last(board: Scoreboard, elements: list[Any]) -> None:
+    for _ in elements:
+        board.remove(board.num_entries - 1)
+
+
+STRUCTURES: dict[str, Structure] = {
+    "list": Structure(
+        lambda n: [],
+        construct=list,
+        append=add_each("append"),
+        pop_first=call_each("pop", 0),
+        pop_last=call_each("pop"),
+        quadratic=frozenset({"pop_first"}),
+    ),
+    "deque": Structure(
+        lambda n: deque(),
+        construct=deque,
+        append=add_each("append"),
+        pop_first=call_each("popleft"),
+        pop_last=call_each("pop"),
+    ),
+    "SinglyLinkedList": Structure(
+        lambda n: SinglyLinkedList[int](),
+        construct=SinglyLinkedList[int].from_iterable,
+        append=add_each("add_last"),
+        pop_first=call_each("remove_first"),
+    ),
+    "DoublyLinkedList": Structure(
+        lambda n: DoublyLinkedList[int](),
+        construct=DoublyLinkedList[int].from_iterable,
+        append=add_each("add_last"),
+        pop_first=call_each("remove_first"),
+        pop_last=call_each("remove_last"),
+    ),
+    "CircularlyLinkedList": Structure(
+        lambda n: CircularlyLinkedList[int](),
+        construct=CircularlyLinkedList[int].from_iterable,
+        append=add_each("add_last"),
+        pop_first=call_each("remove_first"),
+    ),
+    "Scoreboard": Structure(
+        Scoreboard,
+        elements=scoreboard_entries,
+        append=add_each("add"),
+        pop_first=call_each("remove", 0),
+        pop_last=scoreboard_pop_last,
+        fill=scoreboard_fill,
+    ),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        default=[100, 1_000, 10_000, 100_000],
+        help="The container sizes to measure (default: 100 1000 10000 100000)",
+        nargs="+",
+        type=int,
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        default=5,
+        help="The number of timed runs, best is reported (default: %(default)s)",
+        type=int,
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Write results to this .json or .csv file instead of stdout as CSV",
+        type=Path,
+    )
+    parser.add_argument(
+        "--compare",
+        help="Instead of benchmarking, compare two results files",
+        metavar=("OLD", "NEW"),
+        nargs=2,
+        type=Path,
+    )
+
+    args = parser.parse_args()
+    if args.compare is not None:
+        return compare(read_results(args.compare[0]), read_results(args.compare[1]))
+
+    results = run_suite(sorted(set(args.sizes)), repeat=args.repeat)
+    if args.output is None:
+        sys.stdout.write(format_csv(results))
+    elif args.output.suffix == ".json":
+        args.output.write_text(format_json(results, repeat=args.repeat))
+    elif args.output.suffix == ".csv":
+        args.output.write_text(format_csv(results))
+    else:
+        parser.error(f"Unknown output format: {args.output.suffix!r}")
+
+
+def run_suite(sizes: list[int], *, repeat: int) -> list[Result]:
+    results: list[Result] = []
+    for name, structure in STRUCTURES.items():
+        for n in sizes:
+            elements = structure.elements(n)
+            for operation, seconds in bench_structure(structure, elements, repeat):
+                ns = seconds / n * 1e9
+                results.append(Result(name, operation, n, round(ns, 2), "ns/element"))
+
+            per_element = measure_bytes(structure, elements) / n
+            results.append(
+                Result(name, "memory", n, round(per_element, 2), "bytes/element")
+            )
+            print(f"{name} n={n:,} done", file=sys.stderr)
+
+    return results
+
+
+def bench_structure(
+    structure: Structure, elements: list[Any], repeat: int
+) -> list[tuple[str, float]]:
+    n = len(elements)
+
+    def allowed(operation: str) -> bool:
+        return operation not in structure.quadratic or n <= QUADRATIC_LIMIT
+
+    timings: list[tuple[str, float]] = []
+    if allowed("append"):
+        empty = partial(structure.factory, n)
+        timings.append(("append", best_of(repeat, empty, structure.append, elements)))
+
+    if structure.construct is not None:
+        construct = structure.construct
+        seconds = best_of(repeat, lambda: None, lambda _, e: construct(e), elements)
+        timings.append(("construct", seconds))
+
+    if structure.iterate:
+        container = structure.filled(elements)
+        timings.append(
+            ("iterate", best_of(repeat, lambda: container, consume, elements))
+        )
+
+    for operation, pop in [
+        ("pop_first", structure.pop_first),
+        ("pop_last", structure.pop_last),
+    ]:
+        if pop is not None and allowed(operation):
+            filled = partial(structure.filled, elements)
+            timings.append((operation, best_of(repeat, filled, pop, elements)))
+
+    return timings
+
+
+def best_of(
+    repeat: int,
+    setup: Callable[[], Any],
+    run: Callable[[Any, list[Any]], Any],
+    elements: list[Any],
+) -> float:
+    # Returns the best time for one run. Like timeit,
+    # the garbage collector is paused while timing.
+    loops = max(1, MIN_ELEMENTS_PER_TIMING // max(len(elements), 1))
+    times = []
+    for _ in range(repeat):
+        containers = [setup() for _ in range(loops)]
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for container in containers:
+                run(container, elements)
+            times.append((time.perf_counter() - start) / loops)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    return min(times)
+
+
+def consume(container: Any, elements: list[Any]) -> None:
+    for _ in container:
+        pass
+
+
+def measure_bytes(structure: Structure, elements: list[Any]) -> float:
+    # Elements are preallocated so only the container's own overhead is measured
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        container = structure.filled(elements)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del container
+    return after - before
+
+
+def format_csv(results: list[Result]) -> str:
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(FIELDS)
+    writer.writerows(results)
+    return out.getvalue()
+
+
+def format_json(results: list[Result], *, repeat: int) -> str:
+    document = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "results": [r._asdict() for r in results],
+    }
+    return json.dumps(document, indent=2) + "\n"
+
+
+def read_results(path: Path) -> list[Result]:
+    text = path.read_text()
+    if path.suffix == ".json":
+        rows = json.loads(text)["results"]
+    else:
+        rows = list(csv.DictReader(io.StringIO(text)))
+
+    return [
+        Result(
+            row["structure"],
+            row["operation"],
+            int(row["size"]),
+            float(row["value"]),
+            row["unit"],
+        )
+        for row in rows
+    ]
+
+
+def compare(old: list[Result], new: list[Result]) -> None:
+    # Print each measurement found in both runs with its relative change,
+    # where a negative change means faster or smaller
+    baseline = {(r.structure, r.operation, r.size): r.value for r in old}
+    pad = max((len(r.structure) + len(r.operation) + 1 for r in new), default=0)
+    print(f"  {'':{pad}}  {'size':>8}  {'old':>10}  {'new':>10}  {'change':>8}")
+    for r in new:
+        before = baseline.get((r.structure, r.operation, r.size))
+        if before is None:
+            continue
+
+        change = "n/a" if before == 0 else f"{(r.value - before) / before:+.1%}"
+        label = f"{r.structure}.{r.operation}"
+        print(
+            f"  {label:{pad}}  {r.size:>8}  {before:>10.2f}  {r.value:>10.2f}"
+            f"  {change:>8}"
+        )
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(EOFError, KeyboardInterrupt):
+        main()
@@ -0,0 +1,144 @@
+"""Compare UnrolledLinkedList against the other comp254 lists and collections.deque."""
+
+import argparse
+import contextlib
+import timeit
+from collections import deque
+from typing import Any, Callable
+
+from comp254 import DoublyLinkedList, SinglyLinkedList, UnrolledLinkedList
+
+
+# Each structure maps an operation name to a function taking (container, n),
+# or None if the structure doesn't support that operation
+class Operations:
+    def __init__(self, factory: Callable[[], Any], **ops: str | None) -> None:
+        self.factory = factory
+        self.ops = ops
+
+
+STRUCTURES: dict[str, Operations] = {
+    "SinglyLinkedList": Operations(
+        SinglyLinkedList[int],
+        append="add_last",
+        popleft="remove_first",
+        insert=None,
+    ),
+    "DoublyLinkedList": Operations(
+        DoublyLinkedList[int],
+        append="add_last",
+        popleft="remove_first",
+        insert="insert",
+    ),
+    "UnrolledLinkedList": Operations(
+        UnrolledLinkedList[int],
+        append="add_last",
+        popleft="remove_first",
+        insert="insert",
+    ),
+    "deque": Operations(
+        deque[int],
+        append="append",
+        popleft="popleft",
+        insert="insert",
+    ),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n",
+        "--size",
+        default=100_000,
+        help="The number of elements in each container (default: %(default)s)",
+        type=int,
+    )
+    parser.add_argument(
+        "-m",
+        "--inserts",
+        default=1_000,
+        help="The number of insertions in the middle (default: %(default)s)",
+        type=int,
+    )
+
+    args = parser.parse_args()
+    n: int = args.size
+    m: int = args.inserts
+
+    benchmarks: dict[str, Callable[[Operations], float | None]] = {
+        "iterate": lambda s: bench_iterate(s, n),
+        "append": lambda s: bench_append(s, n),
+        "popleft": lambda s: bench_popleft(s, n),
+        "insert": lambda s: bench_insert(s, n, m),
+    }
+
+    pad = max(map(len, STRUCTURES))
+    print(f"ns per operation, n = {n:,}, middle insertions = {m:,}")
+    print(f"  {'':{pad}}" + "".join(f"  {name:>8}" for name in benchmarks))
+    for name, structure in STRUCTURES.items():
+        row = [bench(structure) for bench in benchmarks.values()]
+        print(
+            f"  {name:{pad}}"
+            + "".join("       n/a" if t is None else f"  {t * 1e9:8.1f}" for t in row)
+        )
+
+
+def filled(structure: Operations, n: int) -> Any:
+    container = structure.factory()
+    append = getattr(container, structure.ops["append"] or "")
+    for i in range(n):
+        append(i)
+    return container
+
+
+def bench_iterate(structure: Operations, n: int) -> float:
+    container = filled(structure, n)
+
+    def run() -> None:
+        for _ in container:
+            pass
+
+    return min(timeit.repeat(run, number=1, repeat=5)) / n
+
+
+def bench_append(structure: Operations, n: int) -> float:
+    return min(timeit.repeat(lambda: filled(structure, n), number=1, repeat=5)) / n
+
+
+def bench_popleft(structure: Operations, n: int) -> float:
+    def run(container: Any) -> None:
+        popleft = getattr(container, structure.ops["popleft"] or "")
+        for _ in range(n):
+            popleft()
+
+    times = []
+    for _ in range(5):
+        container = filled(structure, n)
+        times.append(
+            timeit.timeit(lambda container=container: run(container), number=1)
+        )
+    return min(times) / n
+
+
+def bench_insert(structure: Operations, n: int, m: int) -> float | None:
+    if structure.ops["insert"] is None:
+        return None
+
+    def run(container: Any) -> None:
+        insert = getattr(container, structure.ops["insert"] or "")
+        for i in range(m):
+            insert((n + i) // 2, i)
+
+    times = []
+    for _ in range(3):
+        container = filled(structure, n)
+        times.append(
+            timeit.timeit(lambda container=container: run(container), number=1)
+        )
+    return min(times) / m
+
+
+if __name__ == "__main__":
+    with contextlib.suppress(EOFError, KeyboardInterrupt):
+        main()
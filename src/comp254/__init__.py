@@ -1,12 +1,41 @@
 from .lesson2 import (
+    ArenaDoublyLinkedList as ArenaDoublyLinkedList,
+    array_max as array_max,
+    array_mean as array_mean,
+    array_min as array_min,
+    array_sum as array_sum,
+    Cache as Cache,
+    CacheStats as CacheStats,
+    ColumnarScoreboard as ColumnarScoreboard,
+    ConcurrentDeque as ConcurrentDeque,
     DoublyLinkedList as DoublyLinkedList,
     DoubleNode as DoubleNode,
+    dump_elements as dump_elements,
     GameEntry as GameEntry,
+    HeapScoreboard as HeapScoreboard,
+    LinkedHashMap as LinkedHashMap,
+    LinkedHashSet as LinkedHashSet,
+    LFUCache as LFUCache,
+    load_elements as load_elements,
+    LRUCache as LRUCache,
+    memoize as memoize,
+    prefix_sums as prefix_sums,
     Scoreboard as Scoreboard,
+    ShardedScoreboard as ShardedScoreboard,
+    SinglyLinkedCursor as SinglyLinkedCursor,
     SinglyLinkedList as SinglyLinkedList,
     SingleNode as SingleNode,
+    SkipNode as SkipNode,
+    SortedSkipList as SortedSkipList,
+    to_numpy as to_numpy,
+    UnrolledLinkedList as UnrolledLinkedList,
+    UnrolledNode as UnrolledNode,
 )
 from .lesson3 import (
     CircularlyLinkedList as CircularlyLinkedList,
     CircularNode as CircularNode,
+    LinkedLifoQueue as LinkedLifoQueue,
+    LinkedQueue as LinkedQueue,
+    RoundRobinQueue as RoundRobinQueue,
+    WeightedRoundRobin as WeightedRoundRobin,
 )
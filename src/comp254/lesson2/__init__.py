@@ -1,10 +1,55 @@
+from .arenalists import (
+    ArenaDoublyLinkedList as ArenaDoublyLinkedList,
+)
 from .arrays import (
     GameEntry as GameEntry,
     Scoreboard as Scoreboard,
 )
+from .caches import (
+    Cache as Cache,
+    CacheStats as CacheStats,
+    LFUCache as LFUCache,
+    LRUCache as LRUCache,
+    memoize as memoize,
+)
+from .deques import (
+    ConcurrentDeque as ConcurrentDeque,
+)
 from .linkedlists import (
     DoublyLinkedList as DoublyLinkedList,
     DoubleNode as DoubleNode,
+    SinglyLinkedCursor as SinglyLinkedCursor,
     SinglyLinkedList as SinglyLinkedList,
     SingleNode as SingleNode,
 )
+from .linkedmaps import (
+    LinkedHashMap as LinkedHashMap,
+    LinkedHashSet as LinkedHashSet,
+)
+from .numeric import (
+    array_max as array_max,
+    array_mean as array_mean,
+    array_min as array_min,
+    array_sum as array_sum,
+    prefix_sums as prefix_sums,
+    to_numpy as to_numpy,
+)
+from .scoreboards import (
+    ColumnarScoreboard as ColumnarScoreboard,
+    HeapScoreboard as HeapScoreboard,
+)
+from .serialization import (
+    dump_elements as dump_elements,
+    load_elements as load_elements,
+)
+from .sharding import (
+    ShardedScoreboard as ShardedScoreboard,
+)
+from .skiplists import (
+    SkipNode as SkipNode,
+    SortedSkipList as SortedSkipList,
+)
+from .unrolledlists import (
+    UnrolledLinkedList as UnrolledLinkedList,
+    UnrolledNode as UnrolledNode,
+)
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from typing import Generic, Iterator, TypeVar
+
+T = TypeVar("T")
+
+NIL = -1
+
+
+class ArenaDoublyLinkedList(Generic[T]):
+    # Same interface as DoublyLinkedList, except nodes are integer positions
+    # into parallel arrays instead of DoubleNode objects. Removed positions are
+    # recycled through a free list threaded through the next array, so a
+    # position must not be used again after it has been removed.
+    header = 0
+    trailer = 1
+
+    def __init__(self, capacity: int = 16) -> None:
+        capacity = max(capacity, 0) + 2  # room for the sentinels
+        self.elements: list[T | None] = [None] * capacity
+        self.prevs = [NIL] * capacity
+        self.nexts = [NIL] * capacity
+        self.nexts[self.header] = self.trailer
+        self.prevs[self.trailer] = self.header
+        self.size = 0
+
+        # Chain every unused slot onto the free list
+        self.free = NIL
+        for i in reversed(range(2, capacity)):
+            self.nexts[i] = self.free
+            self.free = i
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} size={self.size} capacity={self.capacity}>"
+
+    def __str__(self) -> str:
+        return f"[{', '.join(map(repr, self))}]"
+
+    def __iter__(self) -> Iterator[T]:
+        elements, nexts = self.elements, self.nexts
+        steps = 0
+        current = nexts[self.header]
+        while current != self.trailer:
+            steps += 1
+            if steps > self.size:
+                raise RuntimeError(f"List exceeded its size of {self.size}")
+
+            yield elements[current]  # type: ignore
+            current = nexts[current]
+
+    def __reversed__(self) -> Iterator[T]:
+        elements, prevs = self.elements, self.prevs
+        steps = 0
+        current = prevs[self.trailer]
+        while current != self.header:
+            steps += 1
+            if steps > self.size:
+                raise RuntimeError(f"List exceeded its size of {self.size}")
+
+            yield elements[current]  # type: ignore
+            current = prevs[current]
+
+    @property
+    def capacity(self) -> int:
+        return len(self.elements) - 2
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def element(self, node: int) -> T:
+        return self.elements[node]  # type: ignore
+
+    def next(self, node: int) -> int:
+        return self.nexts[node]
+
+    def prev(self, node: int) -> int:
+        return self.prevs[node]
+
+    def first(self) -> T | None:
+        if not self.is_empty():
+            return self.elements[self.nexts[self.header]]
+
+    def last(self) -> T | None:
+        if not self.is_empty():
+            return self.elements[self.prevs[self.trailer]]
+
+    def add_first(self, element: T) -> int:
+        return self.add_between(element, self.header, self.nexts[self.header])
+
+    def add_last(self, element: T) -> int:
+        return self.add_between(element, self.prevs[self.trailer], self.trailer)
+
+    def remove_first(self) -> T | None:
+        if not self.is_empty():
+            return self.remove(self.nexts[self.header])
+
+    def remove_last(self) -> T | None:
+        if not self.is_empty():
+            return self.remove(self.prevs[self.trailer])
+
+    def add_between(self, element: T, prev: int, next: int) -> int:
+        if self.free == NIL:
+            self._grow()
+
+        new = self.free
+        self.free = self.nexts[new]
+
+        self.elements[new] = element
+        self.prevs[new] = prev
+        self.nexts[new] = next
+        self.nexts[prev] = new
+        self.prevs[next] = new
+        self.size += 1
+        return new
+
+    def remove(self, node: int) -> T:
+        assert node != self.header, "cannot remove the header sentinel"
+        assert node != self.trailer, "cannot remove the trailer sentinel"
+        prev, next = self.prevs[node], self.nexts[node]
+        self.nexts[prev] = next
+        self.prevs[next] = prev
+        self.size -= 1
+
+        element: T = self.elements[node]  # type: ignore
+        self.elements[node] = None  # release the reference for the GC
+        self.prevs[node] = NIL
+        self.nexts[node] = self.free
+        self.free = node
+        return element
+
+    def _grow(self) -> None:
+        old = len(self.elements)
+        new = max(old * 2, 4)
+        self.elements.extend([None] * (new - old))
+        self.prevs.extend([NIL] * (new - old))
+        self.nexts.extend([NIL] * (new - old))
+
+        for i in reversed(range(old, new)):
+            self.nexts[i] = self.free
+            self.free = i
+
+
+def main() -> None:
+    alist = ArenaDoublyLinkedList[str](capacity=2)
+    alist.add_first("MSP")
+    alist.add_last("ATL")
+    alist.add_last("BOS")
+    alist.add_first("LAX")
+    print(alist)
+    alist.remove_first()
+    alist.remove_last()
+    print(alist)
+    print(repr(alist))
+
+
+if __name__ == "__main__":
+    main()
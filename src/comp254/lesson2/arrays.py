@@ -1,4 +1,10 @@
-from typing import NamedTuple, cast
+import heapq
+import math
+from itertools import takewhile
+from operator import attrgetter
+from typing import Iterable, Iterator, Literal, NamedTuple, Self
+
+from .skiplists import SortedSkipList
 
 
 class GameEntry(NamedTuple):
@@ -9,13 +15,42 @@ class GameEntry(NamedTuple):
         return f"{self.name}:{self.score}"
 
 
-class Scoreboard:
-    num_entries: int
-    board: list[GameEntry | None]
+by_score = attrgetter("score")
+
+
+# How Scoreboard treats several entries with the same name:
+#   "duplicates": keep them all, like any other entries
+#   "best": only keep the player's highest score
+#   "latest": only keep the player's most recently added score
+Policy = Literal["duplicates", "best", "latest"]
 
-    def __init__(self, capacity: int) -> None:
-        self.num_entries = 0
-        self.board = [None] * capacity
+
+class Scoreboard:
+    # The board is a SortedSkipList of (-score, insertion count, entry) items,
+    # so entries are ordered by descending score with ties in the order they
+    # were added, and any rank is O(log n) to find, insert or remove. players
+    # is a second skip list over the same entries, ordered by name and then
+    # by rank, which finds all of a player's entries in O(log n) as well.
+    capacity: int
+    policy: Policy
+    entries: SortedSkipList[tuple[int, int, GameEntry]]
+    players: SortedSkipList[tuple[str, int, int, GameEntry]]
+
+    def __init__(self, capacity: int, policy: Policy = "duplicates") -> None:
+        if policy not in ("duplicates", "best", "latest"):
+            raise ValueError(f"Unknown policy: {policy!r}")
+
+        self.capacity = capacity
+        self.policy = policy
+        self.entries = SortedSkipList()
+        self.players = SortedSkipList()
+        self.added = 0
+
+    @classmethod
+    def from_stream(cls, capacity: int, entries: Iterable[GameEntry]) -> Self:
+        scoreboard = cls(capacity)
+        scoreboard.add_many(entries)
+        return scoreboard
 
     def __repr__(self) -> str:
         return (
@@ -25,41 +60,127 @@ class Scoreboard:
     def __str__(self) -> str:
         return f"[{', '.join(map(str, self.board))}]"
 
-    def add(self, new: GameEntry, /) -> None:
-        board = cast(list[GameEntry], self.board)
+    def __iter__(self) -> Iterator[GameEntry]:
+        # Entries from highest to lowest score
+        for _, _, entry in self.entries:
+            yield entry
 
-        # Is the new entry really a high score?
-        if (
-            self.num_entries >= len(board)
-            and new.score <= board[self.num_entries - 1].score
-        ):
-            return
+    @property
+    def num_entries(self) -> int:
+        return self.entries.size
 
-        if self.num_entries < len(board):
-            self.num_entries += 1
+    @property
+    def board(self) -> list[GameEntry | None]:
+        # The entries in rank order, padded with None up to the capacity
+        board: list[GameEntry | None] = list(self)
+        board.extend([None] * (self.capacity - len(board)))
+        return board
 
-        # Shift any lower scores rightward to make room for the new entry
-        i = self.num_entries - 1
-        while i > 0 and board[i - 1].score < new.score:
-            board[i] = board[i - 1]
-            i -= 1
+    def add(self, new: GameEntry, /) -> None:
+        if self.policy != "duplicates" and (existing := self._best_of(new.name)):
+            if self.policy == "best" and new.score <= existing[3].score:
+                return
+            self._discard(existing[1:])
 
-        board[i] = new
+        # Is the new entry really a high score?
+        if self.num_entries >= self.capacity:
+            lowest = self.entries.last()
+            if lowest is None or new.score <= -lowest[0]:
+                return
+            self._forget(self.entries.pop())
+
+        # Equal scores are placed after the existing ones by the count
+        item = (-new.score, self.added, new)
+        self.added += 1
+        self.entries.add(item)
+        self.players.add((new.name, *item))
+
+    def add_many(self, entries: Iterable[GameEntry], /) -> None:
+        # Same result as calling add() for each entry. Only the stream's top
+        # `capacity` entries can make the board, so nlargest() selects them
+        # in one pass with O(capacity) memory. It's stable, so they're then
+        # added in the stream's order among ties. Only one entry per name
+        # can't be enforced this way, so the other policies use add() alone.
+        if self.policy == "duplicates":
+            entries = heapq.nlargest(self.capacity, entries, key=by_score)
+        for entry in entries:
+            self.add(entry)
+
+    def get(self, name: str) -> GameEntry | None:
+        # The player's highest entry on the board, if they have one
+        if (best := self._best_of(name)) is not None:
+            return best[3]
+
+    def remove_player(self, name: str) -> list[GameEntry]:
+        # Remove every entry with this name, returning them highest first
+        items = list(takewhile(lambda item: item[0] == name, self._items_of(name)))
+        if not items:
+            raise KeyError(name)
+
+        for item in items:
+            self._discard(item[1:])
+        return [item[3] for item in items]
+
+    def update_score(self, name: str, score: int) -> None:
+        # Replace the player's highest entry with the new score,
+        # which is then ranked as if it was just added
+        best = self._best_of(name)
+        if best is None:
+            raise KeyError(name)
+
+        self._discard(best[1:])
+        self.add(GameEntry(name, score))
+
+    def rank_of(self, score: int) -> int:
+        # The index that add() would place a new entry with this score at,
+        # i.e. the number of entries scoring at least as high
+        return self.entries.bisect_left((-score, math.inf))
+
+    def score_at_rank(self, k: int) -> int:
+        if not 0 <= k < self.num_entries:
+            raise IndexError(f"Rank {k} out of range")
+
+        return -self.entries[k][0]
+
+    def percentile(self, p: float) -> int:
+        # The lowest score that at least p% of entries are at or below,
+        # using the nearest-rank method
+        if not 0 <= p <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, not {p}")
+        elif self.num_entries == 0:
+            raise ValueError("Cannot take a percentile of an empty scoreboard")
+
+        k = max(math.ceil(p / 100 * self.num_entries), 1)
+        return self.score_at_rank(self.num_entries - k)
+
+    def count_between(self, lo: int, hi: int) -> int:
+        # The number of entries where lo <= score < hi
+        return max(self.rank_of(lo) - self.rank_of(hi), 0)
 
     def remove(self, i: int, /) -> GameEntry:
-        board = cast(list[GameEntry], self.board)
-
-        if i < 0 or i > self.num_entries:
+        if i < 0 or i >= self.num_entries:
             raise IndexError(f"Index {i} out of range")
 
-        entry = board[i]
-        for j in range(i, self.num_entries - 1):
-            board[j] = board[j + 1]
+        item = self.entries.pop(i)
+        self._forget(item)
+        return item[2]
+
+    def _items_of(self, name: str) -> Iterator[tuple[str, int, int, GameEntry]]:
+        # The player's items in rank order, followed by the other players'.
+        # (name,) sorts before every longer tuple starting with the name.
+        return self.players.irange((name,))
+
+    def _best_of(self, name: str) -> tuple[str, int, int, GameEntry] | None:
+        item = next(self._items_of(name), None)
+        if item is not None and item[0] == name:
+            return item
 
-        self.board[self.num_entries - 1] = None
-        self.num_entries -= 1
+    def _discard(self, item: tuple[int, int, GameEntry]) -> None:
+        self.entries.remove(item)
+        self._forget(item)
 
-        return entry
+    def _forget(self, item: tuple[int, int, GameEntry]) -> None:
+        self.players.remove((item[2].name, *item))
 
 
 def main() -> None:
@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import functools
+import sys
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Iterator,
+    NamedTuple,
+    ParamSpec,
+    TypeVar,
+)
+
+from .linkedlists import DoubleNode, DoublyLinkedList
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Sentinel for a cache miss, since None is a valid value
+MISSING: Any = object()
+
+# Separates positional from keyword arguments in memoize() keys
+KWARGS_MARK: Any = object()
+
+
+@dataclass(eq=False, slots=True)  # identity-based hashing and comparisons
+class CacheEntry(Generic[K, V]):
+    key: K
+    value: V
+    nbytes: int
+    # Only used by LFUCache, for the bucket of entries with the same count
+    bucket: DoubleNode[FrequencyBucket[K, V]] | None = None
+
+
+@dataclass(eq=False, slots=True)  # identity-based hashing and comparisons
+class FrequencyBucket(Generic[K, V]):
+    count: int
+    entries: DoublyLinkedList[CacheEntry[K, V]]
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    nbytes: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class Cache(ABC, Generic[K, V]):
+    # Common bookkeeping for LRUCache and LFUCache, which decide the order of
+    # eviction. Capacity can be limited by the number of entries, by the sum
+    # of sizeof(value), or both, and None leaves that limit off. Sizes are
+    # only computed when maxbytes is set, so nbytes stays 0 otherwise.
+    def __init__(
+        self,
+        maxsize: int | None = 128,
+        *,
+        maxbytes: int | None = None,
+        sizeof: Callable[[V], int] = sys.getsizeof,
+    ) -> None:
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"maxsize must be non-negative, not {maxsize}")
+        if maxbytes is not None and maxbytes < 0:
+            raise ValueError(f"maxbytes must be non-negative, not {maxbytes}")
+
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.index: dict[K, DoubleNode[CacheEntry[K, V]]] = {}
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} size={len(self)} nbytes={self.nbytes} "
+            f"hits={self.hits} misses={self.misses} evictions={self.evictions}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, key: object) -> bool:
+        # Doesn't count as a hit or miss, or affect the eviction order
+        return key in self.index
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[K]:
+        # Keys in eviction order, starting with the next one to be evicted
+        raise NotImplementedError
+
+    def get(self, key: K, default: Any = None) -> Any:
+        node = self.index.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._touch(node)
+        return node.element.value
+
+    def put(self, key: K, value: V) -> None:
+        nbytes = 0 if self.maxbytes is None else self.sizeof(value)
+        node = self.index.get(key)
+
+        if self.maxbytes is not None and nbytes > self.maxbytes:
+            # Too big to ever fit, so don't evict everything else trying
+            if node is not None:
+                self._discard(node)
+            return
+        elif node is not None:
+            entry = node.element
+            self.nbytes += nbytes - entry.nbytes
+            entry.value = value
+            entry.nbytes = nbytes
+            self._touch(node)
+            # A bigger value may need room, but never at its own expense
+            self._evict(0, 0, exclude=self.index[key])
+            return
+        elif self.maxsize == 0:
+            return
+
+        self._evict(1, nbytes)
+        self._insert(CacheEntry(key, value, nbytes))
+        self.nbytes += nbytes
+
+    def pop(self, key: K, default: Any = MISSING) -> Any:
+        node = self.index.get(key)
+        if node is None:
+            if default is MISSING:
+                raise KeyError(key)
+            return default
+
+        self._discard(node)
+        return node.element.value
+
+    def clear(self) -> None:
+        # Counters are kept, same as removing every entry one by one
+        for key in list(self.index):
+            self._discard(self.index[key])
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            self.hits, self.misses, self.evictions, len(self), self.nbytes
+        )
+
+    def _evict(
+        self,
+        count: int,
+        nbytes: int,
+        exclude: DoubleNode[CacheEntry[K, V]] | None = None,
+    ) -> None:
+        # Evict until another `count` entries totalling `nbytes` would fit,
+        # skipping the excluded entry
+        while len(self.index) > (exclude is not None) and (
+            (self.maxsize is not None and len(self.index) + count > self.maxsize)
+            or (self.maxbytes is not None and self.nbytes + nbytes > self.maxbytes)
+        ):
+            self._discard(self._victim(exclude))
+            self.evictions += 1
+
+    def _discard(self, node: DoubleNode[CacheEntry[K, V]]) -> None:
+        entry = node.element
+        self._unlink(node)
+        del self.index[entry.key]
+        self.nbytes -= entry.nbytes
+
+    @abstractmethod
+    def _touch(self, node: DoubleNode[CacheEntry[K, V]]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _insert(self, entry: CacheEntry[K, V]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _victim(
+        self, exclude: DoubleNode[CacheEntry[K, V]] | None
+    ) -> DoubleNode[CacheEntry[K, V]]:
+        # The next entry to evict other than `exclude`, which is never the
+        # only entry left when given
+        raise NotImplementedError
+
+    @abstractmethod
+    def _unlink(self, node: DoubleNode[CacheEntry[K, V]]) -> None:
+        raise NotImplementedError
+
+
+class LRUCache(Cache[K, V]):
+    # Entries are kept from least to most recently used,
+    # so every hit moves its node to the end of the list
+    def __init__(
+        self,
+        maxsize: int | None = 128,
+        *,
+        maxbytes: int | None = None,
+        sizeof: Callable[[V], int] = sys.getsizeof,
+    ) -> None:
+        super().__init__(maxsize, maxbytes=maxbytes, sizeof=sizeof)
+        self.entries = DoublyLinkedList[CacheEntry[K, V]]()
+
+    def __iter__(self) -> Iterator[K]:
+        for entry in self.entries:
+            yield entry.key
+
+    def _touch(self, node: DoubleNode[CacheEntry[K, V]]) -> None:
+        self.entries.move_to_last(node)
+
+    def _insert(self, entry: CacheEntry[K, V]) -> None:
+        self.index[entry.key] = self.entries.add_last(entry)
+
+    def _victim(
+        self, exclude: DoubleNode[CacheEntry[K, V]] | None
+    ) -> DoubleNode[CacheEntry[K, V]]:
+        node = self.entries.header.next
+        if node is exclude:
+            assert node is not None
+            node = node.next
+        assert node is not None
+        return node
+
+    def _unlink(self, node: DoubleNode[CacheEntry[K, V]]) -> None:
+        self.entries.remove(node)
+
+
+class LFUCache(Cache[K, V]):
+    # Entries are grouped into buckets by how often they've been used, with
+    # the buckets kept in increasing order of count. A hit moves its entry to
+    # the bucket for the next count, creating it if needed, so every operation
+    # is O(1). Ties are broken by evicting the least recently used entry.
+    def __init__(
+        self,
+        maxsize: int | None = 128,
+        *,
+        maxbytes: int | None = None,
+        sizeof: Callable[[V], int] = sys.getsizeof,
+    ) -> None:
+        super().__init__(maxsize, maxbytes=maxbytes, sizeof=sizeof)
+        self.buckets = DoublyLinkedList[FrequencyBucket[K, V]]()
+
+    def __iter__(self) -> Iterator[K]:
+        for bucket in self.buckets:
+            for entry in bucket.entries:
+                yield entry.key
+
+    def count(self, key: K) -> int:
+        # The number of times a key has been put or hit while cached
+        node = self.index.get(key)
+        if node is None:
+            return 0
+
+        assert node.element.bucket is not None
+        return node.element.bucket.element.count
+
+    def _touch(self, node: DoubleNode[CacheEntry[K, V]]) -> None:
+        entry = node.element
+        here = entry.bucket
+        assert here is not None and here.next is not None
+        count = here.element.count + 1
+
+        next = here.next
+        if next is self.buckets.trailer or next.element.count != count:
+            next = self.buckets.add_between(
+                FrequencyBucket(count, DoublyLinkedList()), here, next
+            )
+
+        self._unlink(node)
+        entry.bucket = next
+        self.index[entry.key] = next.element.entries.add_last(entry)
+
+    def _insert(self, entry: CacheEntry[K, V]) -> None:
+        first = self.buckets.header.next
+        assert first is not None
+        if first is self.buckets.trailer or first.element.count != 1:
+            first = self.buckets.add_first(FrequencyBucket(1, DoublyLinkedList()))
+
+        entry.bucket = first
+        self.index[entry.key] = first.element.entries.add_last(entry)
+
+    def _victim(
+        self, exclude: DoubleNode[CacheEntry[K, V]] | None
+    ) -> DoubleNode[CacheEntry[K, V]]:
+        bucket = self.buckets.header.next
+        assert bucket is not None
+        node = bucket.element.entries.header.next
+        assert node is not None
+        if node is exclude:
+            # Take the next entry, which may be in the next bucket
+            node = node.next
+            assert node is not None and bucket.next is not None
+            if node is bucket.element.entries.trailer:
+                node = bucket.next.element.entries.header.next
+        assert node is not None
+        return node
+
+    def _unlink(self, node: DoubleNode[CacheEntry[K, V]]) -> None:
+        bucket = node.element.bucket
+        assert bucket is not None
+        bucket.element.entries.remove(node)
+        if bucket.element.entries.is_empty():
+            self.buckets.remove(bucket)
+
+
+def memoize(cache: Cache[Any, R]) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    # Like functools.lru_cache(), except results are stored in the given
+    # cache, which is also available as the wrapper's `cache` attribute.
+    # Every argument must be hashable.
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            key = args if not kwargs else (*args, KWARGS_MARK, *kwargs.items())
+            value = cache.get(key, MISSING)
+            if value is MISSING:
+                value = func(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache  # type: ignore
+        return wrapper
+
+    return decorator
+
+
+def main() -> None:
+    @memoize(LRUCache[Any, int](maxsize=64))
+    def fib(n: int) -> int:
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    print(fib(80), fib.cache.stats())  # type: ignore
+
+    lfu = LFUCache[str, int](maxsize=2)
+    lfu.put("MSP", 1)
+    lfu.put("ATL", 2)
+    lfu.get("MSP")
+    lfu.put("BOS", 3)  # evicts ATL, which was used less often than MSP
+    print(list(lfu), lfu.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Generic, Iterator, TypeVar
+
+from .linkedlists import DoubleNode
+
+T = TypeVar("T")
+
+# Sentinel for "nothing to remove", since None is a valid element
+EMPTY: Any = object()
+
+# With at least this many elements, operations at opposite ends never write
+# to the same fields of the same node, so each end only needs its own lock.
+# Two concurrent removals need three nodes so that neither unlinks the
+# other's new neighbour.
+MIN_SPLIT_SIZE = 3
+
+
+class ConcurrentDeque(Generic[T]):
+    # A thread-safe deque using the same sentinel layout as DoublyLinkedList.
+    # Each end has its own lock, and both are taken (head first) whenever the
+    # deque is short enough for the ends to interfere. Each end also keeps
+    # its own share of the size so that neither writes the other's counter.
+    def __init__(self) -> None:
+        self.header = DoubleNode[T](None, None, None)  # type: ignore
+        self.trailer = DoubleNode[T](None, self.header, None)  # type: ignore
+        self.header.next = self.trailer
+
+        self.head_lock = threading.Lock()
+        self.tail_lock = threading.Lock()
+        self.head_count = 0
+        self.tail_count = 0
+
+        self.not_empty = threading.Condition(threading.Lock())
+        self.waiters = 0
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} size={self.size}>"
+
+    def __str__(self) -> str:
+        return f"[{', '.join(map(repr, self))}]"
+
+    def __iter__(self) -> Iterator[T]:
+        # Iterate over a snapshot so the locks aren't held by the caller
+        return iter(self.snapshot())
+
+    @property
+    def size(self) -> int:
+        return self.head_count + self.tail_count
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def snapshot(self) -> list[T]:
+        with self.head_lock, self.tail_lock:
+            elements: list[T] = []
+            current = self.header.next
+            while current is not None and current.next is not None:
+                elements.append(current.element)
+                current = current.next
+            return elements
+
+    def first(self) -> T | None:
+        with self.head_lock, self.tail_lock:
+            if self.size > 0:
+                assert self.header.next is not None
+                return self.header.next.element
+
+    def last(self) -> T | None:
+        with self.head_lock, self.tail_lock:
+            if self.size > 0:
+                assert self.trailer.prev is not None
+                return self.trailer.prev.element
+
+    def add_first(self, element: T) -> None:
+        self._locked(self.head_lock, self._add_first, element)
+        self._notify()
+
+    def add_last(self, element: T) -> None:
+        self._locked(self.tail_lock, self._add_last, element)
+        self._notify()
+
+    def remove_first(self) -> T | None:
+        element = self._locked(self.head_lock, self._remove_first)
+        if element is not EMPTY:
+            return element
+
+    def remove_last(self) -> T | None:
+        element = self._locked(self.tail_lock, self._remove_last)
+        if element is not EMPTY:
+            return element
+
+    def take_first(self, timeout: float | None = None) -> T | None:
+        # Block until an element can be removed, or return None on timeout
+        return self._take(self.head_lock, self._remove_first, timeout)
+
+    def take_last(self, timeout: float | None = None) -> T | None:
+        return self._take(self.tail_lock, self._remove_last, timeout)
+
+    def _take(
+        self,
+        lock: threading.Lock,
+        remove: Callable[[], T],
+        timeout: float | None,
+    ) -> T | None:
+        element = self._locked(lock, remove)
+        if element is not EMPTY:
+            return element
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.not_empty:
+            self.waiters += 1
+            try:
+                while (element := self._locked(lock, remove)) is EMPTY:
+                    if deadline is None:
+                        self.not_empty.wait()
+                        continue
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    self.not_empty.wait(remaining)
+            finally:
+                self.waiters -= 1
+
+        return element
+
+    def _notify(self) -> None:
+        # Waiters register themselves before checking for elements,
+        # so skipping the condition when there are none can't lose a wakeup
+        if self.waiters:
+            with self.not_empty:
+                self.not_empty.notify()
+
+    def _locked(self, lock: threading.Lock, op: Callable[..., Any], *args: Any) -> Any:
+        with lock:
+            if self.size >= MIN_SPLIT_SIZE:
+                return op(*args)
+
+        with self.head_lock, self.tail_lock:
+            return op(*args)
+
+    def _add_first(self, element: T) -> None:
+        next = self.header.next
+        assert next is not None
+        new = DoubleNode(element, self.header, next)
+        next.prev = new
+        self.header.next = new
+        self.head_count += 1
+
+    def _add_last(self, element: T) -> None:
+        prev = self.trailer.prev
+        assert prev is not None
+        new = DoubleNode(element, prev, self.trailer)
+        prev.next = new
+        self.trailer.prev = new
+        self.tail_count += 1
+
+    def _remove_first(self) -> T:
+        node = self.header.next
+        if node is self.trailer:
+            return EMPTY
+
+        assert node is not None and node.next is not None
+        node.next.prev = self.header
+        self.header.next = node.next
+        self.head_count -= 1
+        return node.element
+
+    def _remove_last(self) -> T:
+        node = self.trailer.prev
+        if node is self.header:
+            return EMPTY
+
+        assert node is not None and node.prev is not None
+        node.prev.next = self.trailer
+        self.trailer.prev = node.prev
+        self.tail_count -= 1
+        return node.element
+
+
+def main() -> None:
+    deque = ConcurrentDeque[int]()
+
+    def produce() -> None:
+        for i in range(5):
+            deque.add_last(i)
+            time.sleep(0.01)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    for _ in range(5):
+        print("Took", deque.take_first(timeout=1))
+    producer.join()
+    print(deque.take_first(timeout=0.05))
+
+
+if __name__ == "__main__":
+    main()
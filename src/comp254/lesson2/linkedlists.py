@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
-from typing import Final, Generic, Iterator, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Final,
+    Generic,
+    Iterable,
+    Iterator,
+    Self,
+    TypeVar,
+)
+
+from . import numeric
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike, NDArray
 
 T = TypeVar("T")
 
 
-@dataclass(eq=False)  # identity-based hashing and comparisons
+@dataclass(eq=False, slots=True)  # identity-based hashing and comparisons
 class SingleNode(Generic[T]):
     element: Final[T]
     next: SingleNode[T] | None
@@ -19,11 +35,70 @@ class SingleNode(Generic[T]):
 
 
 class SinglyLinkedList(Generic[T]):
+    # Set to True to detect circular references by identity during iteration,
+    # at the cost of O(n) memory per traversal
+    validate: bool = False
+
     def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
         self.head: SingleNode[T] | None = None
         self.tail: SingleNode[T] | None = None
         self.size = 0
 
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T]) -> Self:
+        L = cls()
+        L.extend(iterable)
+        return L
+
+    @classmethod
+    def from_numpy(cls, array: NDArray[Any]) -> Self:
+        # tolist() converts every NumPy scalar to a Python number in C
+        return cls.from_iterable(array.tolist())
+
+    def to_numpy(self, dtype: DTypeLike | None = None) -> NDArray[Any]:
+        return numeric.to_numpy(self, dtype)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Store elements as one flat list, since pickling the nodes themselves
+        # recurses once per node and overflows the stack on long lists
+        return {"elements": list(self), "attributes": self._attributes()}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Never calls __init__(), which a subclass may give required arguments
+        self._reset()
+        vars(self).update(state.get("attributes", {}))
+        self.extend(state["elements"])
+
+    def __copy__(self) -> Self:
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        L = self._empty({})
+        memo[id(self)] = L
+        vars(L).update(copy.deepcopy(self._attributes(), memo))
+        L.extend(copy.deepcopy(element, memo) for element in self)
+        return L
+
+    def copy(self) -> Self:
+        # Shallow copy, linking the new nodes inline in a single pass
+        L = self._empty(self._attributes())
+        if self.head is None:
+            return L
+
+        head = tail = SingleNode(self.head.element, None)
+        current = self.head.next
+        while current is not None:
+            node = SingleNode(current.element, None)
+            tail.next = node
+            tail = node
+            current = current.next
+
+        L.head, L.tail, L.size = head, tail, self.size
+        return L
+
     def __repr__(self) -> str:
         return f"<{type(self).__name__} head={self.head} tail={self.tail} size={self.size}>"
 
@@ -31,13 +106,26 @@ class SinglyLinkedList(Generic[T]):
         return f"[{', '.join(map(repr, self))}]"
 
     def __iter__(self) -> Iterator[T]:
-        frontier = set()  # detect circular references for safety
+        if self.validate:
+            frontier = set()  # detect circular references for safety
+            current = self.head
+            while current is not None:
+                if current in frontier:
+                    raise RuntimeError(f"Circular reference detected: {current}")
+
+                frontier.add(current)
+                yield current.element
+                current = current.next
+            return
+
+        # Cheaper safety net: a list can't have more nodes than its size
+        steps = 0
         current = self.head
         while current is not None:
-            if current in frontier:
-                raise RuntimeError(f"Circular reference detected: {current}")
+            steps += 1
+            if steps > self.size:
+                raise RuntimeError(f"List exceeded its size of {self.size}: {current}")
 
-            frontier.add(current)
             yield current.element
             current = current.next
 
@@ -89,10 +177,285 @@ class SinglyLinkedList(Generic[T]):
 
         return element
 
+    def extend(self, iterable: Iterable[T], /) -> None:
+        # Link the new chain behind a temporary sentinel
+        # so the list itself is only touched once
+        sentinel = tail = SingleNode[T](None, None)  # type: ignore
+        count = 0
+        for element in iterable:
+            node = SingleNode(element, None)
+            tail.next = node
+            tail = node
+            count += 1
+
+        if count == 0:
+            return
+
+        if self.is_empty():
+            self.head = sentinel.next
+        else:
+            assert self.tail is not None
+            self.tail.next = sentinel.next
+
+        self.tail = tail
+        self.size += count
+
+    def extend_left(self, iterable: Iterable[T], /) -> None:
+        # Equivalent to calling add_first() for each element,
+        # so the elements end up in reverse order
+        head = self.head
+        tail: SingleNode[T] | None = None
+        count = 0
+        for element in iterable:
+            head = SingleNode(element, head)
+            if tail is None:
+                tail = head
+            count += 1
+
+        if count == 0:
+            return
+
+        self.head = head
+        if self.is_empty():
+            self.tail = tail
+
+        self.size += count
+
+    def splice(self, other: SinglyLinkedList[T]) -> None:
+        # Steal every node from the other list in O(1), leaving it empty
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        elif other.is_empty():
+            return
+
+        if self.is_empty():
+            self.head = other.head
+        else:
+            assert self.tail is not None
+            self.tail.next = other.head
+
+        self.tail = other.tail
+        self.size += other.size
+
+        other.head = other.tail = None
+        other.size = 0
+
+    def split_after(self, node: SingleNode[T]) -> Self:
+        # Walk from the head to find the node's index k, which is O(k) and
+        # rules out nodes that belong to some other chain
+        current = self.head
+        for k in range(self.size):
+            assert current is not None
+            if current is node:
+                return self._detach_after(node, self.size - k - 1)
+            current = current.next
+
+        raise ValueError("Node is not in this list")
+
+    def split_at(self, k: int) -> Self:
+        # Keep the first k elements and move the rest into a new list in O(k)
+        if not 0 <= k <= self.size:
+            raise IndexError(f"Index {k} out of range")
+        elif k == 0:
+            new = self._empty(self._attributes())
+            new.splice(self)
+            return new
+
+        node = self.head
+        for _ in range(k - 1):
+            assert node is not None
+            node = node.next
+
+        assert node is not None
+        return self._detach_after(node, self.size - k)
+
+    def _attributes(self) -> dict[str, Any]:
+        # Everything but the nodes, such as a per-instance validate flag or a
+        # subclass's own fields, which copies and pickles carry across
+        return {
+            k: v for k, v in vars(self).items() if k not in ("head", "tail", "size")
+        }
+
+    def _empty(self, attributes: dict[str, Any]) -> Self:
+        # A new empty list of the same type, built without calling __init__()
+        L = type(self).__new__(type(self))
+        L._reset()
+        vars(L).update(attributes)
+        return L
+
+    def _detach_after(self, node: SingleNode[T], count: int) -> Self:
+        new = self._empty(self._attributes())
+        if count == 0:
+            return new
+
+        new.head = node.next
+        new.tail = self.tail
+        new.size = count
+
+        node.next = None
+        self.tail = node
+        self.size -= count
+        return new
+
+    def sort(
+        self, key: Callable[[T], Any] | None = None, reverse: bool = False
+    ) -> None:
+        # Stable like list.sort(), but relinks the existing nodes in place
+        if self.size < 2:
+            return
+
+        head = _sort_nodes(self.head, key, reverse)
+        tail = head
+        while tail.next is not None:
+            tail = tail.next
+
+        self.head, self.tail = head, tail
+
+    def merge_sorted(
+        self,
+        other: SinglyLinkedList[T],
+        key: Callable[[T], Any] | None = None,
+        reverse: bool = False,
+    ) -> None:
+        # Merge another list sorted the same way in O(n + m), leaving it
+        # empty. Equal elements from this list stay ahead of the other's.
+        if other is self:
+            raise ValueError("Cannot merge a list into itself")
+        elif self.is_empty() or other.is_empty():
+            return self.splice(other)
+
+        assert self.tail is not None and other.tail is not None
+        self.head = _merge_nodes(self.head, other.head, key, reverse)
+        # Whichever tail ended up last is the only one not linked onward
+        self.tail = self.tail if self.tail.next is None else other.tail
+        self.size += other.size
+
+        other.head = other.tail = None
+        other.size = 0
+
+    def cursor(self) -> SinglyLinkedCursor[T]:
+        return SinglyLinkedCursor(self)
+
+
+class SinglyLinkedCursor(Generic[T]):
+    # Tracks the node before the current one so that removing or inserting
+    # at the cursor is O(1). Like an iterator, a cursor becomes invalid if
+    # its list is modified other than through the cursor itself.
+    def __init__(self, list: SinglyLinkedList[T]) -> None:
+        self.list = list
+        self.prev: SingleNode[T] | None = None
+        self.current = list.head
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} prev={self.prev} current={self.current}>"
+
+    @property
+    def element(self) -> T:
+        return self._require_current().element
+
+    def at_end(self) -> bool:
+        return self.current is None
+
+    def advance(self) -> bool:
+        # Returns True if the cursor is still on a node afterwards
+        current = self._require_current()
+        self.prev, self.current = current, current.next
+        return self.current is not None
+
+    def remove_current(self) -> T:
+        # The cursor moves onto the node after the removed one
+        current = self._require_current()
+        if self.prev is None:
+            self.list.head = current.next
+        else:
+            self.prev.next = current.next
+        if self.list.tail is current:
+            self.list.tail = self.prev
+
+        self.current = current.next
+        self.list.size -= 1
+        return current.element
+
+    def insert_before(self, element: T) -> None:
+        # Also allowed at the end, which appends to the list
+        new = SingleNode(element, self.current)
+        if self.prev is None:
+            self.list.head = new
+        else:
+            self.prev.next = new
+        if self.current is None:
+            self.list.tail = new
+
+        self.prev = new
+        self.list.size += 1
+
+    def insert_after(self, element: T) -> None:
+        current = self._require_current()
+        new = SingleNode(element, current.next)
+        current.next = new
+        if self.list.tail is current:
+            self.list.tail = new
+
+        self.list.size += 1
+
+    def swap_with(self, other: SinglyLinkedCursor[T]) -> None:
+        # Swap the current nodes of two cursors on the same list. Each cursor
+        # stays at its position, which now holds the other cursor's node.
+        if other.list is not self.list:
+            raise ValueError("Cannot swap nodes between different lists")
+
+        a, b = self._require_current(), other._require_current()
+        if a is b:
+            return
+        elif other.prev is a:
+            return self._swap_adjacent(self, other)
+        elif self.prev is b:
+            return self._swap_adjacent(other, self)
+
+        # pa => a => ... => pb => b  becomes  pa => b => ... => pb => a
+        for prev, node in ((self.prev, b), (other.prev, a)):
+            if prev is None:
+                self.list.head = node
+            else:
+                prev.next = node
+        a.next, b.next = b.next, a.next
+
+        if self.list.tail is a:
+            self.list.tail = b
+        elif self.list.tail is b:
+            self.list.tail = a
+
+        self.current, other.current = b, a
+
+    @staticmethod
+    def _swap_adjacent(
+        first: SinglyLinkedCursor[T], second: SinglyLinkedCursor[T]
+    ) -> None:
+        # pa => a => b  becomes  pa => b => a
+        L = first.list
+        a, b = first.current, second.current
+        assert a is not None and b is not None
+        if first.prev is None:
+            L.head = b
+        else:
+            first.prev.next = b
+        a.next, b.next = b.next, a
+
+        if L.tail is b:
+            L.tail = a
+
+        first.current = b
+        second.prev, second.current = b, a
 
-@dataclass(eq=False)  # identity-based hashing and comparisons
+    def _require_current(self) -> SingleNode[T]:
+        if self.current is None:
+            raise IndexError("Cursor is past the end of the list")
+        return self.current
+
+
+@dataclass(eq=False, slots=True)  # identity-based hashing and comparisons
 class DoubleNode(Generic[T]):
-    element: Final[T]
+    element: T
     prev: DoubleNode[T] | None
     next: DoubleNode[T] | None
 
@@ -108,11 +471,74 @@ class DoubleNode(Generic[T]):
 
 
 class DoublyLinkedList(Generic[T]):
+    # Set to True to detect circular references by identity during iteration,
+    # at the cost of O(n) memory per traversal
+    validate: bool = False
+
     def __init__(self) -> None:
-        self.header = DoubleNode[T](None, None, None)  # type: ignore
-        self.trailer = DoubleNode[T](None, self.header, None)  # type: ignore
+        self._reset()
+
+    def _reset(self) -> None:
+        # Calling DoubleNode unsubscripted skips typing's generic alias,
+        # which is slow enough to matter when creating many small lists
+        self.header: DoubleNode[T] = DoubleNode(None, None, None)  # type: ignore
+        self.trailer: DoubleNode[T] = DoubleNode(None, self.header, None)  # type: ignore
         self.header.next = self.trailer
         self.size = 0
+        # The last (index, node) accessed by position, if the list hasn't
+        # been modified since. Nearby indices can be walked to from here.
+        self.finger: tuple[int, DoubleNode[T]] | None = None
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T]) -> Self:
+        L = cls()
+        L.extend(iterable)
+        return L
+
+    @classmethod
+    def from_numpy(cls, array: NDArray[Any]) -> Self:
+        # tolist() converts every NumPy scalar to a Python number in C
+        return cls.from_iterable(array.tolist())
+
+    def to_numpy(self, dtype: DTypeLike | None = None) -> NDArray[Any]:
+        return numeric.to_numpy(self, dtype)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Store elements as one flat list, since pickling the nodes themselves
+        # recurses once per node and overflows the stack on long lists
+        return {"elements": list(self), "attributes": self._attributes()}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Never calls __init__(), which a subclass may give required arguments
+        self._reset()
+        vars(self).update(state.get("attributes", {}))
+        self.extend(state["elements"])
+
+    def __copy__(self) -> Self:
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        L = self._empty({})
+        memo[id(self)] = L
+        vars(L).update(copy.deepcopy(self._attributes(), memo))
+        L.extend(copy.deepcopy(element, memo) for element in self)
+        return L
+
+    def copy(self) -> Self:
+        # Shallow copy, linking the new nodes inline in a single pass
+        L = self._empty(self._attributes())
+        prev = L.header
+        current = self.header.next
+        while current is not None and current is not self.trailer:
+            node = DoubleNode(current.element, prev, None)
+            prev.next = node
+            prev = node
+            current = current.next
+
+        prev.next = L.trailer
+        L.trailer.prev = prev
+        L.size = self.size
+        return L
 
     def __repr__(self) -> str:
         return f"<{type(self).__name__} header={self.header} trailer={self.trailer} size={self.size}>"
@@ -120,25 +546,56 @@ class DoublyLinkedList(Generic[T]):
     def __str__(self) -> str:
         return f"[{', '.join(map(repr, self))}]"
 
+    def __getitem__(self, i: int) -> T:
+        return self._node_at(self._check_index(i)).element
+
+    def __setitem__(self, i: int, element: T) -> None:
+        self._node_at(self._check_index(i)).element = element
+
     def __iter__(self) -> Iterator[T]:
-        frontier = set()  # detect circular references for safety
+        if self.validate:
+            frontier = set()  # detect circular references for safety
+            current = self.header.next
+            while current is not None and current.next is not None:
+                if current in frontier:
+                    raise RuntimeError(f"Circular reference detected: {current}")
+
+                frontier.add(current)
+                yield current.element
+                current = current.next
+            return
+
+        # Cheaper safety net: a list can't have more nodes than its size
+        steps = 0
         current = self.header.next
         while current is not None and current.next is not None:
-            if current in frontier:
-                raise RuntimeError(f"Circular reference detected: {current}")
+            steps += 1
+            if steps > self.size:
+                raise RuntimeError(f"List exceeded its size of {self.size}: {current}")
 
-            frontier.add(current)
             yield current.element
             current = current.next
 
     def __reversed__(self) -> Iterator[T]:
-        frontier = set()  # detect circular references for safety
+        if self.validate:
+            frontier = set()  # detect circular references for safety
+            current = self.trailer.prev
+            while current is not None and current.prev is not None:
+                if current in frontier:
+                    raise RuntimeError(f"Circular reference detected: {current}")
+
+                frontier.add(current)
+                yield current.element
+                current = current.prev
+            return
+
+        steps = 0
         current = self.trailer.prev
         while current is not None and current.prev is not None:
-            if current in frontier:
-                raise RuntimeError(f"Circular reference detected: {current}")
+            steps += 1
+            if steps > self.size:
+                raise RuntimeError(f"List exceeded its size of {self.size}: {current}")
 
-            frontier.add(current)
             yield current.element
             current = current.prev
 
@@ -155,13 +612,13 @@ class DoublyLinkedList(Generic[T]):
             assert self.trailer.prev is not None
             return self.trailer.prev.element
 
-    def add_first(self, element: T) -> None:
+    def add_first(self, element: T) -> DoubleNode[T]:
         assert self.header.next is not None
-        self.add_between(element, self.header, self.header.next)
+        return self.add_between(element, self.header, self.header.next)
 
-    def add_last(self, element: T) -> None:
+    def add_last(self, element: T) -> DoubleNode[T]:
         assert self.trailer.prev is not None
-        self.add_between(element, self.trailer.prev, self.trailer)
+        return self.add_between(element, self.trailer.prev, self.trailer)
 
     def remove_first(self) -> T | None:
         if not self.is_empty():
@@ -173,11 +630,15 @@ class DoublyLinkedList(Generic[T]):
             assert self.trailer.prev is not None
             return self.remove(self.trailer.prev)
 
-    def add_between(self, element: T, prev: DoubleNode[T], next: DoubleNode[T]) -> None:
+    def add_between(
+        self, element: T, prev: DoubleNode[T], next: DoubleNode[T]
+    ) -> DoubleNode[T]:
         new = DoubleNode(element, prev, next)
         prev.next = new
         next.prev = new
         self.size += 1
+        self.finger = None
+        return new
 
     def remove(self, node: DoubleNode[T]) -> T:
         assert node.prev is not None, "cannot remove the header sentinel"
@@ -185,8 +646,334 @@ class DoublyLinkedList(Generic[T]):
         node.prev.next = node.next
         node.next.prev = node.prev
         self.size -= 1
+        self.finger = None
         return node.element
 
+    def move_to_first(self, node: DoubleNode[T]) -> None:
+        assert self.header.next is not None
+        if node is not self.header.next:
+            self._relink(node, self.header, self.header.next)
+
+    def move_to_last(self, node: DoubleNode[T]) -> None:
+        assert self.trailer.prev is not None
+        if node is not self.trailer.prev:
+            self._relink(node, self.trailer.prev, self.trailer)
+
+    def insert(self, i: int, element: T) -> None:
+        # Out of range indices are clamped, same as list.insert()
+        if i < 0:
+            i = max(i + self.size, 0)
+        if i >= self.size:
+            self.add_last(element)
+            return
+
+        next = self._node_at(i)
+        assert next.prev is not None
+        self.add_between(element, next.prev, next)
+        self.finger = (i, next.prev)
+
+    def pop(self, i: int = -1) -> T:
+        if self.is_empty():
+            raise IndexError("pop from empty list")
+
+        i = self._check_index(i)
+        node = self._node_at(i)
+        next = node.next
+        element = self.remove(node)
+        if i < self.size:
+            assert next is not None
+            self.finger = (i, next)
+
+        return element
+
+    def extend(self, iterable: Iterable[T], /) -> None:
+        # Link the new chain behind a temporary sentinel so the list itself
+        # is only touched once, and is left as-is if the iterable raises
+        sentinel: DoubleNode[T] = DoubleNode(None, None, None)  # type: ignore
+        last = sentinel
+        count = 0
+        for element in iterable:
+            node = DoubleNode(element, last, None)
+            last.next = node
+            last = node
+            count += 1
+
+        if count == 0:
+            return
+
+        assert sentinel.next is not None and self.trailer.prev is not None
+        self._link_chain(sentinel.next, last, self.trailer.prev, self.trailer)
+        self.size += count
+
+    def extend_left(self, iterable: Iterable[T], /) -> None:
+        # Equivalent to calling add_first() for each element,
+        # so the elements end up in reverse order
+        sentinel: DoubleNode[T] = DoubleNode(None, None, None)  # type: ignore
+        first = sentinel
+        count = 0
+        for element in iterable:
+            node = DoubleNode(element, None, first)
+            first.prev = node
+            first = node
+            count += 1
+
+        if count == 0:
+            return
+
+        assert sentinel.prev is not None and self.header.next is not None
+        self._link_chain(first, sentinel.prev, self.header, self.header.next)
+        self.size += count
+        self.finger = None
+
+    def sort(
+        self, key: Callable[[T], Any] | None = None, reverse: bool = False
+    ) -> None:
+        # Stable like list.sort(), but relinks the existing nodes in place
+        if self.size < 2:
+            return
+
+        size = self.size
+        head = self._detach_chain()
+        self._attach_chain(_sort_nodes(head, key, reverse), size)
+
+    def merge_sorted(
+        self,
+        other: DoublyLinkedList[T],
+        key: Callable[[T], Any] | None = None,
+        reverse: bool = False,
+    ) -> None:
+        # Merge another list sorted the same way in O(n + m), leaving it
+        # empty. Equal elements from this list stay ahead of the other's.
+        if other is self:
+            raise ValueError("Cannot merge a list into itself")
+        elif other.is_empty():
+            return
+
+        size = self.size + other.size
+        a, b = self._detach_chain(), other._detach_chain()
+        head = b if a is None else _merge_nodes(a, b, key, reverse)
+        self._attach_chain(head, size)
+
+    def _attributes(self) -> dict[str, Any]:
+        # Everything but the nodes, such as a per-instance validate flag or a
+        # subclass's own fields, which copies and pickles carry across
+        return {
+            k: v
+            for k, v in vars(self).items()
+            if k not in ("header", "trailer", "size", "finger")
+        }
+
+    def _empty(self, attributes: dict[str, Any]) -> Self:
+        # A new empty list of the same type, built without calling __init__()
+        L = type(self).__new__(type(self))
+        L._reset()
+        vars(L).update(attributes)
+        return L
+
+    def _relink(
+        self, node: DoubleNode[T], prev: DoubleNode[T], next: DoubleNode[T]
+    ) -> None:
+        # Move a node between two adjacent nodes without reallocating it
+        assert node.prev is not None, "cannot move the header sentinel"
+        assert node.next is not None, "cannot move the trailer sentinel"
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev, node.next = prev, next
+        prev.next = node
+        next.prev = node
+        self.finger = None
+
+    def _link_chain(
+        self,
+        first: DoubleNode[T],
+        last: DoubleNode[T],
+        prev: DoubleNode[T],
+        next: DoubleNode[T],
+    ) -> None:
+        # Link the chain first..last between two adjacent nodes in O(1)
+        first.prev, last.next = prev, next
+        prev.next = first
+        next.prev = last
+
+    def _detach_chain(self) -> DoubleNode[T] | None:
+        # Unlink the nodes as a chain ending in None, leaving the list empty
+        if self.is_empty():
+            return None
+
+        first, last = self.header.next, self.trailer.prev
+        assert first is not None and last is not None
+        last.next = None
+        self.header.next = self.trailer
+        self.trailer.prev = self.header
+        self.size = 0
+        self.finger = None
+        return first
+
+    def _attach_chain(self, head: DoubleNode[T] | None, count: int) -> None:
+        # Link a chain from _detach_chain() into this empty list,
+        # rebuilding the prev pointers that sorting and merging ignore
+        prev = self.header
+        current = head
+        while current is not None:
+            current.prev = prev
+            prev.next = current
+            prev = current
+            current = current.next
+
+        prev.next = self.trailer
+        self.trailer.prev = prev
+        self.size = count
+
+    def _check_index(self, i: int) -> int:
+        j = i + self.size if i < 0 else i
+        if not 0 <= j < self.size:
+            raise IndexError(f"Index {i} out of range")
+        return j
+
+    def _node_at(self, j: int) -> DoubleNode[T]:
+        # Walk from whichever of the header, trailer or finger is closest
+        node: DoubleNode[T] = self.header
+        k = -1
+        if self.size - j < j + 1:
+            node, k = self.trailer, self.size
+        if self.finger is not None and abs(self.finger[0] - j) < abs(k - j):
+            k, node = self.finger
+
+        while k < j:
+            node = node.next  # type: ignore
+            k += 1
+        while k > j:
+            node = node.prev  # type: ignore
+            k -= 1
+
+        self.finger = (j, node)
+        return node
+
+
+# Merge sort helpers shared by both lists. They only follow and rewrite next
+# pointers, on chains of nodes that end in None rather than a sentinel.
+
+
+def _ordering(reverse: bool, *, keyed: bool) -> Callable[[Any, Any], bool]:
+    # before(a, b) is whether node a must come before node b. Equal elements
+    # never are, which keeps the sort stable in either direction. Only < is
+    # used, as in list.sort(). Keyed nodes come from _decorate().
+    if keyed:
+        if reverse:
+            return lambda a, b: b.element[0] < a.element[0]
+        return lambda a, b: a.element[0] < b.element[0]
+
+    if reverse:
+        return lambda a, b: b.element < a.element
+    return lambda a, b: a.element < b.element
+
+
+def _decorate(head: Any, key: Callable[[Any], Any]) -> Any:
+    # A new chain of (key, node) pairs, so that key is called once per node
+    # like list.sort(), rather than on every comparison
+    sentinel = tail = SingleNode[Any](None, None)
+    node = head
+    while node is not None:
+        pair = SingleNode((key(node.element), node), None)
+        tail.next = pair
+        tail = pair
+        node = node.next
+    return sentinel.next
+
+
+def _undecorate(head: Any) -> Any:
+    # Relink the original nodes in the order of a chain from _decorate()
+    sentinel = tail = SingleNode[Any](None, None)
+    while head is not None:
+        node = head.element[1]
+        tail.next = node
+        tail = node
+        head = head.next
+    tail.next = None
+    return sentinel.next
+
+
+def _sort_nodes(head: Any, key: Callable[[Any], Any] | None, reverse: bool) -> Any:
+    # Sort a chain ending in None by element, or by key if there is one
+    if key is None:
+        return _sort_chain(head, _ordering(reverse, keyed=False))
+    before = _ordering(reverse, keyed=True)
+    return _undecorate(_sort_chain(_decorate(head, key), before))
+
+
+def _merge_nodes(
+    a: Any, b: Any, key: Callable[[Any], Any] | None, reverse: bool
+) -> Any:
+    # Merge two sorted chains ending in None, like _sort_nodes()
+    if key is None:
+        return _merge_chains(a, b, _ordering(reverse, keyed=False))
+    before = _ordering(reverse, keyed=True)
+    return _undecorate(_merge_chains(_decorate(a, key), _decorate(b, key), before))
+
+
+def _merge_chains(a: Any, b: Any, before: Callable[[Any, Any], bool]) -> Any:
+    # Stable merge of two sorted chains, taking from a on ties
+    sentinel = tail = SingleNode[Any](None, None)
+    while a is not None and b is not None:
+        if before(b, a):
+            tail.next = b
+            tail, b = b, b.next
+        else:
+            tail.next = a
+            tail, a = a, a.next
+
+    tail.next = a if a is not None else b
+    return sentinel.next
+
+
+def _take_run(head: Any, before: Callable[[Any, Any], bool]) -> tuple[Any, Any]:
+    # Cut the longest sorted run off the front of the chain, returning it
+    # and the rest. Strictly descending runs are reversed as they're taken,
+    # so input sorted either way needs no merging at all.
+    next = head.next
+    if next is not None and before(next, head):
+        run, rest = head, next
+        run.next = None
+        while rest is not None and before(rest, run):
+            next = rest.next
+            rest.next = run
+            run, rest = rest, next
+        return run, rest
+
+    current = head
+    while next is not None and not before(next, current):
+        current, next = next, next.next
+
+    current.next = None
+    return head, next
+
+
+def _sort_chain(head: Any, before: Callable[[Any, Any], bool]) -> Any:
+    # Bottom-up natural merge sort. Runs are merged like carries in a binary
+    # counter, so bins[i] holds a merge of 2**i runs or is empty, and at most
+    # log2(runs) + 1 partial results exist at once. Higher bins always hold
+    # earlier elements, so they're passed to _merge_chains() first.
+    bins: list[Any] = []
+    rest = head
+    while rest is not None:
+        run, rest = _take_run(rest, before)
+        i = 0
+        while i < len(bins) and bins[i] is not None:
+            run = _merge_chains(bins[i], run, before)
+            bins[i] = None
+            i += 1
+
+        if i == len(bins):
+            bins.append(run)
+        else:
+            bins[i] = run
+
+    result = None
+    for run in bins:
+        if run is not None:
+            result = run if result is None else _merge_chains(run, result, before)
+    return result
+
 
 def main() -> None:
     slist = SinglyLinkedList[str]()
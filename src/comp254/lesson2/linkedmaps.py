@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from collections.abc import MutableMapping, MutableSet
+from typing import Hashable, Iterable, Iterator, Mapping, TypeVar
+
+from .linkedlists import DoubleNode, DoublyLinkedList
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LinkedHashMap(MutableMapping[K, V]):
+    # A dict that keeps its (key, value) pairs in a DoublyLinkedList, in
+    # insertion order. The index maps each key to its node, so removing or
+    # moving a key is O(1) instead of a scan. Reassigning a key keeps its place.
+    def __init__(self, items: Mapping[K, V] | Iterable[tuple[K, V]] = ()) -> None:
+        self.entries = DoublyLinkedList[tuple[K, V]]()
+        self.index: dict[K, DoubleNode[tuple[K, V]]] = {}
+        self.update(items)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} size={len(self)}>"
+
+    def __str__(self) -> str:
+        return f"{{{', '.join(f'{k!r}: {v!r}' for k, v in self.entries)}}}"
+
+    def __getitem__(self, key: K) -> V:
+        return self.index[key].element[1]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        node = self.index.get(key)
+        if node is None:
+            self.index[key] = self.entries.add_last((key, value))
+        else:
+            node.element = (key, value)
+
+    def __delitem__(self, key: K) -> None:
+        self.entries.remove(self.index.pop(key))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.index
+
+    def __iter__(self) -> Iterator[K]:
+        for key, _ in self.entries:
+            yield key
+
+    def __reversed__(self) -> Iterator[K]:
+        for key, _ in reversed(self.entries):
+            yield key
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def remove(self, key: K) -> V:
+        return self.entries.remove(self.index.pop(key))[1]
+
+    def move_to_end(self, key: K) -> None:
+        self.entries.move_to_last(self.index[key])
+
+    def move_to_front(self, key: K) -> None:
+        self.entries.move_to_first(self.index[key])
+
+    def popitem(self, last: bool = True) -> tuple[K, V]:
+        # Same as OrderedDict.popitem(), taking the newest pair by default
+        if not self.index:
+            raise KeyError("popitem(): dictionary is empty")
+
+        node = self.entries.trailer.prev if last else self.entries.header.next
+        assert node is not None
+        key, value = self.entries.remove(node)
+        del self.index[key]
+        return key, value
+
+    def clear(self) -> None:
+        self.entries = DoublyLinkedList()
+        self.index.clear()
+
+
+class LinkedHashSet(MutableSet[K]):
+    # The set counterpart of LinkedHashMap. Adding a key that's already
+    # present leaves it where it is, so this can dedupe a stream of work
+    # items while keeping the order each was first seen in.
+    def __init__(self, keys: Iterable[K] = ()) -> None:
+        self.entries = DoublyLinkedList[K]()
+        self.index: dict[K, DoubleNode[K]] = {}
+        for key in keys:
+            self.add(key)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} size={len(self)}>"
+
+    def __str__(self) -> str:
+        return f"{{{', '.join(map(repr, self.entries))}}}"
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.index
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self.entries)
+
+    def __reversed__(self) -> Iterator[K]:
+        return reversed(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def add(self, key: K) -> None:
+        if key not in self.index:
+            self.index[key] = self.entries.add_last(key)
+
+    def discard(self, key: K) -> None:
+        node = self.index.pop(key, None)
+        if node is not None:
+            self.entries.remove(node)
+
+    def remove(self, key: K) -> None:
+        self.entries.remove(self.index.pop(key))
+
+    def move_to_end(self, key: K) -> None:
+        self.entries.move_to_last(self.index[key])
+
+    def move_to_front(self, key: K) -> None:
+        self.entries.move_to_first(self.index[key])
+
+    def pop(self, last: bool = False) -> K:
+        # Takes the oldest key by default, so the set can act as a queue
+        if not self.index:
+            raise KeyError("pop from an empty set")
+
+        node = self.entries.trailer.prev if last else self.entries.header.next
+        assert node is not None
+        key = self.entries.remove(node)
+        del self.index[key]
+        return key
+
+    def clear(self) -> None:
+        self.entries = DoublyLinkedList()
+        self.index.clear()
+
+
+def main() -> None:
+    seen = LinkedHashSet[str](["MSP", "ATL", "MSP", "BOS", "LAX"])
+    print(seen)
+    seen.move_to_front("BOS")
+    seen.remove("ATL")
+    print(seen, list(reversed(seen)))
+
+    fares = LinkedHashMap[str, int]([("MSP", 120), ("ATL", 95), ("BOS", 180)])
+    fares["ATL"] = 90
+    fares.move_to_end("MSP")
+    print(fares)
+    print(fares.popitem(last=False), fares.remove("BOS"), fares)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike, NDArray
+
+# Vectorized helpers for lists of numbers. Each one copies the elements into
+# a NumPy array in a single pass, then does the arithmetic in NumPy instead of
+# a Python-level loop. Any iterable works, but a `size` attribute like the
+# comp254 lists have lets the array be allocated up front.
+#
+# NumPy is always installed as a dependency of bokeh, but it's only imported
+# once one of these is called, so importing comp254 doesn't pay for it.
+
+
+def numpy() -> ModuleType:
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is required for this, reinstall comp254 to get it with bokeh"
+        ) from e
+    return numpy
+
+
+def to_numpy(elements: Iterable[Any], dtype: DTypeLike | None = None) -> NDArray[Any]:
+    np = numpy()
+    if dtype is None:
+        # Let NumPy infer the dtype, which needs every element up front
+        return np.array(list(elements))
+
+    count = getattr(elements, "size", -1)
+    return np.fromiter(elements, dtype=dtype, count=count)
+
+
+def array_sum(elements: Iterable[Any], dtype: DTypeLike | None = None) -> Any:
+    return to_numpy(elements, dtype).sum().item()
+
+
+def array_min(elements: Iterable[Any], dtype: DTypeLike | None = None) -> Any:
+    array = to_numpy(elements, dtype)
+    if array.size == 0:
+        raise ValueError("array_min() arg is an empty sequence")
+    return array.min().item()
+
+
+def array_max(elements: Iterable[Any], dtype: DTypeLike | None = None) -> Any:
+    array = to_numpy(elements, dtype)
+    if array.size == 0:
+        raise ValueError("array_max() arg is an empty sequence")
+    return array.max().item()
+
+
+def array_mean(elements: Iterable[Any], dtype: DTypeLike | None = None) -> float:
+    array = to_numpy(elements, dtype)
+    if array.size == 0:
+        raise ValueError("array_mean() arg is an empty sequence")
+    return array.mean().item()
+
+
+def prefix_sums(
+    elements: Iterable[Any], dtype: DTypeLike | None = None
+) -> NDArray[Any]:
+    # prefix_sums(L)[i] is the sum of the first i + 1 elements
+    return to_numpy(elements, dtype).cumsum()
+
+
+def main() -> None:
+    from .linkedlists import DoublyLinkedList
+
+    dlist = DoublyLinkedList.from_iterable([3, 1, 4, 1, 5, 9, 2, 6])
+    print(to_numpy(dlist), to_numpy(dlist, float).dtype)
+    print(array_sum(dlist), array_min(dlist), array_max(dlist), array_mean(dlist))
+    print(prefix_sums(dlist))
+
+
+if __name__ == "__main__":
+    main()
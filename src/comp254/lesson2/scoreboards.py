@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+import math
+from array import array
+from itertools import islice
+from operator import neg
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Self
+
+from . import numeric
+from .arrays import GameEntry
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+class HeapScoreboard:
+    # Behaves like Scoreboard, but the entries are kept in a min-heap so the
+    # lowest score, which is the next to be evicted, is always at the root.
+    # add() is O(log capacity). remove() and reading the board in order need
+    # a sorted copy of the heap instead, so they're O(capacity log capacity).
+    #
+    # Each heap item is (score, -insertion count, entry). Among equal scores,
+    # the most recently added entry is then the smallest item, so ties are
+    # ranked and evicted in the same order as Scoreboard.
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.heap: list[tuple[int, int, GameEntry]] = []
+        self.added = 0
+
+    @classmethod
+    def from_stream(cls, capacity: int, entries: Iterable[GameEntry]) -> Self:
+        scoreboard = cls(capacity)
+        scoreboard.add_many(entries)
+        return scoreboard
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} capacity={self.capacity} "
+            f"num_entries={self.num_entries}>"
+        )
+
+    def __str__(self) -> str:
+        return f"[{', '.join(map(str, self.board))}]"
+
+    def __iter__(self) -> Iterator[GameEntry]:
+        # Entries from highest to lowest score
+        for _, _, entry in sorted(self.heap, reverse=True):
+            yield entry
+
+    @property
+    def num_entries(self) -> int:
+        return len(self.heap)
+
+    @property
+    def board(self) -> list[GameEntry | None]:
+        # The same padded layout as Scoreboard.board, built on demand
+        board: list[GameEntry | None] = list(self)
+        board.extend([None] * (self.capacity - len(board)))
+        return board
+
+    def add(self, new: GameEntry, /) -> None:
+        item = (new.score, -self.added, new)
+        self.added += 1
+
+        if len(self.heap) < self.capacity:
+            heapq.heappush(self.heap, item)
+        elif self.heap and new.score > self.heap[0][0]:
+            # Is the new entry really a high score? Then evict the lowest one
+            heapq.heapreplace(self.heap, item)
+
+    def add_many(self, entries: Iterable[GameEntry], /) -> None:
+        # Same as calling add() for each entry, with the lookups hoisted
+        heap, capacity, added = self.heap, self.capacity, self.added
+        for new in entries:
+            if len(heap) < capacity:
+                heapq.heappush(heap, (new.score, -added, new))
+            elif heap and new.score > heap[0][0]:
+                heapq.heapreplace(heap, (new.score, -added, new))
+            added += 1
+
+        self.added = added
+
+    def remove(self, i: int, /) -> GameEntry:
+        if not 0 <= i < len(self.heap):
+            raise IndexError(f"Index {i} out of range")
+
+        item = heapq.nlargest(i + 1, self.heap)[-1]
+        j = self.heap.index(item)
+        last = self.heap.pop()
+        if j < len(self.heap):
+            self.heap[j] = last
+            heapq.heapify(self.heap)
+
+        return item[2]
+
+
+class ColumnarScoreboard:
+    # Behaves like Scoreboard, but stores the board as two columns instead of
+    # a list of GameEntry tuples: the scores in an int64 array, and each
+    # name as a uint32 id into a table of distinct names. That's 12 bytes per
+    # entry, and GameEntry objects are only created when the board is read.
+    # Inserting and removing shift the later entries, unlike Scoreboard's
+    # skip lists, but it's a memmove over the arrays.
+    #
+    # Names that fall off the board stay in the table until it holds more
+    # than twice as many names as entries. It's then rebuilt from the board,
+    # so the table is O(capacity) and the rebuilds are amortized O(1).
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.scores = array("q")
+        self.name_ids = array("I")
+        self.names: list[str] = []
+        self.name_index: dict[str, int] = {}
+
+    @classmethod
+    def from_stream(cls, capacity: int, entries: Iterable[GameEntry]) -> Self:
+        scoreboard = cls(capacity)
+        scoreboard.add_many(entries)
+        return scoreboard
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} capacity={self.capacity} "
+            f"num_entries={self.num_entries} names={len(self.names)}>"
+        )
+
+    def __str__(self) -> str:
+        return f"[{', '.join(map(str, self.board))}]"
+
+    def __getitem__(self, i: int) -> GameEntry:
+        if not 0 <= i < len(self.scores):
+            raise IndexError(f"Index {i} out of range")
+        return GameEntry(self.names[self.name_ids[i]], self.scores[i])
+
+    def __iter__(self) -> Iterator[GameEntry]:
+        # Entries from highest to lowest score
+        names = self.names
+        for name_id, score in zip(self.name_ids, self.scores):
+            yield GameEntry(names[name_id], score)
+
+    @property
+    def num_entries(self) -> int:
+        return len(self.scores)
+
+    @property
+    def board(self) -> list[GameEntry | None]:
+        # The same padded layout as Scoreboard.board, built on demand
+        board: list[GameEntry | None] = list(self)
+        board.extend([None] * (self.capacity - len(board)))
+        return board
+
+    def add(self, new: GameEntry, /) -> None:
+        scores = self.scores
+
+        # Is the new entry really a high score?
+        if len(scores) >= self.capacity:
+            if not scores or new.score <= scores[-1]:
+                return
+            scores.pop()
+            self.name_ids.pop()
+
+        # Place it after any equal scores, like Scoreboard.add()
+        i = bisect.bisect_right(scores, -new.score, key=neg)
+        scores.insert(i, new.score)
+        self.name_ids.insert(i, self._name_id(new.name))
+        self._compact_names()
+
+    def add_many(self, entries: Iterable[GameEntry], /) -> None:
+        # Same result as calling add() for each entry. The stream is read in
+        # chunks of at least the capacity, and each chunk is merged with the
+        # board by picking the top scores out of both in one pass, so memory
+        # stays O(capacity). nlargest() is stable, so ties keep the existing
+        # entries first, then the stream's order.
+        if self.capacity == 0:
+            return
+
+        entries = iter(entries)
+        chunk_size = max(self.capacity, 4096)
+        while chunk := list(islice(entries, chunk_size)):
+            n = len(self.scores)
+            scores = self.scores + array("q", [entry.score for entry in chunk])
+
+            top = heapq.nlargest(
+                self.capacity, range(len(scores)), key=scores.__getitem__
+            )
+            self.scores = array("q", map(scores.__getitem__, top))
+            # Only names that made it onto the board are added to the table
+            self.name_ids = array(
+                "I",
+                [
+                    self.name_ids[i] if i < n else self._name_id(chunk[i - n].name)
+                    for i in top
+                ],
+            )
+            self._compact_names()
+
+    def remove(self, i: int, /) -> GameEntry:
+        entry = self[i]
+        del self.scores[i]
+        del self.name_ids[i]
+        self._compact_names()
+        return entry
+
+    def rank_of(self, score: int) -> int:
+        # The number of entries scoring at least as high, same as Scoreboard
+        return bisect.bisect_right(self.scores, -score, key=neg)
+
+    def score_at_rank(self, k: int) -> int:
+        if not 0 <= k < len(self.scores):
+            raise IndexError(f"Rank {k} out of range")
+        return self.scores[k]
+
+    def percentile(self, p: float) -> int:
+        # The lowest score that at least p% of entries are at or below,
+        # using the nearest-rank method, same as Scoreboard
+        if not 0 <= p <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, not {p}")
+        elif not self.scores:
+            raise ValueError("Cannot take a percentile of an empty scoreboard")
+
+        k = max(math.ceil(p / 100 * len(self.scores)), 1)
+        return self.scores[len(self.scores) - k]
+
+    def count_between(self, lo: int, hi: int) -> int:
+        # The number of entries where lo <= score < hi
+        return max(self.rank_of(lo) - self.rank_of(hi), 0)
+
+    def to_numpy(self) -> NDArray[Any]:
+        # A copy of the scores column, highest first, for vectorized scans.
+        # A view would stop the array from being resized while it's alive.
+        np = numeric.numpy()
+        return np.frombuffer(self.scores, dtype=np.int64).copy()
+
+    def _name_id(self, name: str) -> int:
+        name_id = self.name_index.get(name)
+        if name_id is None:
+            name_id = self.name_index[name] = len(self.names)
+            self.names.append(name)
+        return name_id
+
+    def _compact_names(self) -> None:
+        if len(self.names) <= 2 * len(self.name_ids):
+            return
+
+        # Renumber the names still on the board in the order they appear
+        names, old_names = [], self.names
+        name_index: dict[str, int] = {}
+        name_ids = array("I")
+        for name_id in self.name_ids:
+            name = old_names[name_id]
+            new_id = name_index.get(name)
+            if new_id is None:
+                new_id = name_index[name] = len(names)
+                names.append(name)
+            name_ids.append(new_id)
+
+        self.names, self.name_index, self.name_ids = names, name_index, name_ids
+
+
+def main() -> None:
+    names = ["Rob", "Mike", "Rose", "Jill", "Jack", "Anna", "Paul", "Bob"]
+    scores = [750, 1105, 590, 740, 510, 660, 720, 400]
+    for scoreboard in (HeapScoreboard(5), ColumnarScoreboard(5)):
+        for name, score in zip(names, scores):
+            scoreboard.add(GameEntry(name, score))
+        print(repr(scoreboard), scoreboard)
+
+        for i in (3, 0, 1, 0):
+            print(f"Removing score at index {i}: {scoreboard.remove(i)}")
+        print(scoreboard)
+
+
+if __name__ == "__main__":
+    main()
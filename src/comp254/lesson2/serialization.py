@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import Iterable
+
+# Layout: MAGIC, a one-byte type code, the element count as a little-endian
+# uint64, then the payload. Ints and floats are packed as int64 and float64.
+# Strings are a uint64 byte length per string followed by their UTF-8 bytes.
+MAGIC = b"C254"
+HEADER = struct.Struct("<4scQ")
+
+ARRAY_CODES: dict[type, bytes] = {int: b"q", float: b"d"}
+STRING_CODE = b"s"
+
+
+def dump_elements(elements: Iterable[int | float | str]) -> bytes:
+    items = list(elements)
+    types = set(map(type, items))
+    if len(types) > 1:
+        names = ", ".join(sorted(t.__name__ for t in types))
+        raise TypeError(f"Elements must all be the same type, got {names}")
+
+    t = types.pop() if types else int
+    if t in ARRAY_CODES:
+        code = ARRAY_CODES[t]
+        payload = to_little_endian(array(code.decode(), items))  # type: ignore
+        return HEADER.pack(MAGIC, code, len(items)) + payload.tobytes()
+    elif t is str:
+        encoded = [s.encode() for s in items]  # type: ignore
+        lengths = to_little_endian(array("Q", map(len, encoded)))
+        header = HEADER.pack(MAGIC, STRING_CODE, len(items))
+        return header + lengths.tobytes() + b"".join(encoded)
+
+    raise TypeError(f"Cannot dump elements of type {t.__name__}")
+
+
+def load_elements(data: bytes) -> list[int] | list[float] | list[str]:
+    if len(data) < HEADER.size:
+        raise ValueError("Data is too short for a dump_elements() header")
+
+    magic, code, count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Data was not created by dump_elements()")
+
+    offset = HEADER.size
+    if code in ARRAY_CODES.values():
+        elements = array(code.decode())
+        check_length(data, offset + count * elements.itemsize)
+        elements.frombytes(data[offset : offset + count * elements.itemsize])
+        return to_little_endian(elements).tolist()
+    elif code == STRING_CODE:
+        lengths = array("Q")
+        check_length(data, offset + count * lengths.itemsize)
+        lengths.frombytes(data[offset : offset + count * lengths.itemsize])
+        offset += count * lengths.itemsize
+        to_little_endian(lengths)
+        check_length(data, offset + sum(lengths))
+
+        strings: list[str] = []
+        for n in lengths:
+            strings.append(data[offset : offset + n].decode())
+            offset += n
+        return strings
+
+    raise ValueError(f"Unknown type code {code!r}")
+
+
+def check_length(data: bytes, expected: int) -> None:
+    # Slicing past the end silently returns fewer bytes, so a truncated
+    # payload would otherwise load as fewer or shorter elements
+    if len(data) < expected:
+        raise ValueError(
+            f"Data is truncated: expected {expected} bytes, got {len(data)}"
+        )
+
+
+def to_little_endian(a: array) -> array:
+    # Swapping is its own inverse, so this also converts back to native order
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import contextlib
+import heapq
+import multiprocessing
+import os
+import threading
+from itertools import islice
+from multiprocessing.connection import Connection
+from typing import Iterable, Self
+
+from .arrays import GameEntry, Scoreboard, by_score
+from .serialization import dump_elements, load_elements
+
+# Entries are sent to the workers in batches of this many, which keeps the
+# per-message overhead of the pipes small without buffering much
+BATCH_SIZE = 8192
+
+# Commands from the parent process to a shard. ADD is followed by a batch,
+# and BOARD asks the shard to reply with its board. STOP is needed because
+# forked workers inherit each other's pipes, so closing the parent's end
+# doesn't reliably reach a worker as EOF.
+ADD = b"A"
+BOARD = b"B"
+STOP = b"S"
+
+
+def send_entries(conn: Connection, entries: list[GameEntry]) -> None:
+    # A batch is sent as two columns in the dump_elements() format, so it's
+    # a couple of byte strings instead of a pickle per GameEntry
+    conn.send_bytes(dump_elements([entry.score for entry in entries]))
+    conn.send_bytes(dump_elements([entry.name for entry in entries]))
+
+
+def recv_entries(conn: Connection) -> list[GameEntry]:
+    scores = load_elements(conn.recv_bytes())
+    names = load_elements(conn.recv_bytes())
+    return list(map(GameEntry, names, scores))  # type: ignore
+
+
+def run_shard(conn: Connection, capacity: int) -> None:
+    # The worker process, which keeps the top entries of its share of the
+    # input until it's told to stop or the parent goes away
+    scoreboard = Scoreboard(capacity)
+    try:
+        while (command := conn.recv_bytes()) != STOP:
+            if command == ADD:
+                scoreboard.add_many(recv_entries(conn))
+            elif command == BOARD:
+                entries = scoreboard.board[: scoreboard.num_entries]
+                send_entries(conn, entries)  # type: ignore
+            else:
+                raise ValueError(f"Unknown command {command!r}")
+    except EOFError:
+        pass
+    finally:
+        conn.close()
+
+
+class ShardedScoreboard:
+    # A Scoreboard fed by several worker processes. Each batch of entries goes
+    # to the next shard in turn, and every shard keeps its own top `capacity`
+    # entries. The global top entries are always among those, so merge() only
+    # needs a k-way merge of the shards' boards, which are already sorted.
+    #
+    # The scores on the merged board are the same as a single Scoreboard's,
+    # but ties from different shards are ordered by shard rather than by when
+    # they were added. With merge_interval set, a background thread also
+    # merges every that many seconds, so `merged` is never more stale than
+    # that. Call close(), or use a with block, to stop the workers.
+    def __init__(
+        self,
+        capacity: int,
+        workers: int | None = None,
+        *,
+        merge_interval: float | None = None,
+    ) -> None:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f"workers must be positive, not {workers}")
+
+        self.capacity = capacity
+        self.merged = Scoreboard(capacity)
+        # Once a merged board is full, entries scoring no higher than its
+        # lowest can never make the board, so they aren't sent at all
+        self.cutoff: int | None = None
+        self.pending: list[GameEntry] = []
+        self.next_shard = 0
+        # Held while talking to the shards, which the merge thread also does
+        self.lock = threading.Lock()
+
+        self.stopped = threading.Event()
+        self.merge_thread: threading.Thread | None = None
+        # Set if a background merge fails, and raised again by close()
+        self.merge_error: Exception | None = None
+
+        self.conns: list[Connection] = []
+        self.processes: list[multiprocessing.Process] = []
+        try:
+            for _ in range(workers):
+                conn, child_conn = multiprocessing.Pipe()
+                self.conns.append(conn)
+                process = multiprocessing.Process(
+                    target=run_shard, args=(child_conn, capacity), daemon=True
+                )
+                try:
+                    process.start()
+                finally:
+                    child_conn.close()
+                self.processes.append(process)
+        except BaseException:
+            # Don't leave the workers that did start running
+            self.close()
+            raise
+
+        if merge_interval is not None:
+            self.merge_thread = threading.Thread(
+                target=self._merge_every, args=(merge_interval,), daemon=True
+            )
+            self.merge_thread.start()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} capacity={self.capacity} "
+            f"workers={len(self.processes)} num_entries={self.num_entries}>"
+        )
+
+    def __str__(self) -> str:
+        return str(self.merged)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def num_entries(self) -> int:
+        # As of the last merge
+        return self.merged.num_entries
+
+    @property
+    def board(self) -> list[GameEntry | None]:
+        # As of the last merge
+        return self.merged.board
+
+    def add(self, new: GameEntry, /) -> None:
+        self.pending.append(new)
+        if len(self.pending) >= BATCH_SIZE:
+            self.flush()
+
+    def add_many(self, entries: Iterable[GameEntry], /) -> None:
+        entries = iter(entries)
+        self.pending.extend(islice(entries, BATCH_SIZE - len(self.pending)))
+        while len(self.pending) >= BATCH_SIZE:
+            self.flush()
+            self.pending.extend(islice(entries, BATCH_SIZE))
+
+    def flush(self) -> None:
+        # Send any buffered entries to the next shard
+        batch, self.pending = self.pending, []
+        if (cutoff := self.cutoff) is not None:
+            batch = [entry for entry in batch if entry.score > cutoff]
+        if not batch:
+            return
+
+        with self.lock:
+            conn = self.conns[self.next_shard]
+            conn.send_bytes(ADD)
+            send_entries(conn, batch)
+        self.next_shard = (self.next_shard + 1) % len(self.conns)
+
+    def merge(self) -> Scoreboard:
+        # Flush, then replace `merged` with the current global top entries
+        self.flush()
+        return self._merge_shards()
+
+    def close(self) -> None:
+        # Stops the workers, discarding anything that hasn't been merged.
+        # Raises the error that stopped the background merges, if any.
+        self.stopped.set()
+        if self.merge_thread is not None:
+            self.merge_thread.join()
+
+        with self.lock:
+            for conn in self.conns:
+                if not conn.closed:
+                    # The worker may already be gone if it crashed
+                    with contextlib.suppress(OSError):
+                        conn.send_bytes(STOP)
+                    conn.close()
+        for process in self.processes:
+            process.join()
+
+        if (error := self.merge_error) is not None:
+            self.merge_error = None
+            raise RuntimeError("A background merge failed") from error
+
+    def _merge_shards(self) -> Scoreboard:
+        with self.lock:
+            for conn in self.conns:
+                conn.send_bytes(BOARD)
+            shards = [recv_entries(conn) for conn in self.conns]
+
+        merged = Scoreboard(self.capacity)
+        top = heapq.merge(*shards, key=by_score, reverse=True)
+        merged.add_many(islice(top, self.capacity))
+        self.merged = merged
+
+        lowest = merged.board[-1] if merged.board else None
+        if lowest is not None:
+            self.cutoff = lowest.score
+        return merged
+
+    def _merge_every(self, interval: float) -> None:
+        # Only merges what's been flushed, since `pending` belongs to
+        # whichever thread is adding entries
+        try:
+            while not self.stopped.wait(interval):
+                self._merge_shards()
+        except Exception as error:  # noqa: BLE001 - close() raises it again
+            self.merge_error = error
+
+
+def main() -> None:
+    names = ["Rob", "Mike", "Rose", "Jill", "Jack", "Anna", "Paul", "Bob"]
+    scores = [750, 1105, 590, 740, 510, 660, 720, 400]
+    with ShardedScoreboard(5, workers=2) as scoreboard:
+        for name, score in zip(names, scores):
+            scoreboard.add(GameEntry(name, score))
+            scoreboard.flush()  # spread this tiny input across both shards
+        print(scoreboard.merge())
+        print(repr(scoreboard))
+
+
+if __name__ == "__main__":
+    main()
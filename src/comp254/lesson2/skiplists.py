@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import operator
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Iterable, Iterator, Self, TypeVar
+
+from .linkedlists import SingleNode
+
+T = TypeVar("T")
+
+
+@dataclass(eq=False, slots=True)  # identity-based hashing and comparisons
+class SkipNode(SingleNode[T]):
+    # next is the bottom level, so the nodes still form an ordinary chain of
+    # SingleNodes. skips[i] is the next node with a tower at least i+2 high,
+    # and widths[i] is how many nodes along the bottom level it is, counting
+    # to one past the last node when skips[i] is None.
+    skips: list[SkipNode[T] | None]
+    widths: list[int]
+
+
+def identity(x: Any) -> Any:
+    return x
+
+
+# Tower heights only need to be random, not independent between lists, so
+# unseeded lists share one generator. Seeding a new random.Random from the
+# OS costs more than building a small list.
+SHARED_RNG = random.Random()
+
+
+class SortedSkipList(Generic[T]):
+    def __init__(
+        self,
+        key: Callable[[T], Any] | None = None,
+        *,
+        max_level: int = 32,
+        seed: int | None = None,
+    ) -> None:
+        self.key = identity if key is None else key
+        self.max_level = max_level
+        self.rng = SHARED_RNG if seed is None else random.Random(seed)
+        self._reset()
+
+    def _reset(self) -> None:
+        # Calling SkipNode unsubscripted skips typing's generic alias
+        self.header: SkipNode[T] = SkipNode(
+            None,  # type: ignore
+            None,
+            [None] * (self.max_level - 1),
+            [1] * (self.max_level - 1),
+        )
+        self.tail: SkipNode[T] | None = None
+        self.level = 0  # the number of skip levels currently in use
+        self.size = 0
+
+    @classmethod
+    def from_iterable(
+        cls,
+        iterable: Iterable[T],
+        key: Callable[[T], Any] | None = None,
+    ) -> Self:
+        L = cls(key)
+        for element in iterable:
+            L.add(element)
+        return L
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Store elements as one flat list, since pickling the nodes themselves
+        # recurses once per node and overflows the stack on long lists
+        attributes = {
+            k: v
+            for k, v in vars(self).items()
+            if k not in ("header", "tail", "level", "size")
+        }
+        if attributes["rng"] is SHARED_RNG:
+            del attributes["rng"]
+        return {"elements": list(self), "attributes": attributes}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Never calls __init__(), which a subclass may give required arguments
+        vars(self).update({"rng": SHARED_RNG, **state["attributes"]})
+        self._reset()
+        for element in state["elements"]:
+            self.add(element)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} level={self.level} size={self.size}>"
+
+    def __str__(self) -> str:
+        return f"[{', '.join(map(repr, self))}]"
+
+    def __iter__(self) -> Iterator[T]:
+        steps = 0
+        current = self.header.next
+        while current is not None:
+            steps += 1
+            if steps > self.size:
+                raise RuntimeError(f"List exceeded its size of {self.size}: {current}")
+
+            yield current.element
+            current = current.next
+
+    def __getitem__(self, i: int) -> T:
+        # O(log n) by skipping over whole widths at each level
+        _, _, prev = self._find_position(self._check_index(i))
+        assert prev.next is not None
+        return prev.next.element
+
+    def __contains__(self, element: T) -> bool:
+        k = self.key(element)
+        current = self._predecessor(k).next
+        while current is not None and self.key(current.element) == k:
+            if current.element == element:
+                return True
+            current = current.next
+        return False
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def first(self) -> T | None:
+        if self.header.next is not None:
+            return self.header.next.element
+
+    def last(self) -> T | None:
+        if self.tail is not None:
+            return self.tail.element
+
+    def find(self, key: Any) -> T | None:
+        current = self._predecessor(key).next
+        if current is not None and self.key(current.element) == key:
+            return current.element
+
+    def irange(self, lo: Any = None, hi: Any = None) -> Iterator[T]:
+        # Lazily yield every element where lo <= key < hi,
+        # with None leaving that end of the range unbounded
+        current = self.header.next if lo is None else self._predecessor(lo).next
+        while current is not None:
+            if hi is not None and not self.key(current.element) < hi:
+                return
+            yield current.element
+            current = current.next
+
+    def add(self, element: T) -> None:
+        # Equal keys are inserted after existing ones so insertion order is kept
+        k = self.key(element)
+        update, ranks = self._find_update(k, after_equal=True)
+        height = self._random_height()
+        if height > self.level:
+            for lvl in range(self.level, height):
+                update[lvl], ranks[lvl] = self.header, 0
+                self.header.widths[lvl] = self.size + 1
+            self.level = height
+
+        prev, rank = self._walk_bottom(update[0], ranks[0], k, after_equal=True)
+        new = SkipNode(element, prev.next, [None] * height, [0] * height)
+        prev.next = new
+        for lvl in range(height):
+            # Split the width that used to span the new node's position
+            u = update[lvl]
+            new.skips[lvl] = u.skips[lvl]
+            u.skips[lvl] = new
+            new.widths[lvl] = ranks[lvl] + u.widths[lvl] - rank
+            u.widths[lvl] = rank + 1 - ranks[lvl]
+        for lvl in range(height, self.level):
+            update[lvl].widths[lvl] += 1
+
+        if new.next is None:
+            self.tail = new
+        self.size += 1
+
+    def remove(self, element: T) -> None:
+        k = self.key(element)
+        update, ranks = self._find_update(k, after_equal=False)
+        prev, rank = self._walk_bottom(update[0], ranks[0], k, after_equal=False)
+
+        # Several elements may share the key, so find the one that's equal
+        target: SkipNode[T] | None = prev.next  # type: ignore
+        while target is not None and self.key(target.element) == k:
+            if target.element == element:
+                break
+            prev, target = target, target.next  # type: ignore
+            rank += 1
+        else:
+            raise ValueError(f"{element!r} not in list")
+
+        assert target is not None
+        self._unlink(update, ranks, prev, rank)
+
+    def remove_first(self) -> T | None:
+        first = self.header.next
+        if first is not None:
+            self.pop(0)
+            return first.element
+
+    def pop(self, i: int = -1) -> T:
+        if self.is_empty():
+            raise IndexError("pop from empty list")
+
+        j = self._check_index(i)
+        update, ranks, prev = self._find_position(j)
+        assert prev.next is not None
+        element = prev.next.element
+        self._unlink(update, ranks, prev, j)
+        return element
+
+    def index(self, element: T) -> int:
+        # The position of the first element equal to this one
+        k = self.key(element)
+        start = self.bisect_left(k)
+        for i, other in enumerate(self.irange(k), start):
+            if self.key(other) != k:
+                break
+            elif other == element:
+                return i
+        raise ValueError(f"{element!r} not in list")
+
+    def bisect_left(self, key: Any) -> int:
+        # The number of elements with a key less than the given key
+        update, ranks = self._find_update(key, after_equal=False)
+        return self._walk_bottom(update[0], ranks[0], key, after_equal=False)[1]
+
+    def bisect_right(self, key: Any) -> int:
+        # The number of elements with a key less than or equal to the given key
+        update, ranks = self._find_update(key, after_equal=True)
+        return self._walk_bottom(update[0], ranks[0], key, after_equal=True)[1]
+
+    def _predecessor(self, key: Any) -> SkipNode[T]:
+        # The last node with a key less than the given key
+        update, ranks = self._find_update(key, after_equal=False)
+        return self._walk_bottom(update[0], ranks[0], key, after_equal=False)[0]
+
+    def _find_update(
+        self, key: Any, *, after_equal: bool
+    ) -> tuple[list[SkipNode[T]], list[int]]:
+        # For each skip level, the last node before the key's position and
+        # how many nodes along the bottom level it is, where the header is 0
+        key_of = self.key
+        before = operator.le if after_equal else operator.lt
+        update = [self.header] * self.max_level
+        ranks = [0] * self.max_level
+        node = self.header
+        rank = 0
+        for lvl in reversed(range(self.level)):
+            next = node.skips[lvl]
+            while next is not None and before(key_of(next.element), key):
+                rank += node.widths[lvl]
+                node = next
+                next = node.skips[lvl]
+            update[lvl] = node
+            ranks[lvl] = rank
+        return update, ranks
+
+    def _walk_bottom(
+        self, node: SkipNode[T], rank: int, key: Any, *, after_equal: bool
+    ) -> tuple[SkipNode[T], int]:
+        key_of = self.key
+        before = operator.le if after_equal else operator.lt
+        next: SkipNode[T] | None = node.next  # type: ignore
+        while next is not None and before(key_of(next.element), key):
+            node = next
+            next = node.next  # type: ignore
+            rank += 1
+        return node, rank
+
+    def _find_position(
+        self, j: int
+    ) -> tuple[list[SkipNode[T]], list[int], SkipNode[T]]:
+        # Like _find_update(), but for the node at index j, which is j + 1
+        # nodes along the bottom level. Also returns the node before it.
+        update = [self.header] * self.max_level
+        ranks = [0] * self.max_level
+        node = self.header
+        rank = 0
+        for lvl in reversed(range(self.level)):
+            while (next := node.skips[lvl]) is not None and rank + node.widths[
+                lvl
+            ] <= j:
+                rank += node.widths[lvl]
+                node = next
+            update[lvl] = node
+            ranks[lvl] = rank
+        while rank < j:
+            node = node.next  # type: ignore
+            rank += 1
+        return update, ranks, node  # type: ignore
+
+    def _unlink(
+        self, update: list[SkipNode[T]], ranks: list[int], prev: SkipNode[T], rank: int
+    ) -> None:
+        # Remove the node after prev, which is `rank` nodes along the bottom
+        # level. update[lvl] can be any node on that level before it.
+        target: SkipNode[T] = prev.next  # type: ignore
+        prev.next = target.next
+        position = rank + 1
+        for lvl in range(self.level):
+            # Find the node whose width at this level spans the target
+            p, r = update[lvl], ranks[lvl]
+            while (next := p.skips[lvl]) is not None and r + p.widths[lvl] < position:
+                r += p.widths[lvl]
+                p = next
+
+            if p.skips[lvl] is target:
+                p.widths[lvl] += target.widths[lvl] - 1
+                p.skips[lvl] = target.skips[lvl]
+            else:
+                p.widths[lvl] -= 1
+
+        while self.level > 0 and self.header.skips[self.level - 1] is None:
+            self.level -= 1
+
+        if self.tail is target:
+            self.tail = None if prev is self.header else prev
+        self.size -= 1
+
+    def _check_index(self, i: int) -> int:
+        j = i + self.size if i < 0 else i
+        if not 0 <= j < self.size:
+            raise IndexError(f"Index {i} out of range")
+        return j
+
+    def _random_height(self) -> int:
+        # Each extra level is kept with probability 1/2
+        height = 0
+        bits = self.rng.getrandbits(self.max_level - 1)
+        while bits & 1:
+            height += 1
+            bits >>= 1
+        return height
+
+
+def main() -> None:
+    slist = SortedSkipList[str](seed=254)
+    for code in ["MSP", "ATL", "BOS", "LAX", "JFK", "DFW"]:
+        slist.add(code)
+    print(slist)
+    print(list(slist.irange("B", "L")))
+    slist.remove("BOS")
+    print(slist)
+    print(repr(slist))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import Generic, Iterable, Iterator, Self, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(eq=False, slots=True)  # identity-based hashing and comparisons
+class UnrolledNode(Generic[T]):
+    elements: list[T]
+    prev: UnrolledNode[T] | None
+    next: UnrolledNode[T] | None
+
+    def __str__(self) -> str:
+        return f"{self.elements}"
+
+
+class UnrolledLinkedList(Generic[T]):
+    # Like DoublyLinkedList, except each node holds up to `capacity` elements.
+    # Full nodes are split in half on insertion, and sparse neighbours are
+    # merged on removal so the list doesn't degrade into one element per node.
+    def __init__(self, capacity: int = 64) -> None:
+        if capacity < 2:
+            raise ValueError(f"Capacity must be at least 2, not {capacity}")
+
+        self.capacity = capacity
+        self.header = UnrolledNode[T]([], None, None)
+        self.trailer = UnrolledNode[T]([], self.header, None)
+        self.header.next = self.trailer
+        self.size = 0
+        # The (start index, node) last located by position. Only changes at
+        # the front of the list or removing that node can shift its index.
+        self.finger: tuple[int, UnrolledNode[T]] | None = None
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T], capacity: int = 64) -> Self:
+        L = cls(capacity)
+        L.extend(iterable)
+        return L
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} capacity={self.capacity} size={self.size}>"
+
+    def __str__(self) -> str:
+        return f"[{', '.join(map(repr, self))}]"
+
+    def __getitem__(self, i: int) -> T:
+        node, k = self._locate(self._check_index(i))
+        return node.elements[k]
+
+    def __setitem__(self, i: int, element: T) -> None:
+        node, k = self._locate(self._check_index(i))
+        node.elements[k] = element
+
+    def __iter__(self) -> Iterator[T]:
+        # Let chain() unpack each node so only nodes cost a Python-level step
+        return chain.from_iterable(self._iter_chunks())
+
+    def __reversed__(self) -> Iterator[T]:
+        steps = 0
+        current = self.trailer.prev
+        while current is not None and current.prev is not None:
+            steps += 1
+            if steps > self.size:
+                raise RuntimeError(f"List exceeded its size of {self.size}: {current}")
+
+            yield from reversed(current.elements)
+            current = current.prev
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def first(self) -> T | None:
+        if not self.is_empty():
+            assert self.header.next is not None
+            return self.header.next.elements[0]
+
+    def last(self) -> T | None:
+        if not self.is_empty():
+            assert self.trailer.prev is not None
+            return self.trailer.prev.elements[-1]
+
+    def add_first(self, element: T) -> None:
+        node = self.header.next
+        assert node is not None
+        if node is self.trailer or len(node.elements) >= self.capacity:
+            node = self._add_node_between(self.header, node)
+
+        node.elements.insert(0, element)
+        self.size += 1
+        self.finger = None
+
+    def add_last(self, element: T) -> None:
+        node = self.trailer.prev
+        assert node is not None
+        if node is self.header or len(node.elements) >= self.capacity:
+            node = self._add_node_between(node, self.trailer)
+
+        node.elements.append(element)
+        self.size += 1
+
+    def remove_first(self) -> T | None:
+        if self.is_empty():
+            return
+
+        node = self.header.next
+        assert node is not None
+        element = node.elements.pop(0)
+        self.size -= 1
+        self.finger = None
+        if not node.elements:
+            self._remove_node(node)
+        return element
+
+    def remove_last(self) -> T | None:
+        if self.is_empty():
+            return
+
+        node = self.trailer.prev
+        assert node is not None
+        element = node.elements.pop()
+        self.size -= 1
+        if not node.elements:
+            self._remove_node(node)
+        return element
+
+    def insert(self, i: int, element: T) -> None:
+        # Out of range indices are clamped, same as list.insert()
+        if i < 0:
+            i = max(i + self.size, 0)
+        if i >= self.size:
+            return self.add_last(element)
+
+        node, k = self._locate(i)
+        if len(node.elements) >= self.capacity:
+            # Split the full node in half, moving the upper half into a new node
+            assert node.next is not None
+            half = len(node.elements) // 2
+            new = self._add_node_between(node, node.next)
+            new.elements = node.elements[half:]
+            del node.elements[half:]
+            if k > half:
+                node, k = new, k - half
+
+        node.elements.insert(k, element)
+        self.size += 1
+
+    def pop(self, i: int = -1) -> T:
+        if self.is_empty():
+            raise IndexError("pop from empty list")
+
+        node, k = self._locate(self._check_index(i))
+        element = node.elements.pop(k)
+        self.size -= 1
+
+        if not node.elements:
+            self._remove_node(node)
+        else:
+            # Merge with the next node if both are less than half full
+            next = node.next
+            assert next is not None
+            if (
+                next is not self.trailer
+                and len(node.elements) + len(next.elements) <= self.capacity // 2
+            ):
+                node.elements.extend(next.elements)
+                self._remove_node(next)
+
+        return element
+
+    def extend(self, iterable: Iterable[T], /) -> None:
+        # Take enough elements to top up the last node, then fill fresh nodes
+        # one chunk at a time behind a temporary sentinel. The list is only
+        # touched once the iterable is exhausted, so it's left as-is if the
+        # iterable raises.
+        iterator = iter(iterable)
+        last = self.trailer.prev
+        assert last is not None
+        room = 0 if last is self.header else self.capacity - len(last.elements)
+        top_up = list(islice(iterator, room))
+
+        sentinel = tail = UnrolledNode[T]([], None, None)
+        count = len(top_up)
+        while chunk := list(islice(iterator, self.capacity)):
+            node = UnrolledNode(chunk, tail, None)
+            tail.next = node
+            tail = node
+            count += len(chunk)
+
+        last.elements.extend(top_up)
+        if sentinel.next is not None:
+            self._link_chain(sentinel.next, tail, last, self.trailer)
+        self.size += count
+
+    def extend_left(self, iterable: Iterable[T], /) -> None:
+        # Equivalent to calling add_first() for each element,
+        # so the elements end up in reverse order
+        iterator = iter(iterable)
+        sentinel = head = UnrolledNode[T]([], None, None)
+        count = 0
+        while chunk := list(islice(iterator, self.capacity)):
+            chunk.reverse()
+            node = UnrolledNode(chunk, None, head)
+            head.prev = node
+            head = node
+            count += len(chunk)
+
+        if sentinel.prev is not None:
+            assert self.header.next is not None
+            self._link_chain(head, sentinel.prev, self.header, self.header.next)
+            self.size += count
+            self.finger = None
+
+    def _iter_chunks(self) -> Iterator[list[T]]:
+        # Every node holds at least one element, so there can't be
+        # more nodes than the list's size
+        steps = 0
+        current = self.header.next
+        while current is not None and current.next is not None:
+            steps += 1
+            if steps > self.size:
+                raise RuntimeError(f"List exceeded its size of {self.size}: {current}")
+
+            yield current.elements
+            current = current.next
+
+    def _check_index(self, i: int) -> int:
+        j = i + self.size if i < 0 else i
+        if not 0 <= j < self.size:
+            raise IndexError(f"Index {i} out of range")
+        return j
+
+    def _locate(self, j: int) -> tuple[UnrolledNode[T], int]:
+        # Start from whichever of the first node, last node or finger is
+        # closest, then skip a whole node at a time
+        node: UnrolledNode[T] = self.header.next  # type: ignore
+        start = 0
+        if self.size - j < j:
+            node = self.trailer.prev  # type: ignore
+            start = self.size - len(node.elements)
+        if self.finger is not None and abs(self.finger[0] - j) < min(j, self.size - j):
+            start, node = self.finger
+
+        while j < start:
+            node = node.prev  # type: ignore
+            start -= len(node.elements)
+        while j >= start + len(node.elements):
+            start += len(node.elements)
+            node = node.next  # type: ignore
+
+        self.finger = (start, node)
+        return node, j - start
+
+    def _add_node_between(
+        self, prev: UnrolledNode[T], next: UnrolledNode[T]
+    ) -> UnrolledNode[T]:
+        new = UnrolledNode([], prev, next)
+        prev.next = new
+        next.prev = new
+        return new
+
+    def _link_chain(
+        self,
+        first: UnrolledNode[T],
+        last: UnrolledNode[T],
+        prev: UnrolledNode[T],
+        next: UnrolledNode[T],
+    ) -> None:
+        # Link the nodes first..last between two adjacent nodes in O(1)
+        first.prev, last.next = prev, next
+        prev.next = first
+        next.prev = last
+
+    def _remove_node(self, node: UnrolledNode[T]) -> None:
+        assert node.prev is not None, "cannot remove the header sentinel"
+        assert node.next is not None, "cannot remove the trailer sentinel"
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        if self.finger is not None and self.finger[1] is node:
+            self.finger = None
+
+
+def main() -> None:
+    ulist = UnrolledLinkedList[str](capacity=2)
+    ulist.add_first("MSP")
+    ulist.add_last("ATL")
+    ulist.add_last("BOS")
+    ulist.add_first("LAX")
+    print(ulist)
+    ulist.insert(2, "JFK")
+    print(ulist)
+    ulist.remove_first()
+    ulist.remove_last()
+    print(ulist)
+
+
+if __name__ == "__main__":
+    main()
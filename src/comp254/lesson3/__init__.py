@@ -2,3 +2,11 @@ from .linkedlists import (
     CircularlyLinkedList as CircularlyLinkedList,
     CircularNode as CircularNode,
 )
+from .queues import (
+    LinkedLifoQueue as LinkedLifoQueue,
+    LinkedQueue as LinkedQueue,
+    RoundRobinQueue as RoundRobinQueue,
+)
+from .schedulers import (
+    WeightedRoundRobin as WeightedRoundRobin,
+)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
-from typing import Final, Generic, Iterator, TypeVar
+from typing import TYPE_CHECKING, Any, Final, Generic, Iterable, Iterator, Self, TypeVar
+
+from ..lesson2 import numeric
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike, NDArray
 
 T = TypeVar("T")
 
 
-@dataclass(eq=False)  # identity-based hashing and comparisons
+@dataclass(eq=False, slots=True)  # identity-based hashing and comparisons
 class CircularNode(Generic[T]):
     element: Final[T]
     next: CircularNode[T]
@@ -17,9 +23,66 @@ class CircularNode(Generic[T]):
 
 class CircularlyLinkedList(Generic[T]):
     def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
         self.tail: CircularNode[T] | None = None
         self.size = 0
 
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T]) -> Self:
+        L = cls()
+        L.extend(iterable)
+        return L
+
+    @classmethod
+    def from_numpy(cls, array: NDArray[Any]) -> Self:
+        # tolist() converts every NumPy scalar to a Python number in C
+        return cls.from_iterable(array.tolist())
+
+    def to_numpy(self, dtype: DTypeLike | None = None) -> NDArray[Any]:
+        return numeric.to_numpy(self, dtype)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Store elements as one flat list, since pickling the nodes themselves
+        # recurses once per node and overflows the stack on long lists
+        return {"elements": list(self), "attributes": self._attributes()}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Never calls __init__(), which a subclass may give required arguments
+        self._reset()
+        vars(self).update(state.get("attributes", {}))
+        self.extend(state["elements"])
+
+    def __copy__(self) -> Self:
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        L = self._empty({})
+        memo[id(self)] = L
+        vars(L).update(copy.deepcopy(self._attributes(), memo))
+        L.extend(copy.deepcopy(element, memo) for element in self)
+        return L
+
+    def copy(self) -> Self:
+        # Shallow copy, linking the new nodes inline in a single pass
+        L = self._empty(self._attributes())
+        if self.tail is None:
+            return L
+
+        head = self.tail.next
+        tail = new_head = CircularNode(head.element, None)  # type: ignore
+        current = head.next
+        while current is not head:
+            node = CircularNode(current.element, None)  # type: ignore
+            tail.next = node
+            tail = node
+            current = current.next
+
+        tail.next = new_head
+        L.tail, L.size = tail, self.size
+        return L
+
     def __repr__(self) -> str:
         return f"<{type(self).__name__} tail={self.tail} size={self.size}>"
 
@@ -51,9 +114,17 @@ class CircularlyLinkedList(Generic[T]):
             assert self.tail is not None
             return self.tail.element
 
-    def rotate(self) -> None:
-        if self.tail is not None:
-            self.tail = self.tail.next
+    def rotate(self, k: int = 1) -> None:
+        # Move the first k elements to the back. Since k is reduced modulo
+        # the size, this walks at most n - 1 nodes and negative k rotates
+        # the other way.
+        if self.tail is None:
+            return
+
+        tail = self.tail
+        for _ in range(k % self.size):
+            tail = tail.next
+        self.tail = tail
 
     def add_first(self, element: T) -> None:
         if self.is_empty():
@@ -85,6 +156,130 @@ class CircularlyLinkedList(Generic[T]):
         self.size -= 1
         return head.element
 
+    def extend(self, iterable: Iterable[T], /) -> None:
+        # Link the new chain behind a temporary sentinel
+        # so the list itself is only touched once
+        sentinel = tail = CircularNode[T](None, None)  # type: ignore
+        count = 0
+        for element in iterable:
+            node = CircularNode(element, None)  # type: ignore
+            tail.next = node
+            tail = node
+            count += 1
+
+        if count == 0:
+            return
+
+        if self.tail is None:
+            tail.next = sentinel.next
+        else:
+            tail.next = self.tail.next
+            self.tail.next = sentinel.next
+
+        self.tail = tail
+        self.size += count
+
+    def extend_left(self, iterable: Iterable[T], /) -> None:
+        # Equivalent to calling add_first() for each element,
+        # so the elements end up in reverse order
+        head: CircularNode[T] | None = None
+        tail: CircularNode[T] | None = None
+        count = 0
+        for element in iterable:
+            head = CircularNode(element, head)  # type: ignore
+            if tail is None:
+                tail = head
+            count += 1
+
+        if head is None or tail is None:
+            return
+
+        if self.tail is None:
+            tail.next = head
+            self.tail = tail
+        else:
+            tail.next = self.tail.next
+            self.tail.next = head
+
+        self.size += count
+
+    def splice(self, other: CircularlyLinkedList[T]) -> None:
+        # Steal every node from the other list in O(1), leaving it empty.
+        # Both rings are cut open at their tails and joined into one.
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        elif other.tail is None:
+            return
+
+        if self.tail is not None:
+            head = self.tail.next
+            self.tail.next = other.tail.next
+            other.tail.next = head
+
+        self.tail = other.tail
+        self.size += other.size
+
+        other.tail = None
+        other.size = 0
+
+    def split_after(self, node: CircularNode[T]) -> Self:
+        # Walk from the head to find the node's index k, which is O(k) and
+        # rules out nodes that belong to some other ring
+        if self.tail is not None:
+            current = self.tail.next
+            for k in range(self.size):
+                if current is node:
+                    return self._detach_after(node, self.size - k - 1)
+                current = current.next
+
+        raise ValueError("Node is not in this list")
+
+    def split_at(self, k: int) -> Self:
+        # Keep the first k elements and move the rest into a new list in O(k)
+        if not 0 <= k <= self.size:
+            raise IndexError(f"Index {k} out of range")
+        elif k == 0:
+            new = self._empty(self._attributes())
+            new.splice(self)
+            return new
+
+        assert self.tail is not None
+        node = self.tail
+        for _ in range(k):
+            node = node.next
+
+        return self._detach_after(node, self.size - k)
+
+    def _attributes(self) -> dict[str, Any]:
+        # Everything but the nodes, such as a subclass's own fields,
+        # which copies and pickles carry across
+        return {k: v for k, v in vars(self).items() if k not in ("tail", "size")}
+
+    def _empty(self, attributes: dict[str, Any]) -> Self:
+        # A new empty list of the same type, built without calling __init__()
+        L = type(self).__new__(type(self))
+        L._reset()
+        vars(L).update(attributes)
+        return L
+
+    def _detach_after(self, node: CircularNode[T], count: int) -> Self:
+        new = self._empty(self._attributes())
+        if count == 0:
+            return new
+
+        assert self.tail is not None
+        head = self.tail.next
+
+        # Close each half back into its own ring
+        new.tail = self.tail
+        new.tail.next = node.next
+        new.size = count
+
+        node.next = head
+        self.tail = node
+        self.size -= count
+        return new
+
 
 def main() -> None:
     clist = CircularlyLinkedList[str]()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Generic, Hashable, Iterable, TypeVar
+
+from ..lesson2 import DoublyLinkedList
+from .linkedlists import CircularlyLinkedList
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LinkedQueue(asyncio.Queue[T], Generic[T]):
+    # An asyncio.Queue stored in a DoublyLinkedList. put() and get() keep
+    # asyncio's backpressure when maxsize is set, and the *_many() methods
+    # move several items per call so consumers don't pay one await per item.
+    _queue: DoublyLinkedList[T]
+
+    def _init(self, maxsize: int) -> None:
+        self._queue = DoublyLinkedList()
+
+    def _put(self, item: T) -> None:
+        self._queue.add_last(item)
+
+    def _get(self) -> T:
+        return self._queue.remove_first()  # type: ignore
+
+    def qsize(self) -> int:
+        return self._queue.size
+
+    def empty(self) -> bool:
+        return self._queue.is_empty()
+
+    def put_many_nowait(self, items: Iterable[T]) -> None:
+        # Either every item fits or none of them are added
+        items = list(items)
+        if self.maxsize > 0 and self.qsize() + len(items) > self.maxsize:
+            raise asyncio.QueueFull
+
+        for item in items:
+            self.put_nowait(item)
+
+    async def get_many(self, n: int) -> list[T]:
+        # Wait for at least one item, then drain up to n without yielding
+        if n < 1:
+            raise ValueError(f"n must be at least 1, not {n}")
+
+        items = [await self.get()]
+        while len(items) < n and not self.empty():
+            items.append(self.get_nowait())
+        return items
+
+    def get_many_nowait(self, n: int) -> list[T]:
+        items: list[T] = []
+        while len(items) < n and not self.empty():
+            items.append(self.get_nowait())
+        return items
+
+
+class LinkedLifoQueue(LinkedQueue[T]):
+    def _get(self) -> T:
+        return self._queue.remove_last()  # type: ignore
+
+
+class RoundRobinQueue(LinkedQueue[tuple[K, V]]):
+    # Items are (key, value) pairs. get() takes one value from each key in
+    # turn, so a key with a large backlog can't starve the others. The keys
+    # with pending values form a CircularlyLinkedList that rotates per get().
+    _keys: CircularlyLinkedList[K]
+    _pending: dict[K, DoublyLinkedList[V]]
+    _size: int
+
+    def _init(self, maxsize: int) -> None:
+        self._keys = CircularlyLinkedList()
+        self._pending = {}
+        self._size = 0
+
+    def _put(self, item: tuple[K, V]) -> None:
+        key, value = item
+        values = self._pending.get(key)
+        if values is None:
+            values = self._pending[key] = DoublyLinkedList()
+            self._keys.add_last(key)
+
+        values.add_last(value)
+        self._size += 1
+
+    def _get(self) -> tuple[K, V]:
+        key: K = self._keys.first()  # type: ignore
+        values = self._pending[key]
+        value: V = values.remove_first()  # type: ignore
+        if values.is_empty():
+            del self._pending[key]
+            self._keys.remove_first()
+        else:
+            self._keys.rotate()
+
+        self._size -= 1
+        return key, value
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+
+async def _demo() -> None:
+    queue = RoundRobinQueue[str, int](maxsize=8)
+    queue.put_many_nowait([("a", 1), ("a", 2), ("a", 3), ("b", 1), ("c", 1)])
+    print(await queue.get_many(4))
+    print(queue.get_many_nowait(4))
+
+
+def main() -> None:
+    asyncio.run(_demo())
+
+
+if __name__ == "__main__":
+    main()
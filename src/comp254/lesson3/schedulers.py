@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import Generic, Hashable, TypeVar
+
+from .linkedlists import CircularlyLinkedList
+
+T = TypeVar("T", bound=Hashable)
+
+
+class WeightedRoundRobin(Generic[T]):
+    # Each tenant gets `weight` consecutive turns before the ring rotates to
+    # the next one. Turns are handed out as (tenant, count) grants so that
+    # a batch costs one step per tenant visited rather than one per turn.
+    def __init__(self) -> None:
+        self.ring = CircularlyLinkedList[T]()
+        self.weights: dict[T, int] = {}
+        self.credit = 0  # turns left for the tenant at the front of the ring
+        # Removed tenants stay in the ring until they reach the front, where
+        # they can be dropped in O(1). This counts those leftover nodes.
+        self.stale: dict[T, int] = {}
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} size={self.size}>"
+
+    @property
+    def size(self) -> int:
+        return len(self.weights)
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def add(self, tenant: T, weight: int = 1) -> None:
+        if tenant in self.weights:
+            raise ValueError(f"Tenant already added: {tenant!r}")
+        elif weight < 1:
+            raise ValueError(f"Weight must be at least 1, not {weight}")
+
+        self.weights[tenant] = weight
+        self.ring.add_last(tenant)
+
+    def remove(self, tenant: T) -> None:
+        del self.weights[tenant]
+        self.stale[tenant] = self.stale.get(tenant, 0) + 1
+
+    def set_weight(self, tenant: T, weight: int) -> None:
+        # Takes effect the next time the tenant reaches the front
+        if tenant not in self.weights:
+            raise KeyError(tenant)
+        elif weight < 1:
+            raise ValueError(f"Weight must be at least 1, not {weight}")
+
+        self.weights[tenant] = weight
+
+    def skip(self, k: int = 1) -> None:
+        # Forfeit the current tenant's remaining turns and move k tenants on
+        self.credit = 0
+        self.ring.rotate(k)
+
+    def next_batch(self, n: int) -> list[tuple[T, int]]:
+        # Hand out up to n turns, or fewer if there are no tenants
+        ring, weights, stale = self.ring, self.weights, self.stale
+        grants: list[tuple[T, int]] = []
+        while n > 0 and weights:
+            tenant: T = ring.first()  # type: ignore
+            if tenant in stale:
+                self._drop_front(tenant)
+                continue
+
+            if self.credit == 0:
+                self.credit = weights[tenant]
+
+            turns = min(self.credit, n)
+            grants.append((tenant, turns))
+            n -= turns
+            self.credit -= turns
+            if self.credit == 0:
+                ring.rotate()
+
+        return grants
+
+    def _drop_front(self, tenant: T) -> None:
+        self.ring.remove_first()
+        self.credit = 0
+        self.stale[tenant] -= 1
+        if self.stale[tenant] == 0:
+            del self.stale[tenant]
+
+
+def main() -> None:
+    scheduler = WeightedRoundRobin[str]()
+    scheduler.add("a", 3)
+    scheduler.add("b", 1)
+    scheduler.add("c", 2)
+    print(scheduler.next_batch(4))
+    print(scheduler.next_batch(4))
+    scheduler.remove("a")
+    print(scheduler.next_batch(6))
+
+
+if __name__ == "__main__":
+    main()
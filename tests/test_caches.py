@@ -0,0 +1,124 @@
+import pytest
+
+from comp254 import Cache, CacheStats, LFUCache, LRUCache, memoize
+
+
+def test_lru_cache() -> None:
+    cache = LRUCache[str, int](maxsize=3)
+    for i, key in enumerate("abc"):
+        cache.put(key, i)
+    assert cache.get("a") == 0
+    assert cache.get("z") is None
+    assert cache.get("z", -1) == -1
+
+    cache.put("d", 3)  # evicts b, the least recently used
+    assert list(cache) == ["c", "a", "d"]
+    assert "b" not in cache
+
+    cache.put("c", 20)  # updating counts as a use
+    cache.put("e", 4)
+    assert list(cache) == ["d", "c", "e"]
+    assert cache.stats() == CacheStats(hits=1, misses=2, evictions=2, size=3, nbytes=0)
+
+    assert cache.pop("c") == 20
+    assert cache.pop("c", None) is None
+    with pytest.raises(KeyError):
+        cache.pop("c")
+    cache.clear()
+    assert len(cache) == 0 and cache.evictions == 2
+
+
+def test_cache_maxbytes() -> None:
+    cache = LRUCache[str, bytes](maxsize=None, maxbytes=10, sizeof=len)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    assert cache.nbytes == 8
+
+    cache.put("c", b"12")
+    assert list(cache) == ["a", "b", "c"] and cache.nbytes == 10
+
+    cache.put("a", b"123456")  # growing an entry evicts others to make room
+    assert list(cache) == ["c", "a"] and cache.nbytes == 8
+    assert cache.evictions == 1
+
+    cache.put("a", b"12345678901")  # too large to ever be cached
+    assert list(cache) == ["c"] and cache.nbytes == 2
+
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=-1)
+
+    empty = LRUCache[str, int](maxsize=0)
+    empty.put("a", 1)
+    assert len(empty) == 0
+
+
+def test_lfu_cache() -> None:
+    cache = LFUCache[str, int](maxsize=3)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    for _ in range(3):
+        cache.get("a")
+    cache.get("c")
+    assert [cache.count(k) for k in "abcz"] == [4, 1, 2, 0]
+
+    cache.put("d", 4)  # b has the lowest count
+    assert "b" not in cache
+    cache.put("e", 5)  # d is now the only entry with a count of 1
+    assert "d" not in cache
+    assert list(cache) == ["e", "c", "a"]
+
+    cache.get("e")  # e and c now tie, and c was used longer ago
+    cache.put("f", 6)
+    cache.put("g", 7)
+    assert list(cache) == ["g", "e", "a"]
+    assert cache.evictions == 4
+    assert cache.stats().hit_ratio == 1.0
+
+    cache.clear()
+    assert list(cache) == [] and list(cache.buckets) == []
+
+
+@pytest.mark.parametrize("cls", [LRUCache, LFUCache])
+def test_growing_an_entry_keeps_it(cls: type) -> None:
+    cache = cls(maxsize=None, maxbytes=10, sizeof=len)
+    cache.put("a", b"12345")
+    for _ in range(3):
+        cache.get("a")
+    cache.put("b", b"1")
+
+    # b has the lowest count, but it's a that has to go to make room
+    cache.put("b", b"123456")
+    assert list(cache) == ["b"] and cache.get("b") == b"123456"
+    assert cache.nbytes == 6 and cache.evictions == 1
+
+    cache.put("b", b"1234567890")
+    assert list(cache) == ["b"] and cache.nbytes == 10
+
+
+def test_cache_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        Cache()  # type: ignore
+
+    class Incomplete(Cache[str, int]):
+        def __iter__(self):  # type: ignore
+            return iter(())
+
+    with pytest.raises(TypeError):
+        Incomplete()  # type: ignore
+
+
+def test_memoize() -> None:
+    calls = []
+
+    @memoize(LFUCache(maxsize=16))
+    def add(a: int, b: int = 0) -> int:
+        calls.append((a, b))
+        return a + b
+
+    assert add(1, 2) == add(1, 2) == 3
+    assert add(1, b=2) == 3
+    assert add(1) == add(1) == 1
+    assert calls == [(1, 2), (1, 2), (1, 0)]
+    assert add.__name__ == "add"
+    assert add.cache.stats().hits == 2  # type: ignore
@@ -0,0 +1,159 @@
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable
+
+from comp254 import ConcurrentDeque, DoubleNode
+
+
+def test_deque_matches_dlist_semantics() -> None:
+    deque = ConcurrentDeque[int]()
+    assert deque.is_empty()
+    assert deque.remove_first() is None
+    assert deque.remove_last() is None
+
+    for i in range(5):
+        deque.add_last(i)
+        deque.add_first(-i)
+
+    assert list(deque) == [-4, -3, -2, -1, 0, 0, 1, 2, 3, 4]
+    assert deque.size == 10
+    assert (deque.first(), deque.last()) == (-4, 4)
+
+    assert [deque.remove_first() for _ in range(5)] == [-4, -3, -2, -1, 0]
+    assert [deque.remove_last() for _ in range(5)] == [4, 3, 2, 1, 0]
+    assert deque.is_empty()
+
+
+def test_deque_take_timeout() -> None:
+    deque = ConcurrentDeque[int]()
+    assert deque.take_first(timeout=0.01) is None
+    assert deque.take_last(timeout=0) is None
+
+    timer = threading.Timer(0.05, deque.add_first, args=(1,))
+    timer.start()
+    assert deque.take_last(timeout=5) == 1
+    timer.join()
+
+
+def test_deque_threads() -> None:
+    deque = ConcurrentDeque[int]()
+    n, producers, consumers = 2_000, 4, 4
+    taken: list[list[int | None]] = [[] for _ in range(consumers)]
+
+    def produce(k: int) -> None:
+        for i in range(k * n, (k + 1) * n):
+            if i % 2:
+                deque.add_first(i)
+            else:
+                deque.add_last(i)
+
+    def consume(k: int) -> None:
+        take = deque.take_first if k % 2 else deque.take_last
+        for _ in range(n * producers // consumers):
+            taken[k].append(take(timeout=10))
+
+    threads = [threading.Thread(target=produce, args=(k,)) for k in range(producers)]
+    threads += [threading.Thread(target=consume, args=(k,)) for k in range(consumers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(x for xs in taken for x in xs if x is not None) == list(
+        range(n * producers)
+    )
+    assert deque.is_empty()
+    assert list(deque) == []
+
+
+class YieldingNode(DoubleNode[int]):
+    # The GIL rarely switches threads in the middle of relinking a node, so
+    # sentinels that yield on every write open up the window for races
+    def __setattr__(self, name: str, value: Any) -> None:
+        time.sleep(0)
+        super().__setattr__(name, value)
+
+
+def check_links(deque: ConcurrentDeque[int]) -> list[int]:
+    # With both locks held, the links must agree in both directions
+    # and with the size that the two ends keep between them
+    with deque.head_lock, deque.tail_lock:
+        forward = []
+        node = deque.header
+        while node.next is not None:
+            assert node.next.prev is node
+            node = node.next
+            forward.append(node.element)
+        assert node is deque.trailer
+        forward.pop()  # the trailer's element
+        assert len(forward) == deque.size
+        return forward
+
+
+def test_deque_stress_both_ends() -> None:
+    # Every thread pushes and pops at both ends at random, which keeps the
+    # deque hovering around the size where the ends start sharing locks
+    deque = ConcurrentDeque[int]()
+    deque.header = YieldingNode(None, None, None)  # type: ignore
+    deque.trailer = YieldingNode(None, deque.header, None)  # type: ignore
+    deque.header.next = deque.trailer
+    threads, ops = 6, 2_000
+    pushed: list[list[int]] = [[] for _ in range(threads)]
+    popped: list[list[int]] = [[] for _ in range(threads)]
+    done = threading.Event()
+
+    def work(k: int) -> None:
+        rng = random.Random(k)
+        for i in range(ops):
+            action = rng.randrange(4)
+            if action == 0:
+                deque.add_first(k * ops + i)
+                pushed[k].append(k * ops + i)
+            elif action == 1:
+                deque.add_last(k * ops + i)
+                pushed[k].append(k * ops + i)
+            else:
+                remove = deque.remove_first if action == 2 else deque.remove_last
+                if (element := remove()) is not None:
+                    popped[k].append(element)
+
+    def check() -> None:
+        while not done.is_set():
+            check_links(deque)
+
+    errors: list[Exception] = []
+
+    def run(target: Callable[..., None], *args: Any) -> threading.Thread:
+        # Errors in the threads are collected, so that they fail the test
+        def catch() -> None:
+            try:
+                target(*args)
+            except Exception as error:  # noqa: BLE001 - asserted on below
+                errors.append(error)
+                done.set()
+
+        thread = threading.Thread(target=catch)
+        thread.start()
+        return thread
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        workers = [run(work, k) for k in range(threads)]
+        checker = run(check)
+        for t in workers:
+            t.join()
+        done.set()
+        checker.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert not errors, errors
+    remaining = check_links(deque)
+    all_pushed = Counter(x for xs in pushed for x in xs)
+    all_popped = Counter(x for xs in popped for x in xs)
+    assert all_popped + Counter(remaining) == all_pushed
+    assert max(all_popped.values(), default=1) == 1
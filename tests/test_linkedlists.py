@@ -1,4 +1,20 @@
-from comp254 import CircularlyLinkedList, DoublyLinkedList, SinglyLinkedList
+import copy
+import random
+from typing import Any, Iterator
+
+import pytest
+
+from comp254 import (
+    ArenaDoublyLinkedList,
+    CircularlyLinkedList,
+    CircularNode,
+    DoublyLinkedList,
+    DoubleNode,
+    SinglyLinkedList,
+    SingleNode,
+    SortedSkipList,
+    UnrolledLinkedList,
+)
 
 
 def test_slist_is_empty() -> None:
@@ -137,3 +153,530 @@ def test_clist_first_and_last() -> None:
     clist.remove_first()
     assert clist.first() is None
     assert clist.last() is None
+
+
+def test_nodes_are_slotted() -> None:
+    for node in (
+        SingleNode(1, None),
+        DoubleNode(1, None, None),
+        CircularNode(1, None),  # type: ignore
+    ):
+        assert not hasattr(node, "__dict__")
+
+
+@pytest.mark.parametrize("validate", [False, True])
+def test_slist_iter_detects_cycle(validate: bool) -> None:
+    slist = SinglyLinkedList[int]()
+    slist.validate = validate
+    for i in range(3):
+        slist.add_last(i)
+
+    assert slist.tail is not None
+    slist.tail.next = slist.head
+    with pytest.raises(RuntimeError):
+        list(slist)
+
+
+@pytest.mark.parametrize("validate", [False, True])
+def test_dlist_iter_detects_cycle(validate: bool) -> None:
+    dlist = DoublyLinkedList[int]()
+    dlist.validate = validate
+    for i in range(3):
+        dlist.add_last(i)
+
+    assert dlist.trailer.prev is not None
+    dlist.trailer.prev.next = dlist.header.next
+    with pytest.raises(RuntimeError):
+        list(dlist)
+
+    dlist.header.next.prev = dlist.trailer.prev  # type: ignore
+    with pytest.raises(RuntimeError):
+        list(reversed(dlist))
+
+
+def test_arena_dlist_matches_dlist() -> None:
+    alist = ArenaDoublyLinkedList[int](capacity=1)
+    dlist = DoublyLinkedList[int]()
+    for i in range(10):
+        alist.add_first(i)
+        dlist.add_first(i)
+        alist.add_last(-i)
+        dlist.add_last(-i)
+
+    assert alist.size == dlist.size
+    assert list(alist) == list(dlist)
+    assert list(reversed(alist)) == list(reversed(dlist))
+
+    while not dlist.is_empty():
+        assert alist.first() == dlist.first()
+        assert alist.last() == dlist.last()
+        assert alist.remove_first() == dlist.remove_first()
+        assert alist.remove_last() == dlist.remove_last()
+
+    assert alist.is_empty()
+    assert alist.remove_first() is None
+
+
+def test_arena_dlist_recycles_positions() -> None:
+    alist = ArenaDoublyLinkedList[int](capacity=4)
+    for i in range(4):
+        alist.add_last(i)
+
+    node = alist.next(alist.header)
+    assert alist.remove(node) == 0
+    assert alist.add_between(9, alist.prev(alist.trailer), alist.trailer) == node
+    assert alist.capacity == 4
+    assert list(alist) == [1, 2, 3, 9]
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [SinglyLinkedList, DoublyLinkedList, CircularlyLinkedList, UnrolledLinkedList],
+)
+def test_bulk_extend(cls: type) -> None:
+    L = cls.from_iterable(range(3))
+    assert list(L) == [0, 1, 2]
+    assert L.size == 3
+
+    L.extend([])
+    L.extend_left([])
+    assert list(L) == [0, 1, 2]
+
+    L.extend(range(3, 6))
+    L.extend_left(range(-1, -4, -1))
+    assert list(L) == [-3, -2, -1, 0, 1, 2, 3, 4, 5]
+    assert L.size == 9
+    assert L.first() == -3
+    assert L.last() == 5
+
+    L.extend(L)
+    assert L.size == 18
+    assert list(L) == [-3, -2, -1, 0, 1, 2, 3, 4, 5] * 2
+
+    M = cls()
+    M.extend_left(range(3))
+    assert list(M) == [2, 1, 0]
+    assert M.first() == 2
+    assert M.last() == 0
+    M.add_last(9)
+    assert list(M) == [2, 1, 0, 9]
+
+
+def failing_iterable(n: int) -> Iterator[int]:
+    yield from range(100, 100 + n)
+    raise RuntimeError("iterable failed")
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [SinglyLinkedList, DoublyLinkedList, CircularlyLinkedList, UnrolledLinkedList],
+)
+def test_failed_extend_leaves_list_unchanged(cls: type) -> None:
+    L = cls.from_iterable(range(3))
+    for extend in (L.extend, L.extend_left):
+        with pytest.raises(RuntimeError):
+            extend(failing_iterable(4))
+        assert list(L) == [0, 1, 2]
+        assert L.size == 3
+        assert L.first() == 0 and L.last() == 2
+
+    if isinstance(L, (DoublyLinkedList, UnrolledLinkedList)):
+        assert list(reversed(L)) == [2, 1, 0]
+    L.add_last(3)
+    L.add_first(-1)
+    assert list(L) == [-1, 0, 1, 2, 3]
+
+
+def test_dlist_indexing() -> None:
+    dlist = DoublyLinkedList.from_iterable(range(10))
+    expected = list(range(10))
+    for i in (0, 9, 5, 6, 4, -1, -10, 3, 3, 8):
+        assert dlist[i] == expected[i]
+
+    with pytest.raises(IndexError):
+        dlist[10]
+    with pytest.raises(IndexError):
+        dlist[-11]
+
+    for i in range(10):
+        dlist[i] *= 2
+        expected[i] *= 2
+    assert list(dlist) == expected
+
+    for i, x in [(0, -1), (5, -2), (-1, -3), (100, -4), (-100, -5), (6, -6)]:
+        dlist.insert(i, x)
+        expected.insert(i, x)
+        assert list(dlist) == expected
+        assert list(reversed(dlist)) == expected[::-1]
+
+    for i in (0, -1, 5, 5, 5, -3, 2):
+        assert dlist.pop(i) == expected.pop(i)
+        assert list(dlist) == expected
+        assert list(reversed(dlist)) == expected[::-1]
+        assert dlist.size == len(expected)
+
+    with pytest.raises(IndexError):
+        dlist.pop(100)
+    assert dlist.pop() == expected.pop()
+    assert list(dlist) == expected
+
+    dlist.remove_first()
+    dlist.add_first(42)
+    assert dlist[0] == 42
+
+
+def test_ulist_matches_list() -> None:
+    rng = random.Random(254)
+    ulist = UnrolledLinkedList[int](capacity=4)
+    expected: list[int] = []
+
+    for n in range(500):
+        op = rng.randrange(8)
+        if op == 0:
+            ulist.add_first(n)
+            expected.insert(0, n)
+        elif op == 1:
+            ulist.add_last(n)
+            expected.append(n)
+        elif op == 2:
+            i = rng.randint(-len(expected) - 1, len(expected) + 1)
+            ulist.insert(i, n)
+            expected.insert(i, n)
+        elif op == 3 and expected:
+            i = rng.randrange(-len(expected), len(expected))
+            assert ulist.pop(i) == expected.pop(i)
+        elif op == 4 and expected:
+            assert ulist.remove_first() == expected.pop(0)
+        elif op == 5 and expected:
+            assert ulist.remove_last() == expected.pop()
+        elif op == 6:
+            chunk = list(range(n, n + rng.randrange(10)))
+            ulist.extend(chunk)
+            expected.extend(chunk)
+        elif op == 7:
+            chunk = list(range(n, n + rng.randrange(10)))
+            ulist.extend_left(chunk)
+            expected[:0] = chunk[::-1]
+
+        assert ulist.size == len(expected)
+        assert ulist.first() == (expected[0] if expected else None)
+        assert ulist.last() == (expected[-1] if expected else None)
+
+    assert list(ulist) == expected
+    assert list(reversed(ulist)) == expected[::-1]
+    for i in range(-len(expected), len(expected)):
+        assert ulist[i] == expected[i]
+
+
+def test_skiplist_matches_sorted() -> None:
+    rng = random.Random(254)
+    slist = SortedSkipList[tuple[int, int]](key=lambda x: x[0], seed=254)
+    expected: list[tuple[int, int]] = []
+
+    for n in range(500):
+        if expected and rng.random() < 0.3:
+            element = rng.choice(expected)
+            slist.remove(element)
+            expected.remove(element)
+        else:
+            element = (rng.randrange(50), n)
+            slist.add(element)
+            expected.append(element)
+            expected.sort(key=lambda x: x[0])
+
+        assert slist.size == len(expected)
+        assert slist.first() == (expected[0] if expected else None)
+        assert slist.last() == (expected[-1] if expected else None)
+
+    assert list(slist) == expected
+    assert list(slist.irange(10, 20)) == [x for x in expected if 10 <= x[0] < 20]
+    assert list(slist.irange(hi=5)) == [x for x in expected if x[0] < 5]
+    assert list(slist.irange(lo=45)) == [x for x in expected if x[0] >= 45]
+    for element in expected:
+        assert element in slist
+        assert slist.find(element[0]) == next(x for x in expected if x[0] == element[0])
+
+    assert (999, 0) not in slist
+    with pytest.raises(ValueError):
+        slist.remove((999, 0))
+
+
+def test_skiplist_positions() -> None:
+    rng = random.Random(254)
+    slist = SortedSkipList[tuple[int, int]](key=lambda x: x[0], seed=254)
+    expected: list[tuple[int, int]] = []
+
+    for n in range(1000):
+        op = rng.randrange(4)
+        if op == 0 and expected:
+            i = rng.randrange(-len(expected), len(expected))
+            assert slist.pop(i) == expected.pop(i)
+        elif op == 1 and expected:
+            element = rng.choice(expected)
+            slist.remove(element)
+            expected.remove(element)
+        else:
+            element = (rng.randrange(30), n)
+            slist.add(element)
+            expected.append(element)
+            expected.sort(key=lambda x: x[0])
+
+        if expected:
+            i = rng.randrange(len(expected))
+            assert slist[i] == expected[i] and slist[-i - 1] == expected[-i - 1]
+            assert slist.index(expected[i]) == i
+        k = rng.randrange(-1, 32)
+        assert slist.bisect_left(k) == sum(x[0] < k for x in expected)
+        assert slist.bisect_right(k) == sum(x[0] <= k for x in expected)
+        assert slist.last() == (expected[-1] if expected else None)
+
+    assert list(slist) == expected
+    with pytest.raises(IndexError):
+        slist[len(expected)]
+    with pytest.raises(ValueError):
+        slist.index((999, 0))
+    while expected:
+        assert slist.pop() == expected.pop()
+    with pytest.raises(IndexError):
+        slist.pop()
+
+
+@pytest.mark.parametrize("cls", [SinglyLinkedList, CircularlyLinkedList])
+def test_splice_and_split(cls: type) -> None:
+    L = cls.from_iterable(range(3))
+    M = cls.from_iterable(range(3, 6))
+    L.splice(M)
+    assert list(L) == [0, 1, 2, 3, 4, 5]
+    assert L.size == 6
+    assert M.is_empty()
+    assert list(M) == []
+    assert M.first() is None
+
+    M.splice(L)
+    assert list(M) == [0, 1, 2, 3, 4, 5]
+    assert L.is_empty()
+    L, M = M, L
+    with pytest.raises(ValueError):
+        L.splice(L)
+
+    R = L.split_at(4)
+    assert list(L) == [0, 1, 2, 3]
+    assert list(R) == [4, 5]
+    assert (L.size, R.size) == (4, 2)
+    assert (L.last(), R.first(), R.last()) == (3, 4, 5)
+
+    assert L.split_at(4).is_empty()
+    R.splice(L.split_at(0))
+    assert L.is_empty()
+    assert list(R) == [4, 5, 0, 1, 2, 3]
+
+    node = R.tail.next if cls is CircularlyLinkedList else R.head
+    S = R.split_after(node)
+    assert list(R) == [4]
+    assert list(S) == [5, 0, 1, 2, 3]
+    assert (R.size, S.size) == (1, 5)
+
+    S.add_last(6)
+    R.add_last(7)
+    assert list(S) == [5, 0, 1, 2, 3, 6]
+    assert list(R) == [4, 7]
+
+    with pytest.raises(IndexError):
+        R.split_at(3)
+
+
+def list_nodes(L: Any) -> list[Any]:
+    node: Any = L.head if isinstance(L, SinglyLinkedList) else L.tail.next
+    nodes = []
+    for _ in range(L.size):
+        nodes.append(node)
+        node = node.next
+    return nodes
+
+
+@pytest.mark.parametrize("cls", [SinglyLinkedList, CircularlyLinkedList])
+def test_split_after_foreign_node(cls: type) -> None:
+    L = cls.from_iterable(range(4))
+    M = cls.from_iterable(range(10, 13))
+    for node in list_nodes(M):
+        with pytest.raises(ValueError):
+            L.split_after(node)
+    with pytest.raises(ValueError):
+        cls().split_after(list_nodes(M)[0])
+
+    assert list(L) == [0, 1, 2, 3] and L.size == 4
+    assert list(M) == [10, 11, 12] and M.size == 3
+    assert L.last() == 3 and M.last() == 12
+
+    assert L.split_after(list_nodes(L)[-1]).is_empty()
+    assert list(L.split_after(list_nodes(L)[1])) == [2, 3]
+    assert list(L) == [0, 1] and L.last() == 1
+
+
+def test_slist_cursor_edits() -> None:
+    slist = SinglyLinkedList.from_iterable(range(6))
+    cursor = slist.cursor()
+    while not cursor.at_end():
+        if cursor.element % 2 == 0:
+            cursor.insert_before(-cursor.element)
+            cursor.remove_current()
+        else:
+            cursor.insert_after(cursor.element * 10)
+            cursor.advance()
+            cursor.advance()
+
+    cursor.insert_before(99)
+    assert list(slist) == [0, 1, 10, -2, 3, 30, -4, 5, 50, 99]
+    assert slist.size == 10
+    assert (slist.first(), slist.last()) == (0, 99)
+
+    with pytest.raises(IndexError):
+        cursor.remove_current()
+
+
+def test_slist_cursor_swap() -> None:
+    rng = random.Random(254)
+    for _ in range(200):
+        n = rng.randint(1, 6)
+        slist = SinglyLinkedList.from_iterable(range(n))
+        expected = list(range(n))
+        i, j = rng.randrange(n), rng.randrange(n)
+
+        a, b = slist.cursor(), slist.cursor()
+        for _ in range(i):
+            a.advance()
+        for _ in range(j):
+            b.advance()
+
+        a.swap_with(b)
+        expected[i], expected[j] = expected[j], expected[i]
+        assert list(slist) == expected
+        assert (slist.first(), slist.last()) == (expected[0], expected[-1])
+        assert (a.element, b.element) == (expected[i], expected[j])
+
+        # Both cursors should still be usable afterwards
+        a.insert_before(-1)
+        expected.insert(i, -1)
+        assert list(slist) == expected
+
+
+def test_clist_rotate() -> None:
+    clist = CircularlyLinkedList.from_iterable(range(5))
+    clist.rotate()
+    assert list(clist) == [1, 2, 3, 4, 0]
+    clist.rotate(3)
+    assert list(clist) == [4, 0, 1, 2, 3]
+    clist.rotate(-1)
+    assert list(clist) == [3, 4, 0, 1, 2]
+    clist.rotate(5 * 1000 + 2)
+    assert list(clist) == [0, 1, 2, 3, 4]
+    assert (clist.first(), clist.last()) == (0, 4)
+
+    empty = CircularlyLinkedList[int]()
+    empty.rotate(3)
+    assert empty.is_empty()
+
+
+@pytest.mark.parametrize(
+    "cls", [SinglyLinkedList, DoublyLinkedList, CircularlyLinkedList]
+)
+def test_copy(cls: type) -> None:
+    assert list(copy.copy(cls())) == []
+
+    L = cls.from_iterable([[1], [2], [3]])
+    shallow = copy.copy(L)
+    deep = copy.deepcopy(L)
+    assert type(shallow) is type(deep) is cls
+    assert list(shallow) == list(deep) == list(L)
+    assert shallow.size == deep.size == 3
+
+    L.first().append(9)
+    L.add_last([4])
+    assert list(shallow) == [[1, 9], [2], [3]]
+    assert list(deep) == [[1], [2], [3]]
+    assert shallow.last() == [3]
+
+    shallow.add_last([5])
+    shallow.add_first([0])
+    assert L.size == 4
+    assert list(shallow) == [[0], [1, 9], [2], [3], [5]]
+
+
+@pytest.mark.parametrize("cls", [SinglyLinkedList, DoublyLinkedList])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sort_calls_key_once_per_element(cls: type, reverse: bool) -> None:
+    calls: list[int] = []
+
+    def key(x: int) -> int:
+        calls.append(x)
+        return x % 7
+
+    rng = random.Random(254)
+    elements = [rng.randrange(1000) for _ in range(500)]
+    expected = sorted(elements, key=lambda x: x % 7, reverse=reverse)
+    L = cls.from_iterable(elements)
+    L.sort(key=key, reverse=reverse)
+    assert list(L) == expected
+    assert sorted(calls) == sorted(elements)
+
+    others = sorted(range(300), key=lambda x: x % 7, reverse=reverse)
+    expected = sorted(expected + others, key=lambda x: x % 7, reverse=reverse)
+    calls.clear()
+    L.merge_sorted(cls.from_iterable(others), key=key, reverse=reverse)
+    assert list(L) == expected
+    assert len(calls) == 800
+
+
+@pytest.mark.parametrize("cls", [SinglyLinkedList, DoublyLinkedList])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sort_is_stable(cls: type, reverse: bool) -> None:
+    rng = random.Random(254)
+    cases = [
+        [],
+        [(1, 0)],
+        [(i, i) for i in range(50)],
+        [(-i, i) for i in range(50)],
+        [(rng.randrange(10), i) for i in range(500)],
+    ]
+    for pairs in cases:
+        L = cls.from_iterable(pairs)
+        L.sort(key=lambda p: p[0], reverse=reverse)
+        expected = sorted(pairs, key=lambda p: p[0], reverse=reverse)
+        assert list(L) == expected
+        assert L.size == len(pairs)
+        assert L.last() == (expected[-1] if expected else None)
+        if cls is DoublyLinkedList:
+            assert list(reversed(L)) == expected[::-1]
+            if expected:
+                assert L[len(expected) // 2] == expected[len(expected) // 2]
+
+    L = cls.from_iterable([[3], [1], [2]])
+    three = L.first()
+    L.sort()
+    assert list(L) == [[1], [2], [3]]
+    assert L.last() is three
+
+
+@pytest.mark.parametrize("cls", [SinglyLinkedList, DoublyLinkedList])
+def test_merge_sorted(cls: type) -> None:
+    a = cls.from_iterable([(1, "a"), (3, "a"), (3, "a"), (7, "a")])
+    b = cls.from_iterable([(0, "b"), (3, "b"), (8, "b")])
+    a.merge_sorted(b, key=lambda p: p[0])
+    assert [p[1] for p in a] == ["b", "a", "a", "a", "b", "a", "b"]
+    assert [p[0] for p in a] == [0, 1, 3, 3, 3, 7, 8]
+    assert a.size == 7 and a.last() == (8, "b")
+    assert b.is_empty() and list(b) == []
+
+    a.add_last((9, "a"))
+    assert a.last() == (9, "a")
+
+    c = cls.from_iterable([5, 2])
+    c.merge_sorted(cls.from_iterable([4, 3, 1]), reverse=True)
+    assert list(c) == [5, 4, 3, 2, 1]
+    assert c.last() == 1
+
+    empty = cls()
+    empty.merge_sorted(c)
+    assert list(empty) == [5, 4, 3, 2, 1] and c.is_empty()
+    with pytest.raises(ValueError):
+        empty.merge_sorted(empty)
@@ -0,0 +1,66 @@
+import pytest
+
+from comp254 import LinkedHashMap, LinkedHashSet
+
+
+def test_linked_hash_map() -> None:
+    m = LinkedHashMap[str, int]([("a", 1), ("b", 2), ("c", 3)])
+    assert list(m) == ["a", "b", "c"]
+    assert list(reversed(m)) == ["c", "b", "a"]
+    assert dict(m) == {"a": 1, "b": 2, "c": 3}
+
+    m["b"] = 20  # reassigning keeps the key's position
+    m["d"] = 4
+    assert list(m.items()) == [("a", 1), ("b", 20), ("c", 3), ("d", 4)]
+
+    m.move_to_end("a")
+    m.move_to_end("a")
+    m.move_to_front("c")
+    m.move_to_front("c")
+    assert list(m) == ["c", "b", "d", "a"]
+    assert list(reversed(m)) == ["a", "d", "b", "c"]
+
+    assert m.remove("b") == 20
+    del m["d"]
+    assert "b" not in m and "d" not in m
+    assert list(m) == ["c", "a"] and len(m) == 2
+    with pytest.raises(KeyError):
+        m.remove("b")
+    with pytest.raises(KeyError):
+        m.move_to_end("b")
+
+    assert m.popitem(last=False) == ("c", 3)
+    assert m.popitem() == ("a", 1)
+    with pytest.raises(KeyError):
+        m.popitem()
+
+    m.update(x=1, y=2)
+    assert m.pop("x") == 1
+    m.clear()
+    assert len(m) == 0 and list(m) == []
+
+
+def test_linked_hash_set() -> None:
+    s = LinkedHashSet([3, 1, 3, 2, 1])
+    assert list(s) == [3, 1, 2]
+    assert s == {1, 2, 3}
+
+    s.add(3)
+    s.add(4)
+    s.move_to_front(2)
+    s.move_to_end(3)
+    assert list(s) == [2, 1, 4, 3]
+    assert list(reversed(s)) == [3, 4, 1, 2]
+
+    s.discard(1)
+    s.discard(99)
+    s.remove(4)
+    with pytest.raises(KeyError):
+        s.remove(4)
+    assert list(s) == [2, 3]
+
+    assert list(s | LinkedHashSet([5, 2])) == [2, 3, 5]
+    assert s.pop() == 2
+    assert s.pop(last=True) == 3
+    with pytest.raises(KeyError):
+        s.pop()
@@ -0,0 +1,50 @@
+import pytest
+
+from comp254 import (
+    array_max,
+    array_mean,
+    array_min,
+    array_sum,
+    CircularlyLinkedList,
+    DoublyLinkedList,
+    prefix_sums,
+    SinglyLinkedList,
+)
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize(
+    "cls", [SinglyLinkedList, DoublyLinkedList, CircularlyLinkedList]
+)
+def test_numpy_round_trip(cls: type) -> None:
+    L = cls.from_numpy(np.arange(5))
+    assert list(L) == [0, 1, 2, 3, 4]
+    assert all(type(x) is int for x in L)
+
+    array = L.to_numpy()
+    assert array.dtype.kind == "i"
+    assert array.tolist() == [0, 1, 2, 3, 4]
+    assert L.to_numpy(np.float32).dtype == np.float32
+
+    assert cls().to_numpy(float).shape == (0,)
+    assert cls.from_numpy(np.array([])).is_empty()
+
+
+@pytest.mark.parametrize(
+    "cls", [SinglyLinkedList, DoublyLinkedList, CircularlyLinkedList]
+)
+def test_reductions(cls: type) -> None:
+    L = cls.from_iterable([3, 1, 4, 1, 5])
+    assert array_sum(L) == 14 and type(array_sum(L)) is int
+    assert array_min(L) == 1
+    assert array_max(L) == 5
+    assert array_mean(L) == pytest.approx(2.8)
+    assert prefix_sums(L).tolist() == [3, 4, 8, 9, 14]
+    assert prefix_sums(L, float).dtype == np.float64
+
+    empty = cls()
+    assert array_sum(empty, float) == 0
+    for reduce in (array_min, array_max, array_mean):
+        with pytest.raises(ValueError):
+            reduce(empty, float)
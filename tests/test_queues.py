@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from comp254 import LinkedLifoQueue, LinkedQueue, RoundRobinQueue
+
+
+def test_linked_queue_order() -> None:
+    fifo = LinkedQueue[int]()
+    lifo = LinkedLifoQueue[int]()
+    for queue in (fifo, lifo):
+        queue.put_many_nowait(range(5))
+        assert queue.qsize() == 5
+
+    assert fifo.get_many_nowait(10) == [0, 1, 2, 3, 4]
+    assert lifo.get_many_nowait(10) == [4, 3, 2, 1, 0]
+    assert fifo.empty() and lifo.empty()
+
+
+def test_linked_queue_backpressure() -> None:
+    async def run() -> list[list[int]]:
+        queue = LinkedQueue[int](maxsize=3)
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_many_nowait(range(4))
+        assert queue.empty()
+
+        async def produce() -> None:
+            for i in range(10):
+                await queue.put(i)
+                assert queue.qsize() <= 3
+
+        producer = asyncio.create_task(produce())
+        batches = []
+        while sum(map(len, batches)) < 10:
+            batches.append(await queue.get_many(4))
+        await producer
+        return batches
+
+    batches = asyncio.run(run())
+    assert [x for batch in batches for x in batch] == list(range(10))
+    assert all(1 <= len(batch) <= 3 for batch in batches)
+
+
+def test_round_robin_queue() -> None:
+    queue = RoundRobinQueue[str, int]()
+    queue.put_many_nowait([("a", 1), ("a", 2), ("a", 3), ("b", 1), ("c", 1)])
+    assert queue.get_many_nowait(3) == [("a", 1), ("b", 1), ("c", 1)]
+
+    queue.put_nowait(("b", 2))
+    assert queue.qsize() == 3
+    assert queue.get_many_nowait(5) == [("a", 2), ("b", 2), ("a", 3)]
+    assert queue.empty()
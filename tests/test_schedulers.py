@@ -0,0 +1,47 @@
+import pytest
+
+from comp254 import WeightedRoundRobin
+
+
+def expand(grants: list[tuple[str, int]]) -> str:
+    return "".join(tenant * turns for tenant, turns in grants)
+
+
+def test_weighted_round_robin() -> None:
+    scheduler = WeightedRoundRobin[str]()
+    assert scheduler.next_batch(5) == []
+
+    scheduler.add("a", 3)
+    scheduler.add("b", 1)
+    scheduler.add("c", 2)
+    with pytest.raises(ValueError):
+        scheduler.add("a")
+    with pytest.raises(ValueError):
+        scheduler.add("d", 0)
+
+    assert expand(scheduler.next_batch(4)) == "aaab"
+    assert expand(scheduler.next_batch(3)) == "cca"
+    assert scheduler.next_batch(8) == [("a", 2), ("b", 1), ("c", 2), ("a", 3)]
+
+
+def test_weighted_round_robin_changes() -> None:
+    scheduler = WeightedRoundRobin[str]()
+    for tenant in "abc":
+        scheduler.add(tenant, 2)
+
+    assert expand(scheduler.next_batch(1)) == "a"
+    scheduler.remove("a")
+    assert expand(scheduler.next_batch(4)) == "bbcc"
+
+    scheduler.add("a", 1)
+    scheduler.set_weight("b", 3)
+    assert expand(scheduler.next_batch(6)) == "bbbcca"
+    assert scheduler.size == 3
+
+    scheduler.skip(2)
+    assert expand(scheduler.next_batch(4)) == "abbb"
+
+    for tenant in "abc":
+        scheduler.remove(tenant)
+    assert scheduler.is_empty()
+    assert scheduler.next_batch(4) == []
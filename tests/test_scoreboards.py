@@ -0,0 +1,337 @@
+import copy
+import multiprocessing
+import pickle
+import random
+import time
+
+import pytest
+
+from comp254 import (
+    ColumnarScoreboard,
+    GameEntry,
+    HeapScoreboard,
+    Scoreboard,
+    ShardedScoreboard,
+)
+
+
+@pytest.mark.parametrize("cls", [HeapScoreboard, ColumnarScoreboard])
+@pytest.mark.parametrize("capacity", [1, 2, 5, 17])
+def test_matches_scoreboard(cls: type, capacity: int) -> None:
+    rng = random.Random(capacity)
+    expected = Scoreboard(capacity)
+    actual = cls(capacity)
+
+    for i in range(500):
+        if expected.num_entries > 0 and rng.random() < 0.2:
+            j = rng.randrange(expected.num_entries)
+            assert actual.remove(j) == expected.remove(j)
+        else:
+            # A narrow score range forces plenty of ties
+            entry = GameEntry(f"P{i}", rng.randrange(20))
+            expected.add(entry)
+            actual.add(entry)
+
+        assert actual.num_entries == expected.num_entries
+        assert actual.board == expected.board
+        assert str(actual) == str(expected)
+
+
+@pytest.mark.parametrize("cls", [HeapScoreboard, ColumnarScoreboard])
+def test_alternate_board_remove_bounds(cls: type) -> None:
+    board = cls(3)
+    board.add(GameEntry("Rob", 750))
+    with pytest.raises(IndexError):
+        board.remove(1)
+    with pytest.raises(IndexError):
+        board.remove(-1)
+    assert board.remove(0) == GameEntry("Rob", 750)
+    assert str(board) == "[None, None, None]"
+
+    empty = cls(0)
+    empty.add(GameEntry("Rob", 750))
+    assert empty.num_entries == 0 and str(empty) == "[]"
+
+
+@pytest.mark.parametrize("cls", [Scoreboard, HeapScoreboard, ColumnarScoreboard])
+@pytest.mark.parametrize("capacity", [0, 1, 3, 10])
+def test_add_many_matches_add(cls: type, capacity: int) -> None:
+    rng = random.Random(capacity)
+    expected = cls(capacity)
+    actual = cls(capacity)
+    for batch in range(5):
+        entries = [GameEntry(f"P{batch}-{i}", rng.randrange(8)) for i in range(20)]
+        for entry in entries:
+            if capacity > 0:
+                expected.add(entry)
+        actual.add_many(iter(entries))
+        assert str(actual) == str(expected)
+        assert actual.num_entries == expected.num_entries
+
+    streamed = cls.from_stream(3, (GameEntry("P", i % 7) for i in range(10_000)))
+    assert str(streamed) == "[P:6, P:6, P:6]"
+
+
+@pytest.mark.parametrize("cls", [Scoreboard, ColumnarScoreboard])
+def test_rank_queries(cls: type) -> None:
+    rng = random.Random(254)
+    scoreboard = cls(50)
+    with pytest.raises(ValueError):
+        scoreboard.percentile(50)
+    assert scoreboard.rank_of(10) == 0
+
+    for i in range(80):
+        scoreboard.add(GameEntry(f"P{i}", rng.randrange(30)))
+        scores = [e.score for e in scoreboard.board if e is not None]
+        ascending = sorted(scores)
+        n = len(scores)
+
+        for x in range(-1, 32):
+            assert scoreboard.rank_of(x) == sum(s >= x for s in scores)
+            assert scoreboard.count_between(x, x + 5) == sum(
+                x <= s < x + 5 for s in scores
+            )
+        assert [scoreboard.score_at_rank(k) for k in range(n)] == scores
+        for p in (0, 1, 25, 50, 90, 99, 100):
+            k = max(-(-p * n // 100), 1)
+            assert scoreboard.percentile(p) == ascending[k - 1]
+
+    # A new entry lands at rank_of() its score
+    score = scoreboard.score_at_rank(10)
+    rank = scoreboard.rank_of(score)
+    scoreboard.add(GameEntry("New", score))
+    assert scoreboard.board[rank] == GameEntry("New", score)
+
+    assert scoreboard.count_between(20, 10) == 0
+    with pytest.raises(IndexError):
+        scoreboard.score_at_rank(50)
+    with pytest.raises(ValueError):
+        scoreboard.percentile(101)
+
+
+def check_players(scoreboard: Scoreboard) -> None:
+    on_board: dict[str, list[GameEntry]] = {}
+    for entry in scoreboard.board[: scoreboard.num_entries]:
+        assert entry is not None
+        on_board.setdefault(entry.name, []).append(entry)
+
+    # The player index holds the same entries, grouped by name in rank order
+    by_name = [item[-1] for item in scoreboard.players]
+    assert by_name == [entry for name in sorted(on_board) for entry in on_board[name]]
+    assert scoreboard.players.size == scoreboard.entries.size
+    for name, entries in on_board.items():
+        assert scoreboard.get(name) == entries[0]
+
+
+def test_remove_bounds() -> None:
+    scoreboard = Scoreboard(3)
+    scoreboard.add(GameEntry("Rob", 750))
+    with pytest.raises(IndexError):
+        scoreboard.remove(1)
+    assert scoreboard.remove(0) == GameEntry("Rob", 750)
+    assert str(scoreboard) == "[None, None, None]"
+    check_players(scoreboard)
+
+
+def test_player_index() -> None:
+    rng = random.Random(254)
+    scoreboard = Scoreboard(20)
+    names = [f"P{i}" for i in range(10)]
+    for _ in range(500):
+        name = rng.choice(names)
+        action = rng.random()
+        if action < 0.6:
+            scoreboard.add(GameEntry(name, rng.randrange(50)))
+        elif action < 0.8 and scoreboard.get(name) is not None:
+            scoreboard.update_score(name, rng.randrange(50))
+        elif action < 0.9 and scoreboard.get(name) is not None:
+            removed = scoreboard.remove_player(name)
+            assert removed and all(e.name == name for e in removed)
+        elif scoreboard.num_entries > 0:
+            scoreboard.remove(rng.randrange(scoreboard.num_entries))
+        check_players(scoreboard)
+
+    assert scoreboard.get("nobody") is None
+    with pytest.raises(KeyError):
+        scoreboard.remove_player("nobody")
+    with pytest.raises(KeyError):
+        scoreboard.update_score("nobody", 1)
+
+    scoreboard.add_many(
+        GameEntry(rng.choice(names), rng.randrange(50)) for _ in range(50)
+    )
+    check_players(scoreboard)
+
+
+@pytest.mark.parametrize("policy", ["duplicates", "best"])
+def test_large_board_round_trips(policy: str) -> None:
+    rng = random.Random(254)
+    scoreboard = Scoreboard(5_000, policy)  # type: ignore
+    scoreboard.add_many(
+        GameEntry(f"P{rng.randrange(8_000)}", rng.randrange(10**6))
+        for _ in range(20_000)
+    )
+    assert scoreboard.num_entries > 4_000
+
+    for copied in (pickle.loads(pickle.dumps(scoreboard)), copy.deepcopy(scoreboard)):
+        assert copied.board == scoreboard.board
+        assert (copied.capacity, copied.policy) == (scoreboard.capacity, policy)
+        check_players(copied)
+        # Ties with existing entries still rank after them
+        score = scoreboard.score_at_rank(100)
+        copied.add(GameEntry("New", score))
+        assert copied.board[copied.rank_of(score) - 1] == GameEntry("New", score)
+
+
+def test_uniqueness_policies() -> None:
+    entries = [
+        GameEntry("Rob", 500),
+        GameEntry("Ann", 600),
+        GameEntry("Rob", 700),
+        GameEntry("Rob", 400),
+        GameEntry("Bob", 100),
+    ]
+
+    duplicates = Scoreboard.from_stream(4, entries)
+    assert str(duplicates) == "[Rob:700, Ann:600, Rob:500, Rob:400]"
+
+    best = Scoreboard(4, "best")
+    best.add_many(entries)
+    assert str(best) == "[Rob:700, Ann:600, Bob:100, None]"
+
+    latest = Scoreboard(4, "latest")
+    latest.add_many(entries)
+    assert str(latest) == "[Ann:600, Rob:400, Bob:100, None]"
+
+    latest.update_score("Bob", 650)
+    assert str(latest) == "[Bob:650, Ann:600, Rob:400, None]"
+    assert latest.remove_player("Ann") == [GameEntry("Ann", 600)]
+    assert str(latest) == "[Bob:650, Rob:400, None, None]"
+    for scoreboard in (duplicates, best, latest):
+        check_players(scoreboard)
+
+    with pytest.raises(ValueError):
+        Scoreboard(4, "unique")  # type: ignore
+
+
+def test_columnar_scoreboard_columns() -> None:
+    board = ColumnarScoreboard(3)
+    for name, score in [("Rob", 750), ("Mike", 1105), ("Rob", 590), ("Jill", 740)]:
+        board.add(GameEntry(name, score))
+
+    assert list(board.scores) == [1105, 750, 740]
+    assert [board.names[i] for i in board.name_ids] == ["Mike", "Rob", "Jill"]
+    assert board.names == ["Rob", "Mike", "Jill"]  # each name is stored once
+    assert board[2] == GameEntry("Jill", 740)
+    assert board.rank_of(750) == 2
+    with pytest.raises(IndexError):
+        board[3]
+
+    # Names of entries that never make the board aren't kept
+    board.add_many(GameEntry(f"Low{i}", i % 700) for i in range(10_000))
+    assert len(board.names) == 3
+
+
+def test_columnar_scoreboard_drops_old_names() -> None:
+    board = ColumnarScoreboard(10)
+    for i in range(50_000):
+        board.add(GameEntry(f"P{i}", i))
+        assert len(board.names) <= 2 * board.num_entries
+    assert board.num_entries == 10
+    assert [e.name for e in board] == [f"P{i}" for i in range(49_999, 49_989, -1)]
+    assert board.name_index == {name: i for i, name in enumerate(board.names)}
+
+    streamed = ColumnarScoreboard.from_stream(
+        100, (GameEntry(f"P{i}", i % 1_009) for i in range(300_000))
+    )
+    assert len(streamed.names) <= 200
+    assert [e.score for e in streamed] == [1_008] * 100
+
+    while streamed.num_entries > 1:
+        streamed.remove(0)
+        assert len(streamed.names) <= 2 * streamed.num_entries
+    assert list(streamed) == [GameEntry(f"P{1_008 + 99 * 1_009}", 1_008)]
+
+
+def test_columnar_scoreboard_to_numpy() -> None:
+    np = pytest.importorskip("numpy")
+    board = ColumnarScoreboard.from_stream(4, (GameEntry("P", s) for s in range(10)))
+    scores = board.to_numpy()
+    assert scores.dtype == np.int64 and scores.tolist() == [9, 8, 7, 6]
+
+    board.add(GameEntry("P", 20))  # the copy doesn't pin the array's buffer
+    assert scores.tolist() == [9, 8, 7, 6]
+
+
+def scores(scoreboard: Scoreboard) -> list[int]:
+    return [entry.score for entry in scoreboard.board if entry is not None]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_sharded_scoreboard_matches_scores(workers: int) -> None:
+    rng = random.Random(workers)
+    expected = Scoreboard(25)
+    with ShardedScoreboard(25, workers) as sharded:
+        assert sharded.merge().num_entries == 0
+        for batch in range(4):
+            entries = [
+                GameEntry(f"P{batch}-{i}", rng.randrange(10**6)) for i in range(20_000)
+            ]
+            expected.add_many(entries)
+            sharded.add_many(entries)
+            sharded.add(GameEntry("Solo", 10**6 + batch))  # stays pending
+            expected.add(GameEntry("Solo", 10**6 + batch))
+
+            merged = sharded.merge()
+            assert merged.board == sharded.board
+            # Ties from different shards may be ordered differently
+            assert scores(merged) == scores(expected)
+
+
+def test_sharded_scoreboard_merges_on_a_timer() -> None:
+    with ShardedScoreboard(3, workers=2, merge_interval=0.01) as sharded:
+        sharded.add_many(GameEntry("P", i) for i in range(10))
+        sharded.flush()
+
+        deadline = time.monotonic() + 10
+        while sharded.num_entries < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert str(sharded) == "[P:9, P:8, P:7]"
+
+    for workers in (0, -1):
+        with pytest.raises(ValueError):
+            ShardedScoreboard(3, workers=workers)
+
+
+def test_sharded_scoreboard_cleans_up_failed_start(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    started: list[multiprocessing.Process] = []
+    start = multiprocessing.Process.start
+
+    def start_twice(process: multiprocessing.Process) -> None:
+        if len(started) == 2:
+            raise OSError("no more processes")
+        start(process)
+        started.append(process)
+
+    monkeypatch.setattr(multiprocessing.Process, "start", start_twice)
+    with pytest.raises(OSError):
+        ShardedScoreboard(3, workers=4)
+    assert len(started) == 2
+    assert not any(process.is_alive() for process in started)
+
+
+def test_sharded_scoreboard_reports_merge_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail(self: ShardedScoreboard) -> None:
+        raise OSError("shard went away")
+
+    monkeypatch.setattr(ShardedScoreboard, "_merge_shards", fail)
+    sharded = ShardedScoreboard(3, workers=1, merge_interval=0.01)
+    assert sharded.merge_thread is not None
+    sharded.merge_thread.join(10)
+    with pytest.raises(RuntimeError) as excinfo:
+        sharded.close()
+    assert isinstance(excinfo.value.__cause__, OSError)
@@ -0,0 +1,109 @@
+import copy
+import pickle
+
+import pytest
+
+from comp254 import (
+    CircularlyLinkedList,
+    DoublyLinkedList,
+    SinglyLinkedList,
+    SortedSkipList,
+    dump_elements,
+    load_elements,
+)
+
+
+@pytest.mark.parametrize(
+    "cls", [SinglyLinkedList, DoublyLinkedList, CircularlyLinkedList]
+)
+def test_pickle_long_list(cls: type) -> None:
+    L = cls.from_iterable(range(100_000))
+    M = pickle.loads(pickle.dumps(L))
+    assert type(M) is cls
+    assert M.size == L.size
+    assert list(M) == list(L)
+
+    M.add_last(-1)
+    assert M.last() == -1
+
+
+def test_pickle_long_skiplist() -> None:
+    # Equal keys have to come back in the same order
+    pairs = [(i % 100, i) for i in range(10_000)]
+    seeded = SortedSkipList[tuple[int, int]](seed=254)
+    for pair in pairs:
+        seeded.add(pair)
+    for L in (SortedSkipList.from_iterable(pairs), seeded):
+        for M in (pickle.loads(pickle.dumps(L)), copy.deepcopy(L)):
+            assert list(M) == list(L) and M.size == L.size
+            assert M[5_000] == L[5_000]
+            M.add((-1, -1))
+            assert M.first() == (-1, -1) and L.first() == (0, 0)
+
+
+class NamedSinglyLinkedList(SinglyLinkedList):
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+
+
+class NamedDoublyLinkedList(DoublyLinkedList):
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+
+
+class NamedCircularlyLinkedList(CircularlyLinkedList):
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+
+
+@pytest.mark.parametrize(
+    "cls", [NamedSinglyLinkedList, NamedDoublyLinkedList, NamedCircularlyLinkedList]
+)
+def test_pickle_and_copy_keep_attributes(cls: type) -> None:
+    # The subclasses need a name to be constructed, and validate is set on
+    # the instance, so neither survives being rebuilt through __init__()
+    L = cls("scores")
+    L.extend([[1], [2], [3]])
+    L.validate = True
+    for M in (pickle.loads(pickle.dumps(L)), copy.copy(L), copy.deepcopy(L)):
+        assert type(M) is cls
+        assert (M.name, M.validate) == ("scores", True)
+        assert list(M) == [[1], [2], [3]] and M.size == 3
+        M.add_last([4])
+        assert list(L) == [[1], [2], [3]]
+
+
+@pytest.mark.parametrize(
+    "elements",
+    [
+        [],
+        [0, -1, 2**63 - 1, -(2**63)],
+        [0.5, -1.25, float("inf")],
+        ["", "abc", "naïve", "日本語"],
+    ],
+)
+def test_dump_and_load_elements(elements: list) -> None:
+    L = DoublyLinkedList.from_iterable(elements)
+    data = dump_elements(L)
+    assert load_elements(data) == elements
+    assert list(SinglyLinkedList.from_iterable(load_elements(data))) == elements
+
+
+def test_dump_elements_rejects_mixed_types() -> None:
+    with pytest.raises(TypeError):
+        dump_elements([1, "2"])
+    with pytest.raises(TypeError):
+        dump_elements([True])
+    with pytest.raises(ValueError):
+        load_elements(b"nope" + bytes(9))
+
+
+@pytest.mark.parametrize("elements", [[1, 2, 3], [1.5, 2.5], ["ab", "cde"]])
+def test_load_elements_rejects_truncated_data(elements: list) -> None:
+    data = dump_elements(elements)
+    for n in range(len(data)):
+        with pytest.raises(ValueError):
+            load_elements(data[:n])